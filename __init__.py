@@ -1,38 +1,47 @@
 """
 File Sync App modülleri
+
+Alt modüller ilk erişimde yüklenir; böylece FileSync veya komut satırı
+arayüzü kullanıldığında tkinter/tkcalendar içe aktarılmaz.
 """
 
-from .sync_config import SyncConfig
-from .sync_stats import SyncStats
-from .exceptions import SyncError, ValidationError, FileOperationError, ConfigError
-from .file_sync import FileSync
-from .notification_service import EmailConfig, EmailNotificationService
-from .gui_components import (
-    PathSelector, ConfigEntry, DateFilterFrame,
-    StatusBar, AboutDialog, ControlButtons,
-    EmailSettingsDialog
-)
-from .main_gui import SyncGUI
+import importlib
 
 __version__ = '2.1.0'
 __author__ = 'Önder AKÖZ'
 
-__all__ = [
-    'SyncConfig',
-    'SyncStats',
-    'SyncError',
-    'ValidationError',
-    'FileOperationError',
-    'ConfigError',
-    'FileSync',
-    'EmailConfig',
-    'EmailNotificationService',
-    'PathSelector',
-    'ConfigEntry',
-    'DateFilterFrame',
-    'StatusBar',
-    'AboutDialog',
-    'ControlButtons',
-    'EmailSettingsDialog',
-    'SyncGUI'
-]
\ No newline at end of file
+# Dışa açılan isim -> tanımlandığı alt modül
+_LAZY_IMPORTS = {
+    'SyncConfig': 'sync_config',
+    'SyncStats': 'sync_stats',
+    'SyncError': 'exceptions',
+    'ValidationError': 'exceptions',
+    'FileOperationError': 'exceptions',
+    'ConfigError': 'exceptions',
+    'FileSync': 'file_sync',
+    'EmailConfig': 'notification_service',
+    'EmailNotificationService': 'notification_service',
+    'PathSelector': 'gui_components',
+    'ConfigEntry': 'gui_components',
+    'DateFilterFrame': 'gui_components',
+    'StatusBar': 'gui_components',
+    'AboutDialog': 'gui_components',
+    'ControlButtons': 'gui_components',
+    'EmailSettingsDialog': 'gui_components',
+    'SyncGUI': 'main_gui',
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,126 @@
+"""
+GUI olay döngüsü gecikmesi ölçümü
+
+Sentetik yüksek hızlı bir senkronizasyonu taklit eden işçi thread'leri saniyede
+binlerce ilerleme bildirimi üretirken, Tk ana döngüsüne sabit aralıklı bir
+yoklama zamanlayıcısı kurulur ve zamanlayıcının ne kadar geç çalıştığı ölçülür.
+
+    legacy     : her bildirim için root.after(0, ...) + update_idletasks()
+    aggregated : ProgressAggregator ile 10 Hz birleştirilmiş güncelleme
+
+Kullanım (depo kökünden, görüntü sunucusu gerekir):
+    python -m benchmarks.bench_gui_latency --workers 8 --rate 1000 --duration 5
+"""
+
+import time
+import argparse
+import threading
+import tkinter as tk
+from typing import Dict, List
+
+from src.gui_components import StatusBar
+from src.progress import ProgressAggregator
+
+PROBE_INTERVAL_MS = 20
+
+
+def _percentile(values: List[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(mode: str, workers: int, rate: float, duration: float) -> Dict[str, float]:
+    """Tek bir modu çalıştır ve gecikme istatistiklerini döndür"""
+    root = tk.Tk()
+    status_bar = StatusBar(root)
+    status_bar.pack(fill=tk.X)
+    root.update()
+
+    applied = [0]
+
+    def apply(message, progress=None):
+        status_bar.update_status(message, progress)
+        applied[0] += 1
+
+    if mode == 'legacy':
+        def legacy_apply(message, progress):
+            apply(message, progress)
+            # Eski yol: hem SyncGUI hem StatusBar update_idletasks çağırıyordu
+            root.update_idletasks()
+            root.update_idletasks()
+
+        def callback(message, progress=None):
+            root.after(0, lambda: legacy_apply(message, progress))
+    else:
+        aggregator = ProgressAggregator()
+        aggregator.start(root, apply)
+        callback = aggregator.post
+
+    stop = threading.Event()
+    posted = [0] * workers
+
+    def worker(index: int) -> None:
+        interval = 1.0 / rate
+        next_at = time.perf_counter()
+        copied = 0
+        while not stop.is_set():
+            copied += 1
+            callback(f"Kopyalanıyor: dosya_{index}.bin - %{copied % 100:.1f}", copied % 100)
+            posted[index] += 1
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+    lateness: List[float] = []
+    expected = [time.perf_counter() + PROBE_INTERVAL_MS / 1000]
+
+    def probe() -> None:
+        now = time.perf_counter()
+        lateness.append(max(0.0, now - expected[0]) * 1000)
+        expected[0] = now + PROBE_INTERVAL_MS / 1000
+        root.after(PROBE_INTERVAL_MS, probe)
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    root.after(PROBE_INTERVAL_MS, probe)
+    root.after(int(duration * 1000), root.quit)
+    root.mainloop()
+    stop.set()
+    for thread in threads:
+        thread.join()
+    root.destroy()
+
+    return {
+        'posted': sum(posted),
+        'applied': applied[0],
+        'probes': len(lateness),
+        'p50_ms': _percentile(lateness, 0.50),
+        'p99_ms': _percentile(lateness, 0.99),
+        'max_ms': max(lateness) if lateness else 0.0,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="GUI olay döngüsü gecikmesi ölçümü")
+    parser.add_argument('--mode', choices=('legacy', 'aggregated', 'both'), default='both')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=1000,
+                        help="İşçi başına saniyedeki ilerleme bildirimi")
+    parser.add_argument('--duration', type=float, default=5.0)
+    args = parser.parse_args()
+
+    modes = ('legacy', 'aggregated') if args.mode == 'both' else (args.mode,)
+    for mode in modes:
+        result = run(mode, args.workers, args.rate, args.duration)
+        print(f"{mode:<11} bildirim={result['posted']:>7} uygulanan={result['applied']:>7} "
+              f"yoklama={result['probes']:>4} gecikme p50={result['p50_ms']:.1f}ms "
+              f"p99={result['p99_ms']:.1f}ms max={result['max_ms']:.1f}ms")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,57 @@
+"""
+Başsız (GUI'siz) içe aktarma süresi bütçesi
+
+`src.cli` modülünü temiz bir yorumlayıcıda `-X importtime` ile birkaç kez
+içe aktarır, en iyi kümülatif süreyi bütçeyle karşılaştırır ve tkinter /
+tkcalendar'ın yüklenmediğini doğrular. Bütçe aşılırsa 1 ile çıkar.
+
+Kullanım (depo kökünden):
+    python -m benchmarks.bench_import_time --budget-ms 150
+"""
+
+import re
+import sys
+import argparse
+import subprocess
+from typing import Tuple
+
+GUI_MODULES = ('tkinter', 'tkcalendar')
+_LINE = re.compile(r'import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def measure(module: str) -> Tuple[float, bool]:
+    """Modülün kümülatif içe aktarma süresini (ms) ve GUI modülü yüklenip yüklenmediğini döndür"""
+    code = (f"import sys, {module}; "
+            f"print(any(m in sys.modules for m in {GUI_MODULES!r}))")
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True)
+    cumulative_us = 0
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match and match.group(4) == module:
+            cumulative_us = int(match.group(2))
+    return cumulative_us / 1000, result.stdout.strip() == 'True'
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Başsız içe aktarma süresi bütçesi")
+    parser.add_argument('--module', default='src.cli')
+    parser.add_argument('--budget-ms', type=float, default=150.0)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    timings = []
+    gui_loaded = False
+    for _ in range(args.runs):
+        elapsed, loaded = measure(args.module)
+        timings.append(elapsed)
+        gui_loaded = gui_loaded or loaded
+
+    best = min(timings)
+    print(f"{args.module}: en iyi {best:.1f} ms, ortanca {sorted(timings)[len(timings) // 2]:.1f} ms "
+          f"(bütçe {args.budget_ms:.0f} ms), GUI modülü yüklendi: {'evet' if gui_loaded else 'hayır'}")
+    return 0 if best <= args.budget_ms and not gui_loaded else 1
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
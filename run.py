@@ -9,7 +9,6 @@ import logging
 from pathlib import Path
 from typing import Optional
 import traceback
-from tkinter import messagebox
 
 def setup_environment() -> None:
     """Çalışma ortamını hazırla"""
@@ -26,12 +25,21 @@ def setup_logging() -> None:
 def show_error_message(title: str, message: str) -> None:
     """Hata mesajı göster"""
     try:
+        # tkinter yalnızca GUI hatalarında yüklenir; komut satırı modunda gerekmez
+        from tkinter import messagebox
         messagebox.showerror(title, message)
     except:
         print(f"HATA: {title}\n{message}", file=sys.stderr)
 
 def main() -> Optional[int]:
     """Ana fonksiyon"""
+    # Argüman verilmişse GUI olmadan komut satırı modunda çalış
+    # (ör. python run.py once KAYNAK HEDEF)
+    if len(sys.argv) > 1:
+        setup_environment()
+        from src.cli import main as cli_main
+        return cli_main(sys.argv[1:])
+
     try:
         # Ortamı hazırla
         setup_environment()
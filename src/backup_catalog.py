@@ -0,0 +1,184 @@
+"""
+Yedek kataloğu ve saklama politikası
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+@dataclass
+class RetentionPolicy:
+    """Yedek saklama politikası (0 değeri sınırsız anlamına gelir)"""
+
+    max_count: int = 5
+    max_age_days: float = 0
+    max_total_size: int = 0
+
+    @classmethod
+    def from_config(cls, config) -> 'RetentionPolicy':
+        """SyncConfig değerlerinden politika oluştur"""
+        return cls(
+            max_count=config.backup_max_count,
+            max_age_days=config.backup_max_age_days,
+            max_total_size=config.backup_max_total_mb * 1024 * 1024
+        )
+
+
+class BackupCatalog:
+    """Bir yedek klasöründeki dosya sürümlerinin kalıcı kataloğu"""
+
+    CATALOG_NAME = '.catalog.json'
+    BACKUP_MARKER = '.bak.'
+
+    def __init__(self, backup_dir: Path):
+        self.backup_dir = Path(backup_dir)
+        self.catalog_path = self.backup_dir / self.CATALOG_NAME
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[dict]] = {}
+        self._total_size: Dict[str, int] = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        """Kataloğu oku ve klasörle uzlaştır; yoksa klasörden oluştur
+
+        Katalog döngü sonunda yazılır; süreç arada çökerse kaydedilmemiş
+        yedekler klasörde kalır. Bu yüzden okunan katalog klasör listesiyle
+        karşılaştırılır (katalog nesnesi başına bir tarama).
+        """
+        if self.catalog_path.exists():
+            try:
+                with open(self.catalog_path, 'r', encoding='utf-8') as f:
+                    self._entries = json.load(f)
+            except (OSError, ValueError) as e:
+                logging.warning(f"Yedek kataloğu okunamadı, yeniden oluşturuluyor ({self.catalog_path}): {e}")
+                self._rebuild()
+            else:
+                self._reconcile()
+        else:
+            self._rebuild()
+
+        self._total_size = {
+            name: sum(entry['size'] for entry in versions)
+            for name, versions in self._entries.items()
+        }
+
+    def _scan(self) -> Dict[str, List[dict]]:
+        """Klasördeki yedek dosyalarını dosya adına göre topla (eskiden yeniye)"""
+        entries: Dict[str, List[dict]] = {}
+        if self.backup_dir.is_dir():
+            for entry in os.scandir(self.backup_dir):
+                file_name, marker, stamp = entry.name.rpartition(self.BACKUP_MARKER)
+                if not marker or not entry.is_file():
+                    continue
+                try:
+                    timestamp = float(stamp)
+                except ValueError:
+                    continue
+                entries.setdefault(file_name, []).append({
+                    'name': entry.name,
+                    'time': timestamp,
+                    'size': entry.stat().st_size
+                })
+        for versions in entries.values():
+            versions.sort(key=lambda entry: entry['time'])
+        return entries
+
+    def _rebuild(self) -> None:
+        """Mevcut yedek dosyalarından kataloğu yeniden oluştur"""
+        self._entries = self._scan()
+        self._dirty = True
+
+    def _reconcile(self) -> None:
+        """Katalogda olmayan yedekleri ekle, dosyası silinmiş girdileri çıkar"""
+        on_disk = self._scan()
+        known = {entry['name'] for versions in self._entries.values() for entry in versions}
+        present = {entry['name'] for versions in on_disk.values() for entry in versions}
+        if known == present:
+            return
+        logging.info(f"Yedek kataloğu klasörle uzlaştırıldı ({self.backup_dir}): "
+                     f"{len(present - known)} eklendi, {len(known - present)} çıkarıldı")
+        self._entries = on_disk
+        self._dirty = True
+
+    def add(self, file_name: str, backup_name: str, size: int,
+            timestamp: Optional[float] = None) -> None:
+        """Yeni bir yedek sürümünü kaydet"""
+        entry = {
+            'name': backup_name,
+            'time': timestamp if timestamp is not None else time.time(),
+            'size': size
+        }
+        with self._lock:
+            versions = self._entries.setdefault(file_name, [])
+            # Aynı saniyede alınan yedek aynı adı taşır ve öncekinin yerine geçer
+            if versions and versions[-1]['name'] == backup_name:
+                self._total_size[file_name] -= versions.pop()['size']
+            versions.append(entry)
+            self._total_size[file_name] = self._total_size.get(file_name, 0) + size
+            self._dirty = True
+
+    def versions(self, file_name: str) -> List[dict]:
+        """Dosyaya ait yedekleri eskiden yeniye döndür"""
+        with self._lock:
+            return list(self._entries.get(file_name, []))
+
+    def apply_retention(self, file_name: str, policy: RetentionPolicy,
+                        now: Optional[float] = None) -> List[str]:
+        """Politikayı aşan en eski yedekleri sil; silinen dosya adlarını döndür"""
+        now = now if now is not None else time.time()
+        min_time = now - policy.max_age_days * 86400 if policy.max_age_days > 0 else None
+        removed = []
+
+        with self._lock:
+            versions = self._entries.get(file_name)
+            if not versions:
+                return removed
+
+            # En yeni yedek her zaman korunur
+            while len(versions) > 1:
+                oldest = versions[0]
+                if not (
+                    (policy.max_count > 0 and len(versions) > policy.max_count) or
+                    (min_time is not None and oldest['time'] < min_time) or
+                    (policy.max_total_size > 0 and self._total_size[file_name] > policy.max_total_size)
+                ):
+                    break
+                versions.pop(0)
+                self._total_size[file_name] -= oldest['size']
+                removed.append(oldest['name'])
+            if removed:
+                self._dirty = True
+
+        for name in removed:
+            try:
+                (self.backup_dir / name).unlink()
+                logging.debug(f"Eski yedek silindi: {self.backup_dir / name}")
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logging.warning(f"Eski yedek silinirken hata: {e}")
+        return removed
+
+    def save(self) -> None:
+        """Değişiklik varsa kataloğu diske atomik olarak yaz"""
+        with self._lock:
+            if not self._dirty:
+                return
+            data = json.dumps(self._entries, ensure_ascii=False, separators=(',', ':'))
+            self._dirty = False
+
+        tmp_path = self.catalog_path.with_name(self.CATALOG_NAME + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.catalog_path)
+        except OSError as e:
+            self._dirty = True
+            logging.error(f"Yedek kataloğu kaydedilemedi ({self.catalog_path}): {e}")
@@ -0,0 +1,368 @@
+"""
+İçerik adresli, parça bazlı tekilleştirilmiş yedek deposu
+
+Dosyalar içerik tanımlı parçalara bölünür; her benzersiz parça sıkıştırılarak
+bir kez saklanır ve her sürüm için parça listesini içeren bir manifest yazılır.
+Yavaş değişen büyük dosyaların yeni sürümleri, araya bayt eklense bile,
+yalnızca değişen parçalar kadar yer kaplar.
+
+Parça sınırı bayt bayt hash yerine C'de aranır: her bayt bytes.translate ile
+küçük bir alfabeye (en fazla 16 sembol) çevrilir ve sembol dizisinde sabit
+bir desen bytes.find ile bulunur. Desen yalnızca son birkaç bayta bağlı
+olduğundan sınırlar içerikle birlikte kayar; rastgele veride desen ortalama
+`avg_chunk` baytta bir görülür. Her boyuttaki dosya böyle bölünür (yüzlerce
+MB/s). Az sayıda farklı bayttan oluşan veride (ör. düz metin) parça boyutları
+ortalamadan sapabilir; min/max sınırları yine geçerlidir.
+
+Komut satırı kullanımı:
+    python -m src.backup_store --store DEPO list [ANAHTAR]
+    python -m src.backup_store --store DEPO restore ANAHTAR HEDEF [--version SÜRÜM]
+    python -m src.backup_store --store DEPO prune [--max-count N] [--max-age-days N] [--max-total-mb N]
+"""
+
+import os
+import json
+import time
+import zlib
+import hashlib
+import logging
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+from .backup_catalog import RetentionPolicy
+from .exceptions import FileOperationError
+
+# Gear tablosu: her bayt değeri için sabit, sözde rastgele 64 bit değer
+_GEAR = [
+    int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], 'little')
+    for i in range(256)
+]
+
+# Sınır deseninde en fazla bu kadar farklı sembol kullanılır; alfabe küçüldükçe
+# bytes.find yavaşlar
+_MAX_SYMBOLS = 16
+
+
+def _boundary(avg_size: int) -> Tuple[bytes, bytes]:
+    """Ortalama parça boyutu için bayt -> sembol tablosu ve sınır deseni
+
+    Desen uzunluğu L ve alfabe boyutu A, A**L ~ avg_size olacak şekilde
+    seçilir. Baytlar gear değerlerine göre sıralanıp A eşit gruba bölünür;
+    desenin sembolleri birbirinden farklıdır, böylece desen kendisiyle
+    örtüşmez ve tek bayt tekrarında hiç eşleşmez.
+    """
+    bits = max(avg_size.bit_length() - 1, 1)
+    length = -(-bits // 4)
+    symbols = min(_MAX_SYMBOLS, max(2, round(2 ** (bits / length))))
+    table = bytearray(256)
+    for rank, byte in enumerate(sorted(range(256), key=_GEAR.__getitem__)):
+        table[byte] = rank * symbols // 256
+    order = sorted(range(symbols), key=lambda symbol: _GEAR[symbol])
+    return bytes(table), bytes(order[:length])
+
+
+def iter_chunks(stream: BinaryIO, min_size: int, avg_size: int,
+                max_size: int) -> Iterator[bytes]:
+    """Akışı içerik tanımlı parçalara böl"""
+    table, pattern = _boundary(avg_size)
+    width = len(pattern)
+    buffer = symbols = b''
+    pos = 0
+    eof = False
+    while True:
+        # Tampon en az bir tam parça tutar; okunan blok bir kez çevrilir
+        while not eof and len(buffer) - pos < max_size:
+            block = stream.read(4 * max_size)
+            if block:
+                buffer = buffer[pos:] + block
+                symbols = symbols[pos:] + block.translate(table)
+                pos = 0
+            else:
+                eof = True
+        available = len(buffer) - pos
+        if not available:
+            return
+        if available <= min_size:
+            end = len(buffer)
+        else:
+            # İlk min_size bayt atlanır (FastCDC); sınır yalnızca min..max aralığında aranır
+            limit = pos + min(available, max_size)
+            found = symbols.find(pattern, pos + max(0, min_size - width), limit)
+            end = limit if found < 0 else found + width
+        yield buffer[pos:end]
+        pos = end
+
+
+class BackupStore:
+    """Sürümlü, parça tekilleştirmeli yedek deposu"""
+
+    CHUNK_DIR = 'chunks'
+    MANIFEST_DIR = 'manifests'
+    # Toplama sırasında yeni yazılan ama henüz manifeste girmemiş parçaları korur
+    GC_GRACE_SECONDS = 3600
+
+    def __init__(self, root: str, min_chunk: int = 256 * 1024,
+                 avg_chunk: int = 1024 * 1024, max_chunk: int = 4 * 1024 * 1024,
+                 compression_level: int = 6):
+        self.root = Path(root)
+        self.min_chunk = min_chunk
+        self.avg_chunk = avg_chunk
+        self.max_chunk = max_chunk
+        self.compression_level = compression_level
+        # Saklama politikası manifest sildiğinde parçalar toplanmalı
+        self.gc_pending = False
+        self._lock = threading.Lock()
+        (self.root / self.CHUNK_DIR).mkdir(parents=True, exist_ok=True)
+        (self.root / self.MANIFEST_DIR).mkdir(parents=True, exist_ok=True)
+
+    # -- Yardımcılar -------------------------------------------------------
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.root / self.CHUNK_DIR / digest[:2] / digest
+
+    def _key_dir(self, key: str) -> Path:
+        key_hash = hashlib.sha1(key.encode('utf-8')).hexdigest()
+        return self.root / self.MANIFEST_DIR / key_hash
+
+    @staticmethod
+    def _atomic_write(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _store_chunk(self, chunk: bytes) -> Tuple[str, int]:
+        """Parçayı sakla; yeni yazılan sıkıştırılmış bayt sayısını döndür"""
+        digest = hashlib.sha256(chunk).hexdigest()
+        path = self._chunk_path(digest)
+        if path.exists():
+            # Çöp toplamanın yeniden kullanılan parçayı silmemesi için tarihini yenile
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return digest, 0
+
+        path.parent.mkdir(exist_ok=True)
+        data = zlib.compress(chunk, self.compression_level)
+        self._atomic_write(path, data)
+        return digest, len(data)
+
+    # -- Sürümler ----------------------------------------------------------
+
+    def add_version(self, file_path: str, key: str) -> dict:
+        """Dosyanın yeni bir sürümünü depoya ekle"""
+        try:
+            st = os.stat(file_path)
+            chunks = []
+            stored_bytes = 0
+            with open(file_path, 'rb') as f:
+                for chunk in iter_chunks(f, self.min_chunk, self.avg_chunk, self.max_chunk):
+                    digest, written = self._store_chunk(chunk)
+                    chunks.append([digest, len(chunk)])
+                    stored_bytes += written
+
+            now = time.time()
+            manifest = {
+                'key': key,
+                'version': datetime.fromtimestamp(now).strftime('%Y%m%dT%H%M%S_%f'),
+                'time': now,
+                'size': st.st_size,
+                'mtime': st.st_mtime,
+                'mode': st.st_mode & 0o7777,
+                'stored_bytes': stored_bytes,
+                'chunks': chunks
+            }
+            key_dir = self._key_dir(key)
+            key_dir.mkdir(exist_ok=True)
+            self._atomic_write(
+                key_dir / f"{manifest['version']}.json",
+                json.dumps(manifest, separators=(',', ':')).encode('utf-8')
+            )
+            logging.debug(
+                f"Depoya sürüm eklendi: {key} ({len(chunks)} parça, "
+                f"{stored_bytes} bayt yeni veri)"
+            )
+            return manifest
+
+        except OSError as e:
+            raise FileOperationError(f"Depoya yedekleme hatası ({file_path}): {str(e)}")
+
+    def _load_manifests(self, key_dir: Path) -> List[dict]:
+        manifests = []
+        for path in sorted(key_dir.glob('*.json')):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    manifests.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logging.warning(f"Manifest okunamadı ({path}): {e}")
+        return manifests
+
+    def list_keys(self) -> List[str]:
+        """Depodaki tüm dosya anahtarlarını döndür"""
+        keys = []
+        for key_dir in (self.root / self.MANIFEST_DIR).iterdir():
+            manifests = self._load_manifests(key_dir) if key_dir.is_dir() else []
+            if manifests:
+                keys.append(manifests[-1]['key'])
+        return sorted(keys)
+
+    def list_versions(self, key: str) -> List[dict]:
+        """Anahtara ait sürümleri eskiden yeniye döndür"""
+        key_dir = self._key_dir(key)
+        return self._load_manifests(key_dir) if key_dir.is_dir() else []
+
+    def restore(self, key: str, dest: str, version: Optional[str] = None) -> str:
+        """Sürümü hedef yola geri yükle (sürüm verilmezse en yenisi)"""
+        versions = self.list_versions(key)
+        if version:
+            versions = [m for m in versions if m['version'] == version]
+        if not versions:
+            raise FileOperationError(f"Yedek sürümü bulunamadı: {key} {version or ''}".strip())
+        manifest = versions[-1]
+
+        dest_path = Path(dest)
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest_path.with_name(dest_path.name + '.restore.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                for digest, length in manifest['chunks']:
+                    with open(self._chunk_path(digest), 'rb') as chunk_file:
+                        chunk = zlib.decompress(chunk_file.read())
+                    if len(chunk) != length or hashlib.sha256(chunk).hexdigest() != digest:
+                        raise FileOperationError(f"Bozuk yedek parçası: {digest}")
+                    f.write(chunk)
+            os.replace(tmp_path, dest_path)
+            os.chmod(dest_path, manifest['mode'])
+            os.utime(dest_path, (manifest['mtime'], manifest['mtime']))
+        except OSError as e:
+            raise FileOperationError(f"Geri yükleme hatası ({key}): {str(e)}")
+        finally:
+            if tmp_path.exists():
+                tmp_path.unlink()
+
+        logging.info(f"Yedek geri yüklendi: {key} [{manifest['version']}] -> {dest_path}")
+        return str(dest_path)
+
+    # -- Saklama ve çöp toplama --------------------------------------------
+
+    def apply_retention(self, key: str, policy: RetentionPolicy,
+                        now: Optional[float] = None) -> int:
+        """Politikayı aşan sürüm manifestlerini sil (parçalar collect_garbage ile toplanır)"""
+        now = now if now is not None else time.time()
+        key_dir = self._key_dir(key)
+        versions = self.list_versions(key)
+        total_size = sum(m['size'] for m in versions)
+        min_time = now - policy.max_age_days * 86400 if policy.max_age_days > 0 else None
+
+        removed = 0
+        # En yeni sürüm her zaman korunur
+        while len(versions) > 1:
+            oldest = versions[0]
+            if not (
+                (policy.max_count > 0 and len(versions) > policy.max_count) or
+                (min_time is not None and oldest['time'] < min_time) or
+                (policy.max_total_size > 0 and total_size > policy.max_total_size)
+            ):
+                break
+            versions.pop(0)
+            total_size -= oldest['size']
+            try:
+                (key_dir / f"{oldest['version']}.json").unlink()
+                removed += 1
+                self.gc_pending = True
+            except FileNotFoundError:
+                pass
+        return removed
+
+    def prune(self, policy: Optional[RetentionPolicy] = None) -> Dict[str, int]:
+        """Saklama politikasını uygula ve referanssız parçaları sil"""
+        removed_versions = 0
+        if policy is not None:
+            for key in self.list_keys():
+                removed_versions += self.apply_retention(key, policy)
+        result = self.collect_garbage()
+        result['removed_versions'] = removed_versions
+        return result
+
+    def collect_garbage(self) -> Dict[str, int]:
+        """Hiçbir manifestin başvurmadığı parçaları sil"""
+        with self._lock:
+            self.gc_pending = False
+            referenced = set()
+            for key_dir in (self.root / self.MANIFEST_DIR).iterdir():
+                if not key_dir.is_dir():
+                    continue
+                for manifest in self._load_manifests(key_dir):
+                    referenced.update(digest for digest, _ in manifest['chunks'])
+
+            removed_chunks = 0
+            freed_bytes = 0
+            grace_limit = time.time() - self.GC_GRACE_SECONDS
+            for chunk_path in (self.root / self.CHUNK_DIR).glob('*/*'):
+                if chunk_path.name in referenced or chunk_path.name.endswith('.tmp'):
+                    continue
+                try:
+                    st = chunk_path.stat()
+                    if st.st_mtime > grace_limit:
+                        continue
+                    chunk_path.unlink()
+                    removed_chunks += 1
+                    freed_bytes += st.st_size
+                except FileNotFoundError:
+                    pass
+
+        logging.info(f"Yedek deposu temizlendi: {removed_chunks} parça, {freed_bytes} bayt")
+        return {
+            'removed_chunks': removed_chunks,
+            'freed_bytes': freed_bytes
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Yedek deposu komut satırı arayüzü"""
+    parser = argparse.ArgumentParser(description="Tekilleştirilmiş yedek deposu araçları")
+    parser.add_argument('--store', required=True, help="Yedek deposu klasörü")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    list_cmd = commands.add_parser('list', help="Dosyaları veya bir dosyanın sürümlerini listele")
+    list_cmd.add_argument('key', nargs='?', help="Dosya anahtarı (hedef klasöre göre yol)")
+
+    restore_cmd = commands.add_parser('restore', help="Bir sürümü geri yükle")
+    restore_cmd.add_argument('key', help="Dosya anahtarı")
+    restore_cmd.add_argument('dest', help="Geri yüklenecek yol")
+    restore_cmd.add_argument('--version', help="Sürüm kimliği (varsayılan: en yeni)")
+
+    prune_cmd = commands.add_parser('prune', help="Eski sürümleri ve kullanılmayan parçaları sil")
+    prune_cmd.add_argument('--max-count', type=int, default=0)
+    prune_cmd.add_argument('--max-age-days', type=int, default=0)
+    prune_cmd.add_argument('--max-total-mb', type=int, default=0)
+
+    args = parser.parse_args(argv)
+    store = BackupStore(args.store)
+
+    if args.command == 'list':
+        if args.key:
+            for manifest in store.list_versions(args.key):
+                print(f"{manifest['version']}\t{manifest['size']}\t{manifest['stored_bytes']}")
+        else:
+            for key in store.list_keys():
+                print(key)
+    elif args.command == 'restore':
+        print(store.restore(args.key, args.dest, args.version))
+    elif args.command == 'prune':
+        policy = RetentionPolicy(
+            max_count=args.max_count,
+            max_age_days=args.max_age_days,
+            max_total_size=args.max_total_mb * 1024 * 1024
+        )
+        result = store.prune(policy)
+        print(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+"""
+Komut satırı arayüzü (GUI gerektirmez)
+
+    python -m src.cli once   KAYNAK HEDEF   # tek döngü, sonuçla çık
+    python -m src.cli watch  KAYNAK HEDEF   # check_interval aralıkla sürekli
+    python -m src.cli daemon KAYNAK HEDEF   # watch, arka plana ayrılarak (POSIX)
+
+KAYNAK ve HEDEF verilmezse config.ini içindeki [job:AD] bölümleri ortak
+kaynak sınırlarıyla birlikte çalıştırılır (bkz. job_manager).
+
+SIGINT/SIGTERM döngüyü düzgünce durdurur; SIGHUP yapılandırmayı yeniden
+yükler (bir sonraki döngüde geçerli olur). once modunda sinyal döngüyü
+yarıda keser ve 130 ile çıkılır; watch/daemon modlarının normal bitişi
+sinyaldir ve 0 ile çıkılır. --profile cpu|memory|both ilk
+döngüyü profiller (bkz. profiling).
+"""
+
+import os
+import sys
+import signal
+import logging
+import argparse
+import functools
+import threading
+from typing import Callable, List, Optional
+
+from .file_sync import FileSync
+from .job_manager import JobManager
+from .sync_config import SyncConfig
+from .profiling import PROFILE_MODES
+from .exceptions import ConfigError, InterruptError, SyncError
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_INTERRUPTED = 130
+
+
+def _reload_file_sync(file_sync) -> None:
+    """Tek işin yapılandırmasını dosyadan yeniden yükle"""
+    config = SyncConfig.from_file(file_sync.config_path)
+    config.validate()
+    file_sync.apply_config(config)
+
+
+def _install_signal_handlers(runner, reload: Callable[[], None],
+                             stop_requested: threading.Event) -> None:
+    """Durdurma ve yeniden yükleme sinyallerini bağla"""
+    def on_stop(signum, frame):
+        logging.info(f"Sinyal alındı ({signal.Signals(signum).name}), durduruluyor")
+        stop_requested.set()
+        runner.request_stop()
+
+    def on_reload(signum, frame):
+        try:
+            reload()
+            logging.info("Yapılandırma yeniden yüklendi")
+        except ConfigError as e:
+            logging.error(f"Yapılandırma yeniden yüklenemedi: {str(e)}")
+
+    signal.signal(signal.SIGINT, on_stop)
+    signal.signal(signal.SIGTERM, on_stop)
+    if hasattr(signal, 'SIGHUP'):
+        signal.signal(signal.SIGHUP, on_reload)
+
+
+def _daemonize(pidfile: Optional[str]) -> None:
+    """Süreci terminalden ayır (çift fork) ve standart akışları kapat"""
+    if os.name != 'posix':
+        raise SyncError("Daemon modu yalnızca POSIX sistemlerde desteklenir")
+
+    if os.fork() > 0:
+        os._exit(0)
+    os.setsid()
+    if os.fork() > 0:
+        os._exit(0)
+
+    # Göreli yollar (config.ini, logs/) çalışma klasörüne göre kalır
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with open(os.devnull, 'rb') as devnull_in, open(os.devnull, 'ab') as devnull_out:
+        os.dup2(devnull_in.fileno(), sys.stdin.fileno())
+        os.dup2(devnull_out.fileno(), sys.stdout.fileno())
+        os.dup2(devnull_out.fileno(), sys.stderr.fileno())
+
+    if pidfile:
+        with open(pidfile, 'w', encoding='utf-8') as f:
+            f.write(f"{os.getpid()}\n")
+
+
+def run_once(file_sync, source: str, target: str, stop_requested: threading.Event) -> int:
+    """Tek bir senkronizasyon döngüsü çalıştır"""
+    try:
+        file_sync.sync_files(source, target)
+    except InterruptError:
+        return EXIT_INTERRUPTED
+    except SyncError as e:
+        logging.error(str(e))
+        return EXIT_FAILED
+    if stop_requested.is_set():
+        return EXIT_INTERRUPTED
+    return EXIT_FAILED if file_sync.stats.files_failed else EXIT_OK
+
+
+def run_watch(file_sync, source: str, target: str, stop_requested: threading.Event) -> int:
+    """Durdurulana kadar check_interval aralıkla senkronize et
+
+    Sinyal bu modun normal bitişidir ve EXIT_OK döndürür (servis
+    yöneticileri SIGTERM sonrası 0 bekler); döngü kendiliğinden biterse
+    EXIT_FAILED döner.
+    """
+    file_sync.start(source, target)
+    while file_sync.sync_thread.is_alive():
+        # Sinyaller ana thread'de işlenir; kısa aralıklarla uyan
+        if stop_requested.wait(0.5):
+            break
+    file_sync.stop()
+    if stop_requested.is_set():
+        return EXIT_OK
+    # Döngü kendiliğinden bittiyse (ör. senkronizasyon hatası) başarısız say
+    return EXIT_FAILED
+
+
+def run_jobs_once(manager, stop_requested: threading.Event) -> int:
+    """Tüm işler için tek döngü çalıştır"""
+    failed = False
+    for name, error in manager.run_once().items():
+        if error:
+            failed = True
+            logging.error(f"'{name}' işi başarısız: {error}")
+    if stop_requested.is_set():
+        return EXIT_INTERRUPTED
+    return EXIT_FAILED if failed else EXIT_OK
+
+
+def run_jobs_watch(manager, stop_requested: threading.Event) -> int:
+    """Tüm işleri durdurulana kadar kendi aralıklarıyla çalıştır (çıkış kodları run_watch gibi)"""
+    manager.start()
+    while manager.is_alive():
+        if stop_requested.wait(0.5):
+            break
+    manager.stop()
+    return EXIT_OK if stop_requested.is_set() else EXIT_FAILED
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Komut satırı giriş noktası"""
+    parser = argparse.ArgumentParser(description="Dosya senkronizasyonu (GUI olmadan)")
+    parser.add_argument('mode', choices=('once', 'watch', 'daemon'), help="Çalışma modu")
+    parser.add_argument('source', nargs='?', help="Kaynak klasör (verilmezse [job:...] işleri)")
+    parser.add_argument('target', nargs='?', help="Hedef klasör")
+    parser.add_argument('--config', default='config.ini', help="Yapılandırma dosyası")
+    parser.add_argument('--pidfile', help="Daemon modunda PID dosyası")
+    parser.add_argument('--profile', choices=PROFILE_MODES, help="İlk döngüyü profille")
+    args = parser.parse_args(argv)
+    if bool(args.source) != bool(args.target):
+        parser.error("Kaynak ve hedef birlikte verilmelidir")
+
+    if args.mode == 'daemon':
+        try:
+            _daemonize(args.pidfile)
+        except SyncError as e:
+            print(str(e), file=sys.stderr)
+            return EXIT_FAILED
+
+    try:
+        if args.source:
+            runner = FileSync(args.config)
+            runner.config.validate()
+            reload = functools.partial(_reload_file_sync, runner)
+        else:
+            runner = JobManager(args.config)
+            reload = runner.reload_config
+    except ConfigError as e:
+        print(f"Yapılandırma hatası: {str(e)}", file=sys.stderr)
+        return EXIT_FAILED
+
+    if args.profile:
+        syncs = [runner] if args.source else list(runner.syncs.values())
+        for file_sync in syncs:
+            file_sync.profiler.request(args.profile)
+
+    stop_requested = threading.Event()
+    _install_signal_handlers(runner, reload, stop_requested)
+
+    try:
+        if not args.source:
+            if args.mode == 'once':
+                return run_jobs_once(runner, stop_requested)
+            return run_jobs_watch(runner, stop_requested)
+        if args.mode == 'once':
+            return run_once(runner, args.source, args.target, stop_requested)
+        return run_watch(runner, args.source, args.target, stop_requested)
+    finally:
+        runner.close()
+        if args.mode == 'daemon' and args.pidfile:
+            try:
+                os.unlink(args.pidfile)
+            except OSError:
+                pass
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -3,70 +3,177 @@ Ana dosya senkronizasyon sınıfı
 """
 
 import os
+import errno
 import shutil
 import time
 import logging
-import fnmatch
 from datetime import datetime
+from dataclasses import asdict
 import threading
+import functools
+import itertools
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import queue
-from typing import Callable, Optional, List, Dict
+from contextlib import ExitStack
+from typing import Callable, Optional, List, Dict, Set, Tuple
 import json
 import traceback
 
 from .sync_config import SyncConfig
-from .sync_stats import SyncStats
+from .sync_stats import SyncStats, StatsSnapshot, format_size
+from .metadata_stage import MetadataStage
+from .backup_catalog import BackupCatalog, RetentionPolicy
+from .backup_store import BackupStore
+from .filters import FilterEngine
+from .ignore_rules import IgnoreFileCache, IgnoreTree
+from .progress import StatsPublisher, TransferTable
+from .run_history import RunHistory
+from .log_queue import queue_logging_active, start_queue_logging, stop_queue_logging
+from .profiling import CycleProfiler
+from .throttle import SharedLimits, lower_thread_priority
+from .pressure import PressureController
+from .scan_tiers import ScanTiers
 from .notification_service import EmailConfig, EmailNotificationService
+from .notification_queue import ErrorDigestQueue
 from .exceptions import (
     SyncError, FileOperationError, ValidationError,
     ThreadError, PermissionError, InterruptError
 )
 
+
+def configure_logging(config: SyncConfig) -> None:
+    """Kök logger'ı yapılandır (süreç başına; çoklu işte yönetici bir kez çağırır)"""
+    logger = logging.getLogger()
+    if config.log_mode == 'queue' and queue_logging_active(logger):
+        # Dinleyici süreç başına tektir; yeniden başlatılmaz
+        return
+
+    log_dir = Path('logs')
+    log_dir.mkdir(exist_ok=True)
+
+    log_file = log_dir / f'file_sync_{datetime.now().strftime("%Y%m%d")}.log'
+
+    formatter = logging.Formatter(
+        '%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s'
+    )
+
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setLevel(logging.DEBUG)
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.INFO)
+    console_handler.setFormatter(formatter)
+
+    logger.setLevel(logging.DEBUG)
+
+    # Önceki handlers'ları temizle
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+    stop_queue_logging()
+
+    if config.log_mode == 'queue':
+        # Biçimlendirme ve disk yazımı kopyalama thread'lerinin dışında yapılır
+        start_queue_logging(logger, file_handler, console_handler)
+    else:
+        logger.addHandler(file_handler)
+        logger.addHandler(console_handler)
+
+
 class FileSync:
     """Dosya senkronizasyon sınıfı"""
     
-    def __init__(self):
-        """Başlatıcı"""
-        self.config = SyncConfig.from_file()
-        self.setup_logging()
+    # Uzun çalışmalarda ilerleme logu aralığı (saniye)
+    PROGRESS_LOG_INTERVAL = 30.0
+    # Uyarlanır modda değişiklik bulunmayan her döngüden sonra aralık çarpanı
+    INTERVAL_BACKOFF = 2.0
+    # Parça parça kopyalanan dosyalar tamamlanana kadar bu uzantıyla yazılır
+    PARTIAL_SUFFIX = '.sync-partial'
+
+    def __init__(self, config_path: str = 'config.ini', config: Optional[SyncConfig] = None,
+                 job_name: str = '', limits: Optional[SharedLimits] = None, managed: bool = False):
+        """Başlatıcı
+
+        config verilmezse config_path'in DEFAULT bölümü okunur. managed=True
+        (JobManager) iken loglama ve metrik sunucusu yöneticiye bırakılır;
+        limits verilirse işler arasında paylaşılan sınırlar kullanılır.
+        """
+        self.config_path = config_path
+        self.config = config if config is not None else SyncConfig.from_file(self.config_path)
+        self.managed = managed
+        self.profiler = CycleProfiler(self.config_path)
+        self.run_history = RunHistory()
+        self._email_service: Optional[EmailNotificationService] = None
+        self.notifier = ErrorDigestQueue(self._deliver_notification,
+                                         self.config.notification_window)
+        self._file_log_counter = itertools.count()
+        if not managed:
+            self.setup_logging()
         self.sync_queue: queue.Queue = queue.Queue()
         self.is_running: bool = False
         self.sync_thread: Optional[threading.Thread] = None
         self.stats = SyncStats()
+        self.transfers = TransferTable()
+        self._publisher = StatsPublisher(self.stats)
+        self.metadata_stage = MetadataStage()
+        self._backup_catalogs: Dict[str, BackupCatalog] = {}
+        self._catalog_lock = threading.Lock()
+        self._backup_store: Optional[BackupStore] = None
+        self.filter_engine: Optional[FilterEngine] = None
+        # Döngüler arası kümülatif metrikler
+        self.cycle_totals: Dict[str, float] = {}
+        self.latency_totals: Dict[str, List[int]] = {}
+        self.latency_sum_totals: Dict[str, float] = {}
+        self.cycles_total = 0
+        self.cycle_failures_total = 0
+        self.last_cycle_success: Optional[float] = None
+        self.last_cycle_duration: Optional[float] = None
+        # Geçmişe yazılmayan boş döngüler; bir sonraki rapora eklenir
+        self.idle_cycles = 0
+        self.current_interval: float = float(self.config.check_interval)
+        self._cycle_in_progress = False
+        self.metrics_server = None
+        self._ignore_cache = IgnoreFileCache()
+        self.scan_tiers = ScanTiers()
+        self._target_root: Optional[str] = None
+        # Süreç başına bir kez yarım kopya taraması yapılan hedefler
+        self._swept_targets: Set[str] = set()
+        self._created_at = time.time()
+        self._backup_slots = threading.BoundedSemaphore(self.config.backup_threads)
+        self._backup_slot_count = self.config.backup_threads
+        # Çoklu iş yöneticisi tüm işlere aynı SharedLimits nesnesini verir
+        self._shared_limits = limits is not None
+        self.limits: Optional[SharedLimits] = (
+            limits if limits is not None else SharedLimits.from_config(self.config))
+        self.job_name = job_name
+        self._pressure: Optional[PressureController] = None
         self.status_callback: Optional[Callable[[str], None]] = None
         self._stop_event = threading.Event()
+        self._stop_requested_at: Optional[float] = None
+        self.last_quiesce_time: Optional[float] = None
         self.load_email_config()
 
+    def apply_config(self, config: SyncConfig) -> None:
+        """Yeniden yüklenen yapılandırmayı uygula
+
+        Sınırlar JobManager tarafından paylaşılmıyorsa yeni ayarlardan yeniden
+        kurulur; süren kopyalar aldıkları yuvaları eski nesneye bırakır.
+        """
+        self.config = config
+        if not self._shared_limits:
+            self.limits = SharedLimits.from_config(config)
+
     def setup_logging(self) -> None:
         """Loglama ayarlarını yapılandır"""
-        log_dir = Path('logs')
-        log_dir.mkdir(exist_ok=True)
-        
-        log_file = log_dir / f'file_sync_{datetime.now().strftime("%Y%m%d")}.log'
-        
-        formatter = logging.Formatter(
-            '%(asctime)s - %(levelname)s - [%(threadName)s] - %(message)s'
-        )
-        
-        file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(formatter)
-        
-        logger = logging.getLogger()
-        logger.setLevel(logging.DEBUG)
-        
-        # Önceki handlers'ları temizle
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-            
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        configure_logging(self.config)
+
+    def _should_log_file(self) -> bool:
+        """Dosya başına debug satırının örneklemeye göre yazılıp yazılmayacağı"""
+        rate = self.config.log_sample_rate
+        if rate <= 0 or not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return False
+        return rate == 1 or next(self._file_log_counter) % rate == 0
 
     def load_email_config(self):
         """E-posta ayarlarını yükle"""
@@ -92,12 +199,12 @@ class FileSync:
             logging.error(f"E-posta ayarları yüklenemedi: {str(e)}")
             self.email_config = None
     def send_error_notification(self, error_message: str, file_info: dict = None):
-        """Hata bildirimini e-posta ile gönder"""
+        """Hata bildirimini özet kuyruğuna ekle (e-posta arka planda gönderilir)"""
         if not self.email_config or not self.email_config.username:
-            logging.warning("E-posta bildirimi yapılandırılmamış")
+            logging.debug("E-posta bildirimi yapılandırılmamış")
             return False
 
-        try:
+        with self.stats.phase('notify'):
             # Hata detaylarını hazırla
             error_details = {
                 'Zaman': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
@@ -117,19 +224,29 @@ class FileSync:
             if stack_trace != "NoneType: None\n":
                 error_details['Stack Trace'] = stack_trace
 
-            # E-posta gönder
-            notification_service = EmailNotificationService(self.email_config)
-            notification_service.send_error_notification(
-                error_message=f"Dosya Senkronizasyon Hatası: {error_message}",
-                details=error_details
-            )
-            logging.info("Hata bildirimi e-posta ile gönderildi")
-            return True
+            file_path = (file_info or {}).get('Kaynak Dosya') or (file_info or {}).get('Dosya', '')
+            self.notifier.submit(error_message, error_details, file_path)
+        return True
 
-        except Exception as e:
-            logging.error(f"Hata bildirimi gönderilemedi: {str(e)}")
+    def _deliver_notification(self, message: str, details: dict) -> bool:
+        """Özet kuyruğunun gönderim fonksiyonu (bildirim thread'inde çalışır)"""
+        if not self.email_config or not self.email_config.username:
+            logging.warning("E-posta bildirimi yapılandırılmamış")
             return False
 
+        # Servis (ve SMTP oturumu) yapılandırma değişene kadar yeniden kullanılır
+        if self._email_service is None or self._email_service.config is not self.email_config:
+            if self._email_service is not None:
+                self._email_service.close()
+            self._email_service = EmailNotificationService(self.email_config)
+        sent = self._email_service.send_error_notification(
+            error_message=f"Dosya Senkronizasyon Hatası: {message}",
+            details=details
+        )
+        if sent:
+            logging.info("Hata bildirimi e-posta ile gönderildi")
+        return sent
+
     def validate_paths(self, source: str, target: str) -> None:
         """Yolları doğrula"""
         try:
@@ -164,41 +281,25 @@ class FileSync:
             logging.error(f"Yol doğrulama hatası: {str(e)}")
             raise
 
-    def should_copy_file(self, source_path: str) -> bool:
-        """Dosyanın kopyalanıp kopyalanmayacağını kontrol et"""
+    def should_copy_file(self, source_path: str, st: Optional[os.stat_result] = None) -> bool:
+        """Dosyanın boyut/tarih/yaş kurallarına göre kopyalanıp kopyalanmayacağını kontrol et"""
         try:
-            if not self.config.date_filter_enabled:
+            if self.filter_engine is None:
+                self.filter_engine = FilterEngine.compile(self.config)
+            if not self.filter_engine.needs_stat:
                 return True
-
-            file_time = datetime.fromtimestamp(os.path.getmtime(source_path))
-            
-            if self.config.start_date:
-                try:
-                    start_date = datetime.strptime(self.config.start_date, '%Y-%m-%d')
-                    start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                    if file_time < start_date:
-                        logging.debug(f"Dosya tarihi başlangıç tarihinden önce: {source_path}")
-                        return False
-                except ValueError as e:
-                    logging.error(f"Başlangıç tarihi format hatası: {e}")
-                    
-            if self.config.end_date:
-                try:
-                    end_date = datetime.strptime(self.config.end_date, '%Y-%m-%d')
-                    end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
-                    if file_time > end_date:
-                        logging.debug(f"Dosya tarihi bitiş tarihinden sonra: {source_path}")
-                        return False
-                except ValueError as e:
-                    logging.error(f"Bitiş tarihi format hatası: {e}")
-                    
-            return True
+            return self.filter_engine.match_stat(st or os.stat(source_path))
             
         except Exception as e:
-            logging.error(f"Tarih kontrolü hatası ({source_path}): {str(e)}")
+            logging.error("Filtre kontrolü hatası (%s): %s", source_path, e)
             return True
-    def copy_file(self, src: str, dst: str) -> None:
-        """Dosyayı ilerleme bilgisi ile kopyala"""
+
+    def copy_file(self, src: str, dst: str, replace_existing: bool = False) -> None:
+        """Dosyayı ilerleme bilgisi ile kopyala
+
+        replace_existing: hedef yedekle paylaşıldığından (hard link) yerinde
+        yazılmaz; küçük dosyalar da geçici dosya üzerinden yerine taşınır.
+        """
         try:
             # Hedef dizini kontrol et ve oluştur
             dst_dir = os.path.dirname(dst)
@@ -207,44 +308,79 @@ class FileSync:
             file_size = os.path.getsize(src)
             chunk_size = 1024 * 1024  # 1MB chunks
 
-            # Büyük dosyaları chunk'lar halinde kopyala
+            # Büyük dosyaları chunk'lar halinde kopyala; yarım kalan kopya hedefte
+            # görünmesin diye geçici dosyaya yazılır ve sonunda yerine taşınır
             if file_size > chunk_size:
-                with open(src, 'rb') as fsrc:
-                    with open(dst, 'wb') as fdst:
-                        copied = 0
-                        while True:
-                            if self._stop_event.is_set():
-                                raise InterruptError("Kopyalama işlemi kullanıcı tarafından durduruldu")
+                partial = dst + self.PARTIAL_SUFFIX
+                open_start = time.perf_counter()
+                try:
+                    with open(src, 'rb') as fsrc:
+                        # Meta veri okumaya başlamadan önceki stat'tan alınır; kopya
+                        # sırasında kaynak değişirse hedef eski kalır ve yeniden kopyalanır
+                        src_stat = os.fstat(fsrc.fileno())
+                        with open(partial, 'wb') as fdst:
+                            self.stats.record_latency('open', time.perf_counter() - open_start)
+                            copied = 0
+                            while True:
+                                # Durdurma isteği parça sınırlarında denetlenir
+                                if self._stop_event.is_set():
+                                    raise InterruptError("Kopyalama işlemi kullanıcı tarafından durduruldu")
+                                    
+                                chunk = fsrc.read(chunk_size)
+                                if not chunk:
+                                    break
+                                if self.limits is not None:
+                                    self._throttle(len(chunk))
+                                fdst.write(chunk)
+                                copied += len(chunk)
+                                self.transfers.advance(src, copied)
+                                self.stats.advance(len(chunk))
                                 
-                            chunk = fsrc.read(chunk_size)
-                            if not chunk:
-                                break
-                            fdst.write(chunk)
-                            copied += len(chunk)
-                            
-                            if self.status_callback:
-                                progress = (copied / file_size) * 100
-                                self.status_callback(
-                                    f"Kopyalanıyor: {os.path.basename(src)} - %{progress:.1f}",
-                                    progress
-                                )
+                                if self.status_callback:
+                                    progress = (copied / file_size) * 100
+                                    self.status_callback(
+                                        f"Kopyalanıyor: {os.path.basename(src)} - %{progress:.1f}",
+                                        progress
+                                    )
+                    os.replace(partial, dst)
+                except BaseException:
+                    self._discard_partial(partial)
+                    raise
             else:
-                # Küçük dosyaları direkt kopyala
-                shutil.copy2(src, dst)
+                # Küçük dosyaları direkt kopyala (meta veri sonradan toplu uygulanır)
+                if self.limits is not None:
+                    self._throttle(file_size)
+                # Hedef yedekle paylaşılıyorsa geçici dosyaya yazılıp yerine taşınır
+                path = dst + self.PARTIAL_SUFFIX if replace_existing else dst
+                try:
+                    open_start = time.perf_counter()
+                    with open(src, 'rb') as fsrc, open(path, 'wb') as fdst:
+                        self.stats.record_latency('open', time.perf_counter() - open_start)
+                        src_stat = os.fstat(fsrc.fileno())
+                        fdst.write(fsrc.read())
+                    self.stats.advance(file_size)
+                    if replace_existing:
+                        os.replace(path, dst)
+                except BaseException:
+                    if replace_existing:
+                        self._discard_partial(path)
+                    raise
                 if self.status_callback:
                     self.status_callback(f"Kopyalandı: {os.path.basename(src)}", 100)
 
-            # Tarih ve izinleri kopyala
-            shutil.copystat(src, dst)
+            # Tarih ve izinler çalışma sonunda toplu olarak uygulanır
+            self.metadata_stage.add_file(dst, src_stat)
 
             # İstatistikleri güncelle
+            self.stats.incr(bytes_read=file_size, bytes_written=file_size)
             self.stats.update(
                 bytes_copied=file_size,
                 files_copied=1,
                 current_file=os.path.basename(src)
             )
 
-            logging.debug(f"Dosya başarıyla kopyalandı: {src} -> {dst}")
+            if self._should_log_file():
+                logging.debug("Dosya başarıyla kopyalandı: %s -> %s", src, dst)
 
         except PermissionError as e:
             error_msg = f"Dosya erişim izni hatası ({src}): {str(e)}"
@@ -268,12 +404,149 @@ class FileSync:
             })
             raise FileOperationError(error_msg)
 
+    @staticmethod
+    def _discard_partial(partial: str) -> None:
+        """Yarım kalan geçici kopyayı sil"""
+        try:
+            os.remove(partial)
+        except OSError:
+            pass
+
+    def _sweep_partials(self, target: str) -> None:
+        """Önceki bir sürecin zorla sonlandırılmasından kalan yarım kopyaları sil
+
+        Bu süreçteki kesintiler kendi geçici dosyasını siler; bu yüzden hedef
+        süreç başına bir kez taranır. Bu nesne oluşturulduktan sonra yazılmış
+        geçici dosyalar (ör. aynı hedefe yazan başka bir iş) korunur.
+        """
+        if target in self._swept_targets:
+            return
+        self._swept_targets.add(target)
+        removed = 0
+        for root, _, files in os.walk(target):
+            for file in files:
+                if not file.endswith(self.PARTIAL_SUFFIX):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    if os.stat(path).st_mtime < self._created_at:
+                        os.remove(path)
+                        removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logging.info(f"Önceki çalışmadan kalan {removed} yarım kopya silindi: {target}")
+
+    def _init_worker(self) -> None:
+        """Kopyalama işçisi başlangıcı: yapılandırılmışsa önceliği düşür"""
+        lower_thread_priority(self.config.worker_nice, self.config.worker_io_priority)
+
+    def _throttle(self, nbytes: int) -> None:
+        """Genel bant genişliği sınırı için bekle ve bekleme süresini kaydet"""
+        waited = self.limits.throttle(nbytes, self._stop_event)
+        if waited:
+            self.stats.add_phase('throttle', waited)
+
+    def _get_pressure_controller(self) -> Optional[PressureController]:
+        """Yapılandırılmışsa sistem baskısı denetleyicisini döndür (eşikler değişince yenilenir)"""
+        if not self.config.pressure_enabled:
+            self._pressure = None
+            self.stats.pressure_state = 'normal'
+        elif (self._pressure is None or
+              self._pressure.shrink_threshold != self.config.pressure_shrink_threshold or
+              self._pressure.pause_threshold != self.config.pressure_pause_threshold):
+            self._pressure = PressureController(self.config.pressure_shrink_threshold,
+                                                self.config.pressure_pause_threshold,
+                                                on_change=self._on_pressure_change)
+        return self._pressure
+
+    def _on_pressure_change(self, previous: str, state: str) -> None:
+        """Baskı durumu değişimini istatistiklere işle"""
+        self.stats.pressure_state = state
+        if state == 'pause':
+            self.stats.incr(pressure_pauses=1)
+        elif state == 'shrink' and previous == 'normal':
+            self.stats.incr(pressure_shrinks=1)
+
+    def _backup_and_copy(self, src: str, dst: str, needs_backup: bool, size: int = 0) -> None:
+        """İşçi aşaması: gerekiyorsa hedefi yedekle, ardından dosyayı kopyala"""
+        if self._pressure is None and self.limits is None:
+            self._tracked_backup_and_copy(src, dst, needs_backup, size)
+            return
+        # Yuvalar beklenirken aktarım henüz etkin sayılmaz
+        with ExitStack() as stack:
+            if self._pressure is not None:
+                # Baskı altında genel yuvaları tutmamak için önce baskı beklenir
+                wait_start = time.perf_counter()
+                stack.enter_context(self._pressure.slot(self.config.max_threads, self._stop_event))
+                self.stats.add_phase('pressure', time.perf_counter() - wait_start)
+            if self.limits is not None:
+                wait_start = time.perf_counter()
+                stack.enter_context(self.limits.slot(src, dst, stop_event=self._stop_event))
+                # Saat aralığı işlem/s sınırı: kopya ve varsa yedek birer işlem sayılır
+                for _ in range(2 if needs_backup else 1):
+                    self.limits.throttle_op(self._stop_event)
+                self.stats.add_phase('throttle', time.perf_counter() - wait_start)
+            self._tracked_backup_and_copy(src, dst, needs_backup, size)
+
+    def _tracked_backup_and_copy(self, src: str, dst: str, needs_backup: bool, size: int) -> None:
+        # İptalden önce kuyruktan alınmış işler durdurma isteğinde kopyalamadan biter
+        if self._stop_event.is_set():
+            self.transfers.end(src)
+            self.stats.incr(files_cancelled=1)
+            return
+        # active_workers aynı thread'de artırılıp azaltıldığından shard toplamı anlık değeri verir
+        self.stats.incr(files_started=1, active_workers=1)
+        self.transfers.begin(src, size)
+        try:
+            self._run_backup_and_copy(src, dst, needs_backup, size)
+        finally:
+            self.transfers.end(src)
+            self.stats.incr(active_workers=-1)
+
+    def _run_backup_and_copy(self, src: str, dst: str, needs_backup: bool, size: int) -> None:
+        backup_path = None
+        if needs_backup:
+            with self._backup_slots:
+                backup_start = time.perf_counter()
+                backup_path = self.create_backup(dst)
+                backup_duration = time.perf_counter() - backup_start
+                self.stats.record_backup(backup_duration, backup_path is not None)
+                self.stats.record_latency('backup', backup_duration)
+                self.stats.add_phase('backup', backup_duration)
+
+        # Yedekten sonra hedef yerinde kaldıysa (hard link, depo) yerinde yazılmaz
+        replace_existing = backup_path is not None and os.path.exists(dst)
+        copy_start = time.perf_counter()
+        try:
+            self.copy_file(src, dst, replace_existing)
+        except Exception:
+            self.stats.incr(bytes_failed=size)
+            # Hedef yedeğe taşındıysa kopya yarıda kalmış (kesik hedef) olabilir;
+            # eski sürümü her durumda geri koy. Yerinde kalan hedefe dokunulmamıştır.
+            if (backup_path and self.config.backup_mode == 'folder' and
+                    not replace_existing):
+                try:
+                    shutil.copy2(backup_path, dst)
+                    logging.warning("Kopyalama başarısız, önceki sürüm geri yüklendi: %s", dst)
+                except OSError as e:
+                    logging.error("Önceki sürüm geri yüklenemedi (%s): %s", dst, e)
+            raise
+        finally:
+            copy_duration = time.perf_counter() - copy_start
+            self.stats.record_latency('copy', copy_duration)
+            self.stats.add_phase('copy', copy_duration)
+            self.stats.record_file_time(src, copy_duration, size)
+
     def create_backup(self, file_path: str) -> Optional[str]:
         """Dosyanın yedeğini oluştur"""
         if not self.config.backup_enabled:
             return None
             
         try:
+            if self.config.backup_mode == 'store':
+                return self._backup_to_store(file_path)
+
             timestamp = int(time.time())
             backup_dir = Path(file_path).parent / 'backups'
             backup_dir.mkdir(exist_ok=True)
@@ -283,12 +556,15 @@ class FileSync:
             backup_name = f"{file_name}.bak.{timestamp}"
             backup_path = backup_dir / backup_name
             
-            # Dosyayı yedekle
-            shutil.copy2(file_path, backup_path)
-            logging.info(f'Yedek oluşturuldu: {backup_path}')
+            # Dosyayı yedekle: hedef zaten yeniden yazılacağı için kopyalamak
+            # yerine taşı/bağla; yeni kopya boş bir dosyaya yazılır
+            self._move_to_backup(file_path, backup_path)
+            logging.info('Yedek oluşturuldu: %s', backup_path)
             
-            # Eski yedekleri temizle (opsiyonel)
-            self._cleanup_old_backups(backup_dir, file_name)
+            # Kataloğa kaydet ve saklama politikasını uygula
+            catalog = self._get_backup_catalog(backup_dir)
+            catalog.add(file_name, backup_name, backup_path.stat().st_size, timestamp)
+            catalog.apply_retention(file_name, RetentionPolicy.from_config(self.config))
             
             return str(backup_path)
             
@@ -301,87 +577,372 @@ class FileSync:
             })
             return None
 
-    def _cleanup_old_backups(self, backup_dir: Path, file_name: str, max_backups: int = 5):
-        """Eski yedekleri temizle"""
+    def _get_backup_store(self) -> BackupStore:
+        """Yapılandırılmış tekilleştirilmiş yedek deposunu döndür"""
+        # Varsayılan depo hedefin yanındadır; hedefin içinde olsaydı senkronize edilen ağaca karışırdı
+        store_path = (self.config.backup_store_path or
+                      os.path.normpath(os.path.abspath(self._target_root)) + '.backup_store')
+        with self._catalog_lock:
+            if self._backup_store is None or str(self._backup_store.root) != str(Path(store_path)):
+                self._backup_store = BackupStore(store_path)
+            return self._backup_store
+
+    def _backup_to_store(self, file_path: str) -> str:
+        """Dosyanın yeni sürümünü tekilleştirilmiş depoya ekle"""
+        store = self._get_backup_store()
+        key = Path(os.path.relpath(file_path, self._target_root)).as_posix()
+        manifest = store.add_version(file_path, key)
+        self.stats.incr(bytes_read=manifest['size'], bytes_written=manifest['stored_bytes'])
+        store.apply_retention(key, RetentionPolicy.from_config(self.config))
+        logging.info("Yedek depoya eklendi: %s [%s] (yeni veri: %s)",
+                     key, manifest['version'], format_size(manifest['stored_bytes']))
+        return f"{key}@{manifest['version']}"
+
+    def _move_to_backup(self, file_path: str, backup_path: Path) -> None:
+        """Dosyayı kopyalamadan yedek konumuna al (taşı veya hard link)
+
+        hardlink yönteminde hedef yerinde kalır; yeni sürüm geçici dosyaya
+        yazılıp os.replace ile yerine konur, böylece hedef hiçbir an eksik olmaz.
+        """
         try:
-            # Dosyaya ait tüm yedekleri bul
-            backups = list(backup_dir.glob(f"{file_name}.bak.*"))
-            backups.sort(key=lambda x: os.path.getctime(x))
-            
-            # Maksimum yedek sayısını aş if len(backups) > max_backups:
-            if len(backups) > max_backups:
-                # En eski yedekleri sil
-                for old_backup in backups[:-max_backups]:
-                    try:
-                        old_backup.unlink()
-                        logging.debug(f"Eski yedek silindi: {old_backup}")
-                    except Exception as e:
-                        logging.warning(f"Eski yedek silinirken hata: {e}")
-                        
+            if self.config.backup_strategy == 'hardlink':
+                try:
+                    os.link(file_path, backup_path)
+                    return
+                except OSError as e:
+                    # Hard link desteklemeyen dosya sistemlerinde taşımaya dön
+                    if e.errno not in (errno.EPERM, errno.EMLINK, errno.ENOTSUP):
+                        raise
+            os.replace(file_path, backup_path)
+        except OSError as e:
+            # Yedek klasörü farklı bir dosya sistemindeyse kopyalamaya dön
+            if e.errno != errno.EXDEV:
+                raise
+            logging.debug("Yedek farklı dosya sisteminde, kopyalanıyor: %s", backup_path)
+            shutil.copy2(file_path, backup_path)
+            os.unlink(file_path)
+
+    def _get_backup_catalog(self, backup_dir: Path) -> BackupCatalog:
+        """Yedek klasörüne ait kataloğu döndür (gerekirse yükle)"""
+        key = str(backup_dir)
+        with self._catalog_lock:
+            catalog = self._backup_catalogs.get(key)
+            if catalog is None:
+                catalog = BackupCatalog(backup_dir)
+                self._backup_catalogs[key] = catalog
+            return catalog
+
+    def _save_backup_catalogs(self) -> None:
+        """Değişen yedek kataloglarını diske yaz"""
+        with self._catalog_lock:
+            catalogs = list(self._backup_catalogs.values())
+        for catalog in catalogs:
+            catalog.save()
+
+    def _collect_backup_garbage(self) -> None:
+        """Saklama politikası sürüm sildiyse depodaki referanssız parçaları topla"""
+        store = self._backup_store
+        if store is None or not store.gc_pending:
+            return
+        try:
+            store.collect_garbage()
+        except OSError as e:
+            logging.error(f"Yedek deposu temizlenemedi: {str(e)}")
+
+    def _begin_cycle(self) -> float:
+        """Döngü başlangıcını işaretle"""
+        self._cycle_in_progress = True
+        return time.monotonic()
+
+    def _end_cycle(self, cycle_start: float, status: str, source: str, target: str,
+                   error: Optional[str] = None) -> None:
+        """Döngü sonucunu kümülatif sayaçlara, metriklere ve çalışma geçmişine işle"""
+        # Başarısız döngüler de biter; yayıncı ve ETA çalışan döngü sanmasın
+        self.stats.finish()
+        counters = self.stats.counters()
+        buckets = self.stats.latency_buckets()
+        sums = self.stats.latency_sums()
+        with self._catalog_lock:
+            for name, value in counters.items():
+                self.cycle_totals[name] = self.cycle_totals.get(name, 0) + value
+            self._add_latencies(self.latency_totals, self.latency_sum_totals, buckets, sums)
+            self._cycle_in_progress = False
+        self.cycles_total += 1
+        self.last_cycle_duration = time.monotonic() - cycle_start
+        if status == 'success':
+            self.last_cycle_success = time.time()
+        elif status == 'failed':
+            self.cycle_failures_total += 1
+        self._record_run(status, source, target, error)
+
+    def _record_run(self, status: str, source: str, target: str,
+                    error: Optional[str] = None) -> None:
+        """Çalışma raporunu geçmiş deposuna ekle
+
+        Hiçbir dosyanın kopya kuyruğuna girmediği başarılı döngüler yazılmaz
+        (izleme modunda geçmişi doldurmasınlar); sayıları sonraki rapora eklenir.
+        """
+        if status == 'success' and not self.stats.files_queued:
+            self.idle_cycles += 1
+            return
+        try:
+            report = self.stats.to_report()
+            report.update({
+                'end': report['end'] or datetime.now().isoformat(timespec='seconds'),
+                'status': status,
+                'source': source,
+                'target': target,
+                'duration': round(self.last_cycle_duration, 3),
+                'error': error,
+                'job': self.job_name or None,
+                'idle_cycles_before': self.idle_cycles,
+                'quiesce_seconds': (round(self.last_quiesce_time, 3)
+                                    if status == 'interrupted' and self.last_quiesce_time is not None
+                                    else None),
+                'config': asdict(self.config),
+            })
+            self.run_history.append(report)
+            self.idle_cycles = 0
         except Exception as e:
-            logging.error(f"Yedek temizleme hatası: {str(e)}")
+            logging.error(f"Çalışma raporu yazılamadı: {str(e)}")
+
+    def get_cumulative_counters(self) -> Dict[str, float]:
+        """Süreç başından beri toplam sayaçlar (devam eden döngü dahil)"""
+        with self._catalog_lock:
+            totals = dict(self.cycle_totals)
+            in_progress = self._cycle_in_progress
+        if in_progress:
+            for name, value in self.stats.counters().items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+
+    def get_cumulative_latencies(self) -> Tuple[Dict[str, List[int]], Dict[str, float]]:
+        """Süreç başından beri gecikme histogramları ve toplamları (devam eden döngü dahil)"""
+        with self._catalog_lock:
+            buckets = {op: list(values) for op, values in self.latency_totals.items()}
+            sums = dict(self.latency_sum_totals)
+            in_progress = self._cycle_in_progress
+        if in_progress:
+            self._add_latencies(buckets, sums, self.stats.latency_buckets(), self.stats.latency_sums())
+        return buckets, sums
+
+    @staticmethod
+    def _add_latencies(buckets: Dict[str, List[int]], sums: Dict[str, float],
+                       cycle_buckets: Dict[str, List[int]], cycle_sums: Dict[str, float]) -> None:
+        for op, values in cycle_buckets.items():
+            total = buckets.setdefault(op, [0] * len(values))
+            for index, count in enumerate(values):
+                if count:
+                    total[index] += count
+            sums[op] = sums.get(op, 0.0) + cycle_sums.get(op, 0.0)
+
+    def _timed_walk(self, source: str):
+        """os.walk'ı sarmala; klasör listeleme süresini 'walk' aşamasına ekle"""
+        walker = os.walk(source)
+        while True:
+            walk_start = time.perf_counter()
+            entry = next(walker, None)
+            self.stats.add_phase('walk', time.perf_counter() - walk_start)
+            if entry is None:
+                return
+            yield entry
+
+    def _needs_copy(self, source_path: str,
+                    target_path: str) -> Optional[Tuple[os.stat_result, Optional[float]]]:
+        """Kopya gerekiyorsa (kaynak stat, hedef mtime) döndür; gerekmiyorsa None"""
+        # Dosya başına tek stat; filtre ve karşılaştırma aynı sonucu kullanır
+        try:
+            stat_start = time.perf_counter()
+            source_stat = os.stat(source_path)
+            self.stats.record_latency('stat', time.perf_counter() - stat_start)
+        except OSError as e:
+            logging.warning("Dosya bilgisi alınamadı (%s): %s", source_path, e)
+            return None
+
+        if not self.should_copy_file(source_path, source_stat):
+            return None
+
+        try:
+            target_mtime = os.stat(target_path).st_mtime
+        except FileNotFoundError:
+            target_mtime = None
+
+        if target_mtime is None or source_stat.st_mtime > target_mtime:
+            return source_stat, target_mtime
+        return None
+
     def sync_files(self, source: str, target: str) -> None:
-        """Dosyaları senkronize et"""
+        """Dosyaları senkronize et (istenmişse döngü profillenir)"""
+        with self.profiler.capture():
+            self._sync_files(source, target)
+
+    def _sync_files(self, source: str, target: str) -> None:
+        """Senkronizasyon döngüsünün gövdesi"""
+        cycle_start = self._begin_cycle()
+        self.stats.reset()
         try:
             self.validate_paths(source, target)
-            self.stats.reset()
+            self._target_root = target
+            self._sweep_partials(target)
+            if self._backup_slot_count != self.config.backup_threads:
+                # Çalışan işçiler eski semaforu bırakabilsin diye yalnızca ayar değişince yenilenir
+                self._backup_slots = threading.BoundedSemaphore(self.config.backup_threads)
+                self._backup_slot_count = self.config.backup_threads
+            self.metadata_stage.reset()
+            self.transfers.reset()
+            self.filter_engine = filter_engine = FilterEngine.compile(self.config)
+            ignore_tree = (
+                IgnoreTree(source, self.config.ignore_file_name, self._ignore_cache)
+                if self.config.ignore_file_name else None
+            )
+
+            self._get_pressure_controller()
+            tiers = self.scan_tiers if self.config.tiered_scan else None
+            if tiers is not None:
+                tiers.hot_cycles = self.config.hot_subtree_cycles
+                tiers.cold_interval = self.config.cold_scan_interval
+                # Filtreler değişince soğuk alt ağaçlardaki kararlar geçersizleşir;
+                # tarama dışı ayarlar (ör. yedekleme, sınırlar) geçmişi silmez
+                tiers.begin_cycle((source, target, self.config.scan_key()))
 
             # Thread havuzunu oluştur
-            with ThreadPoolExecutor(max_workers=self.config.max_threads) as executor:
-                futures = []
+            with ThreadPoolExecutor(max_workers=self.config.max_threads,
+                                    initializer=self._init_worker) as executor:
+                futures = {}
                 
                 # Tüm dosyaları tara
-                for root, dirs, files in os.walk(source):
+                for root, dirs, files in self._timed_walk(source):
                     if self._stop_event.is_set():
                         break
 
-                    # Klasör filtreleme
-                    dirs[:] = [
-                        d for d in dirs
-                        if any(fnmatch.fnmatch(d, pat.strip())
-                            for pat in self.config.folder_patterns.split(','))
-                    ]
+                    rel_root = '' if root == source else Path(os.path.relpath(root, source)).as_posix()
+                    depth = rel_root.count('/') + 1 if rel_root else 0
+                    rel_prefix = f"{rel_root}/" if rel_root else ''
+                    matcher = ignore_tree.matcher_for(rel_root, files) if ignore_tree else None
 
+                    # Klasör filtreleme; hariç tutulan alt ağaçlara hiç inilmez
+                    if self.config.max_depth and depth >= self.config.max_depth:
+                        dirs[:] = []
+                    else:
+                        dirs[:] = [
+                            d for d in dirs
+                            if filter_engine.match_folder(d) and not (
+                                matcher and ignore_tree.is_ignored(matcher, rel_prefix + d, True))
+                        ]
+
+                    if tiers is not None:
+                        # Yaprak klasörler de kaydedilir; aksi halde her döngü yeni sayılırlar
+                        tier_start = time.perf_counter()
+                        tiers.visit(rel_root, root, dirs)
+                        dirs[:] = [d for d in dirs
+                                   if tiers.should_descend(rel_prefix + d, os.path.join(root, d))]
+                        self.stats.add_phase('walk', time.perf_counter() - tier_start)
+
+                    scanned = 0
+                    queued_bytes = 0
+                    match_time = compare_time = 0.0
+                    submitted = len(futures)
                     for file in files:
                         if self._stop_event.is_set():
                             break
+                        scanned += 1
 
-                        # Dosya filtreleme
-                        if not any(fnmatch.fnmatch(file, pat.strip())
-                                 for pat in self.config.file_patterns.split(',')):
-                            continue
-
-                        # Hariç tutma kontrolü
-                        if any(fnmatch.fnmatch(file, pat.strip())
-                             for pat in self.config.exclude_patterns.split(',')):
-                            logging.debug(f"Dosya hariç tutuldu: {file}")
+                        # İsim ve ignore kuralları (stat gerektirmez)
+                        match_start = time.perf_counter()
+                        # Başka bir senkronizasyonun yarım kopyaları hiç kopyalanmaz
+                        matched = (not file.endswith(self.PARTIAL_SUFFIX) and
+                                   filter_engine.match_name(file) and not (
+                                       matcher and ignore_tree.is_ignored(matcher, rel_prefix + file, False)))
+                        compare_start = time.perf_counter()
+                        match_time += compare_start - match_start
+                        if not matched:
                             continue
 
                         source_path = os.path.join(root, file)
                         rel_path = os.path.relpath(source_path, source)
                         target_path = os.path.join(target, rel_path)
 
-                        if self.should_copy_file(source_path):
-                            if (not os.path.exists(target_path) or
-                                os.path.getmtime(source_path) > os.path.getmtime(target_path)):
-                                
-                                if os.path.exists(target_path):
-                                    self.create_backup(target_path)
-                                    
-                                futures.append(
-                                    executor.submit(self.copy_file, source_path, target_path)
-                                )
+                        check = self._needs_copy(source_path, target_path)
+                        compare_time += time.perf_counter() - compare_start
+                        if check is not None:
+                            source_stat, target_mtime = check
+                            # Yedekleme, tarayıcıyı bekletmemek için işçide
+                            # kopyadan hemen önce yapılır
+                            needs_backup = (self.config.backup_enabled and
+                                            target_mtime is not None)
+                            # İşçi begin() çağırmadan önce sırada görünmeli
+                            self.transfers.queue(source_path, source_stat.st_size)
+                            future = executor.submit(self._backup_and_copy, source_path,
+                                                     target_path, needs_backup, source_stat.st_size)
+                            futures[future] = source_path
+                            queued_bytes += source_stat.st_size
+                            self.metadata_stage.add_tree_path(
+                                source, target, os.path.relpath(root, source)
+                            )
+
+                    # Sayaçlar klasör başına bir kez güncellenir
+                    queued = len(futures) - submitted
+                    if tiers is not None and queued:
+                        tiers.mark_changed(rel_root)
+                    self.stats.incr(files_scanned=scanned, files_skipped=scanned - queued,
+                                    files_queued=queued, bytes_queued=queued_bytes)
+                    self.stats.add_phase('match', match_time)
+                    self.stats.add_phase('compare', compare_time)
+
+                self.stats.scan_complete = True
+                self.stats.notify()
+                if tiers is not None:
+                    self.stats.incr(subtrees_skipped=tiers.skipped)
+                    logging.debug("Sıcak/soğuk tarama: %d sıcak klasör, %d alt ağaç atlandı, %d yükseltildi",
+                                  tiers.hot_count(), tiers.skipped, tiers.promoted)
 
                 # İşlemleri takip et ve hataları yakala
+                drain_start = time.perf_counter()
+                last_progress_log = time.monotonic()
+                cancelled = False
+                interrupted = 0
                 for future in as_completed(futures):
+                    # Durdurulunca kuyruktaki işler başlamadan iptal edilir; çalışanlar
+                    # parça sınırında kesildikçe as_completed buraya döner
+                    if not cancelled and self._stop_event.is_set():
+                        self._cancel_pending(futures)
+                        cancelled = True
+                    if future.cancelled():
+                        continue
+                    if time.monotonic() - last_progress_log >= self.PROGRESS_LOG_INTERVAL:
+                        last_progress_log = time.monotonic()
+                        logging.info(f"İlerleme: {self.stats.snapshot().format_status()}")
                     try:
                         future.result()
+                    except InterruptError:
+                        interrupted += 1
                     except Exception as e:
-                        logging.error(f"Dosya kopyalama hatası: {str(e)}")
-                        if not isinstance(e, InterruptError):
-                            self.send_error_notification(str(e))
-                            if self.status_callback:
-                                self.status_callback(f"Hata: {str(e)}")
+                        logging.error("Dosya kopyalama hatası: %s", e)
+                        self.stats.incr(files_failed=1)
+                        self.stats.record_error(futures[future], str(e))
+                        self.transfers.fail(futures[future], str(e))
+                        # copy_file kendi hatalarını zaten bildirir
+                        if not isinstance(e, (FileOperationError, PermissionError)):
+                            self.send_error_notification(str(e), {'Kaynak Dosya': futures[future]})
+                        if self.status_callback:
+                            self.status_callback(f"Hata: {str(e)}")
+
+                self.stats.add_phase('drain', time.perf_counter() - drain_start)
+                # İptal edilen işler hiç başlamadığından sıradakiler listesinde kalır
+                self.transfers.reset()
+
+            if self._stop_event.is_set():
+                self._report_quiesce(interrupted)
+                raise InterruptError("Senkronizasyon kullanıcı tarafından durduruldu")
+
+            # Tarih ve izinleri toplu olarak uygula
+            with self.stats.phase('metadata'):
+                self.metadata_stage.apply()
+                self._save_backup_catalogs()
+                self._collect_backup_garbage()
+            self.stats.filter_hits = filter_engine.hit_counts()
+            if ignore_tree:
+                self.stats.filter_hits['ignore_file'] = ignore_tree.hits
 
             # İstatistikleri güncelle
             self.stats.complete()
@@ -389,17 +950,31 @@ class FileSync:
             # Özet log
             summary = self.stats.get_summary()
             logging.info(summary)
+            logging.info(f"Gecikmeler: {self.stats.snapshot().format_latencies()}")
             if self.status_callback:
                 self.status_callback(f"Senkronizasyon tamamlandı: {summary}")
+            self._end_cycle(cycle_start, 'success', source, target)
 
         except InterruptError:
+            # Tamamlanan kopyaların meta verisi yine de uygulanmalı
+            self.metadata_stage.apply()
+            self._save_backup_catalogs()
             logging.info("Senkronizasyon kullanıcı tarafından durduruldu")
             if self.status_callback:
                 self.status_callback("Senkronizasyon durduruldu")
+            self._end_cycle(cycle_start, 'interrupted', source, target)
             raise
 
         except Exception as e:
             error_msg = f'Senkronizasyon hatası: {str(e)}'
+            # Kopyalanmış dosyalar kopyalama zamanını tarih olarak taşımasın;
+            # alınan yedekler kataloğa yazılsın
+            try:
+                self.metadata_stage.apply()
+                self._save_backup_catalogs()
+            except Exception as meta_error:
+                logging.error(f"Meta veri uygulanamadı: {str(meta_error)}")
+            self._end_cycle(cycle_start, 'failed', source, target, error_msg)
             logging.error(error_msg)
             self.send_error_notification(error_msg, {
                 'Kaynak Klasör': source,
@@ -408,6 +983,17 @@ class FileSync:
             })
             raise SyncError(error_msg)
 
+    def _cancel_pending(self, futures: Dict) -> None:
+        """Henüz başlamamış kopyaları iptal et"""
+        self.stats.incr(files_cancelled=sum(1 for future in futures if future.cancel()))
+
+    def _report_quiesce(self, interrupted: int) -> None:
+        """Durdurma isteğinden tüm işçilerin boşalmasına kadar geçen süreyi kaydet"""
+        requested_at = self._stop_requested_at or time.monotonic()
+        self.last_quiesce_time = time.monotonic() - requested_at
+        logging.info(f"İşçiler {self.last_quiesce_time:.2f} sn içinde durdu "
+                     f"(iptal edilen: {self.stats.files_cancelled}, yarıda kesilen: {interrupted})")
+
     def start(self, source: str, target: str) -> None:
         """Senkronizasyonu başlat"""
         if self.is_running:
@@ -416,12 +1002,13 @@ class FileSync:
 
         self.is_running = True
         self._stop_event.clear()
+        self.start_metrics_server()
         
         try:
             self.sync_thread = threading.Thread(
                 target=self._sync_worker,
                 args=(source, target),
-                name="SyncThread"
+                name=f"SyncThread-{self.job_name}" if self.job_name else "SyncThread"
             )
             self.sync_thread.daemon = True
             self.sync_thread.start()
@@ -432,13 +1019,49 @@ class FileSync:
             self.send_error_notification(error_msg)
             raise ThreadError(error_msg)
 
+    def subscribe(self, callback: Callable[[StatsSnapshot], None],
+                  interval: float = 1.0) -> Callable[[], None]:
+        """İstatistik değiştikçe en fazla `interval` saniyede bir anlık görüntü al
+
+        Geri çağrı yayıncı thread'inde çalışır. Dönen fonksiyon aboneliği iptal eder.
+        """
+        return self._publisher.subscribe(callback, interval)
+
+    def start_metrics_server(self) -> None:
+        """Yapılandırılmışsa Prometheus metrik sunucusunu başlat (işlerde yönetici sunar)"""
+        if self.managed or not self.config.metrics_enabled or self.metrics_server is not None:
+            return
+        try:
+            # http.server yalnızca metrikler açıksa yüklenir (başlangıç süresi)
+            from .metrics_server import MetricsServer, render_metrics
+            self.metrics_server = MetricsServer(
+                functools.partial(render_metrics, self),
+                self.config.metrics_host, self.config.metrics_port
+            )
+            self.metrics_server.start()
+        except OSError as e:
+            self.metrics_server = None
+            logging.error(f"Metrik sunucusu başlatılamadı: {str(e)}")
+
+    def stop_metrics_server(self) -> None:
+        """Metrik sunucusunu kapat"""
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
+    def request_stop(self) -> None:
+        """Devam eden döngüyü beklemeden durdurma isteği gönder (sinyal güvenli)"""
+        if not self._stop_event.is_set():
+            self._stop_requested_at = time.monotonic()
+        self._stop_event.set()
+        self.is_running = False
+
     def stop(self) -> None:
         """Senkronizasyonu durdur"""
-        if not self.is_running:
+        if not self.is_running and not (self.sync_thread and self.sync_thread.is_alive()):
             return
             
-        self._stop_event.set()
-        self.is_running = False
+        self.request_stop()
         
         if self.sync_thread and self.sync_thread.is_alive():
             try:
@@ -450,8 +1073,43 @@ class FileSync:
                 logging.error(error_msg)
                 self.send_error_notification(error_msg)
                 
+        self._shutdown_services()
         self._stop_event.clear()
 
+    def close(self) -> None:
+        """Senkronizasyonu durdur ve arka plan servislerini kapat (bekleyen bildirimler gönderilir)"""
+        self.stop()
+        self._shutdown_services()
+
+    def _shutdown_services(self) -> None:
+        self.stop_metrics_server()
+        self.notifier.stop()
+        if self._email_service is not None:
+            self._email_service.close()
+            self._email_service = None
+
+    def _next_interval(self, changed: bool) -> float:
+        """Sonraki döngüye kadar beklenecek süre
+
+        Uyarlanır modda değişiklik bulunmayan döngülerden sonra aralık üstel
+        olarak uzar, değişiklik bulununca en kısa aralığa döner.
+        """
+        if not self.config.adaptive_interval:
+            self.current_interval = float(self.config.check_interval)
+            return self.current_interval
+
+        minimum = self.config.min_check_interval
+        maximum = self.config.max_check_interval
+        if changed:
+            interval = minimum
+        else:
+            interval = min(maximum, max(minimum, self.current_interval * self.INTERVAL_BACKOFF))
+        if interval != self.current_interval:
+            logging.info(f"Kontrol aralığı {self.current_interval:g} -> {interval:g} sn "
+                         f"({'değişiklik bulundu' if changed else 'değişiklik yok'})")
+        self.current_interval = float(interval)
+        return self.current_interval
+
     def _sync_worker(self, source: str, target: str) -> None:
         """Senkronizasyon worker thread'i"""
         try:
@@ -460,8 +1118,9 @@ class FileSync:
                     self.sync_files(source, target)
                     
                     # Kontrol aralığı kadar bekle
+                    interval = self._next_interval(self.stats.files_queued > 0)
                     wait_start = time.time()
-                    while (time.time() - wait_start < self.config.check_interval and 
+                    while (time.time() - wait_start < interval and 
                            not self._stop_event.is_set()):
                         time.sleep(0.1)  # Küçük aralıklarla kontrol et
                         
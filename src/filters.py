@@ -0,0 +1,137 @@
+"""
+Derlenmiş dosya filtre motoru
+"""
+
+import os
+import re
+import time
+import fnmatch
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Pattern
+
+
+def compile_patterns(patterns: str) -> Optional[Pattern]:
+    """Virgülle ayrılmış glob desenlerini tek bir düzenli ifadeye derle"""
+    parts = [
+        fnmatch.translate(os.path.normcase(pat.strip()))
+        for pat in patterns.split(',')
+        if pat.strip()
+    ]
+    if not parts:
+        return None
+    return re.compile('|'.join(f'(?:{part})' for part in parts))
+
+
+@dataclass
+class FilterRule:
+    """Tek bir filtre kuralı; predicate False dönerse dosya elenir"""
+    name: str
+    cost: int
+    needs_stat: bool
+    predicate: Callable
+    hits: int = 0
+
+
+class FilterEngine:
+    """Çalışma başına bir kez derlenen, ucuzdan pahalıya sıralı filtre zinciri"""
+
+    def __init__(self, rules: List[FilterRule], folder_regex: Optional[Pattern] = None):
+        rules = sorted(rules, key=lambda rule: rule.cost)
+        self._name_rules = [rule for rule in rules if not rule.needs_stat]
+        self._stat_rules = [rule for rule in rules if rule.needs_stat]
+        self._folder_regex = folder_regex
+        self.folder_hits = 0
+
+    @property
+    def needs_stat(self) -> bool:
+        return bool(self._stat_rules)
+
+    @classmethod
+    def compile(cls, config, now: Optional[float] = None) -> 'FilterEngine':
+        """Yapılandırmadaki tüm kuralları derle"""
+        now = now if now is not None else time.time()
+        rules: List[FilterRule] = []
+
+        include = compile_patterns(config.file_patterns)
+        if include is not None:
+            rules.append(FilterRule('file_patterns', 1, False,
+                                    lambda name: include.match(name) is not None))
+
+        exclude = compile_patterns(config.exclude_patterns)
+        if exclude is not None:
+            rules.append(FilterRule('exclude_patterns', 1, False,
+                                    lambda name: exclude.match(name) is None))
+
+        if config.min_file_size > 0:
+            min_size = config.min_file_size
+            rules.append(FilterRule('min_file_size', 2, True,
+                                    lambda st: st.st_size >= min_size))
+
+        if config.max_file_size > 0:
+            max_size = config.max_file_size
+            rules.append(FilterRule('max_file_size', 2, True,
+                                    lambda st: st.st_size <= max_size))
+
+        if config.date_filter_enabled:
+            if config.start_date:
+                try:
+                    start_ts = datetime.strptime(config.start_date, '%Y-%m-%d').timestamp()
+                    rules.append(FilterRule('start_date', 3, True,
+                                            lambda st: st.st_mtime >= start_ts))
+                except ValueError as e:
+                    logging.error(f"Başlangıç tarihi format hatası: {e}")
+
+            if config.end_date:
+                try:
+                    end_date = datetime.strptime(config.end_date, '%Y-%m-%d')
+                    end_ts = end_date.replace(hour=23, minute=59, second=59,
+                                              microsecond=999999).timestamp()
+                    rules.append(FilterRule('end_date', 3, True,
+                                            lambda st: st.st_mtime <= end_ts))
+                except ValueError as e:
+                    logging.error(f"Bitiş tarihi format hatası: {e}")
+
+        if config.min_age_minutes > 0:
+            newest = now - config.min_age_minutes * 60
+            rules.append(FilterRule('min_age', 3, True,
+                                    lambda st: st.st_mtime <= newest))
+
+        if config.max_age_minutes > 0:
+            oldest = now - config.max_age_minutes * 60
+            rules.append(FilterRule('max_age', 3, True,
+                                    lambda st: st.st_mtime >= oldest))
+
+        return cls(rules, compile_patterns(config.folder_patterns))
+
+    def match_folder(self, name: str) -> bool:
+        """Klasörün taranıp taranmayacağını kontrol et"""
+        if self._folder_regex is None or self._folder_regex.match(os.path.normcase(name)):
+            return True
+        self.folder_hits += 1
+        return False
+
+    def match_name(self, name: str) -> bool:
+        """Stat gerektirmeyen kuralları uygula (max_depth taramada klasör budanarak uygulanır)"""
+        name = os.path.normcase(name)
+        for rule in self._name_rules:
+            if not rule.predicate(name):
+                rule.hits += 1
+                return False
+        return True
+
+    def match_stat(self, st: os.stat_result) -> bool:
+        """Önceden alınmış stat bilgisiyle kalan kuralları uygula"""
+        for rule in self._stat_rules:
+            if not rule.predicate(st):
+                rule.hits += 1
+                return False
+        return True
+
+    def hit_counts(self) -> Dict[str, int]:
+        """Her kuralın elediği dosya sayısını döndür"""
+        counts = {rule.name: rule.hits for rule in self._name_rules + self._stat_rules}
+        if self._folder_regex is not None:
+            counts['folder_patterns'] = self.folder_hits
+        return counts
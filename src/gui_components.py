@@ -117,12 +117,145 @@ class StatusBar(ttk.Frame):
         self.status_var.set(message)
         if progress is not None:
             self.progress['value'] = progress
-        self.update_idletasks()
         
     def update_stats(self, stats_message: str):
         """İstatistikleri güncelle"""
         self.stats_var.set(stats_message)
-        self.update_idletasks()
+
+class VirtualTreeview(ttk.Frame):
+    """Yalnızca görünen satırları çizen Treeview
+
+    Veri listesinin tamamı bellekte tutulur; Treeview'da hiçbir zaman
+    `height` kadar satırdan fazlası bulunmaz. Kaydırma çubuğu bir ofseti
+    değiştirir ve görünen satırların değerleri yeniden yazılır.
+    """
+    def __init__(self, parent, columns, height: int = 8, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.rows = []
+        self.format_row: Optional[Callable] = None
+        self.offset = 0
+        self.visible = height
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in columns], show='headings',
+                                 height=height, selectmode='none')
+        for name, heading, width, anchor in columns:
+            self.tree.heading(name, text=heading)
+            self.tree.column(name, width=width, anchor=anchor, stretch=(name == columns[0][0]))
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scroll)
+
+        self.tree.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+        self.scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+
+        self.tree.bind('<MouseWheel>', lambda e: self._scroll_by(-1 if e.delta > 0 else 1))
+        self.tree.bind('<Button-4>', lambda e: self._scroll_by(-1))
+        self.tree.bind('<Button-5>', lambda e: self._scroll_by(1))
+        self._items = []
+
+    def set_rows(self, rows, format_row: Optional[Callable] = None) -> None:
+        """Tüm veriyi değiştir ve görünen pencereyi yeniden çiz
+
+        format_row verilirse satırlar ham veri kabul edilir ve yalnızca
+        görünen pencere biçimlendirilir.
+        """
+        self.rows = rows
+        self.format_row = format_row
+        self.offset = max(0, min(self.offset, len(rows) - self.visible))
+        self._render()
+
+    def _scroll_by(self, delta: int) -> None:
+        self._set_offset(self.offset + delta)
+
+    def _set_offset(self, offset: int) -> None:
+        offset = max(0, min(offset, len(self.rows) - self.visible))
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _on_scroll(self, action, value, unit=None) -> None:
+        if action == tk.MOVETO:
+            self._set_offset(int(float(value) * len(self.rows)))
+        elif action == tk.SCROLL:
+            step = self.visible if unit == tk.PAGES else 1
+            self._scroll_by(int(value) * step)
+
+    def _render(self) -> None:
+        window = self.rows[self.offset:self.offset + self.visible]
+        if self.format_row is not None:
+            window = [self.format_row(row) for row in window]
+        # Satır öğeleri yeniden kullanılır; yalnızca değerleri güncellenir
+        while len(self._items) < len(window):
+            self._items.append(self.tree.insert('', tk.END))
+        while len(self._items) > len(window):
+            self.tree.delete(self._items.pop())
+        for item, values in zip(self._items, window):
+            self.tree.item(item, values=values)
+
+        total = len(self.rows)
+        if total > self.visible:
+            self.scrollbar.set(self.offset / total, (self.offset + len(window)) / total)
+        else:
+            self.scrollbar.set(0, 1)
+
+class TransfersPanel(ttk.LabelFrame):
+    """Devam eden ve sıradaki aktarımlar ile son hatalar paneli"""
+    def __init__(self, parent, **kwargs):
+        super().__init__(parent, text="Aktarımlar", padding="5", **kwargs)
+
+        self.transfers = VirtualTreeview(self, (
+            ('file', 'Dosya', 320, tk.W),
+            ('size', 'Boyut', 80, tk.E),
+            ('percent', '%', 60, tk.E),
+            ('speed', 'Hız', 90, tk.E),
+        ), height=6)
+        self.transfers.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.errors_label = ttk.Label(self, text="Son Hatalar")
+        self.errors_label.grid(row=1, column=0, sticky=tk.W, pady=(5, 0))
+        self.errors = VirtualTreeview(self, (
+            ('file', 'Dosya', 250, tk.W),
+            ('time', 'Zaman', 70, tk.W),
+            ('error', 'Hata', 300, tk.W),
+        ), height=4)
+        self.errors.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(0, weight=1)
+        self._newest_error = ()
+
+    def update_view(self, view, format_size: Callable[[float], str]) -> None:
+        """ProgressAggregator'ın periyot görüntüsünü göster"""
+        self.update_transfers(view.active, view.queued, format_size)
+        self.update_errors(view.errors)
+
+    def update_transfers(self, active, queued, format_size: Callable[[float], str]) -> None:
+        """Aktif aktarımları, ardından sıradakileri göster
+
+        Sıradaki liste on binlerce girdi olabilir; yalnızca görünen satırlar
+        biçimlendirilir.
+        """
+        def format_row(entry):
+            if isinstance(entry, tuple):
+                path, size = entry
+                return (Path(path).name, format_size(size), "sırada", "")
+            return (Path(entry.path).name, format_size(entry.size), f"{entry.percent:.0f}",
+                    f"{format_size(entry.speed)}/s")
+
+        self.config(text=f"Aktarımlar ({len(active)} aktif, {len(queued)} sırada)")
+        self.transfers.set_rows(active + queued, format_row)
+
+    def update_errors(self, errors) -> None:
+        """Son hataları göster (değişmediyse yeniden çizme)"""
+        newest = errors[0] if errors else None
+        if newest is self._newest_error:
+            return
+        self._newest_error = newest
+        self.errors_label.config(text=f"Son Hatalar ({len(errors)})")
+        self.errors.set_rows([
+            (Path(path).name, when.strftime('%H:%M:%S'), message)
+            for when, path, message in errors
+        ])
 
 class AboutDialog(tk.Toplevel):
     """Hakkında dialog penceresi"""
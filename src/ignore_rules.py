@@ -0,0 +1,179 @@
+"""
+Hiyerarşik .syncignore dosyaları (gitignore benzeri kurallar)
+"""
+
+import os
+import re
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Pattern, Tuple
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    """Derlenmiş tek bir ignore kuralı"""
+    regex: Pattern
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob desenini düzenli ifadeye çevir ('/' ile sınırlı joker karakterler)"""
+    result = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if c == '*':
+            if pattern.startswith('**/', i):
+                result.append('(?:.*/)?')
+                i += 3
+                continue
+            if pattern.startswith('**', i):
+                result.append('.*')
+                i += 2
+                continue
+            result.append('[^/]*')
+        elif c == '?':
+            result.append('[^/]')
+        elif c == '[':
+            j = i + 1
+            if j < n and pattern[j] in '!^':
+                j += 1
+            if j < n and pattern[j] == ']':
+                j += 1
+            while j < n and pattern[j] != ']':
+                j += 1
+            if j >= n:
+                result.append('\\[')
+            else:
+                stuff = pattern[i + 1:j].replace('\\', '\\\\')
+                if stuff[0] in '!^':
+                    stuff = '^' + stuff[1:]
+                result.append(f'[{stuff}]')
+                i = j
+        elif c == '\\' and i + 1 < n:
+            i += 1
+            result.append(re.escape(pattern[i]))
+        else:
+            result.append(re.escape(c))
+        i += 1
+    return ''.join(result)
+
+
+def parse_ignore_lines(lines: List[str]) -> List[IgnoreRule]:
+    """Ignore dosyası satırlarını kurallara derle"""
+    rules = []
+    for line in lines:
+        line = line.rstrip('\r\n')
+        if not line.strip() or line.startswith('#'):
+            continue
+        if not line.endswith('\\ '):
+            line = line.rstrip(' ')
+
+        negate = line.startswith('!')
+        if negate:
+            line = line[1:]
+
+        dir_only = line.endswith('/')
+        line = line.rstrip('/')
+        if not line:
+            continue
+
+        # Ortasında '/' bulunan desenler ignore dosyasının klasörüne sabitlenir
+        anchored = '/' in line
+        body = _translate(line.lstrip('/'))
+        if not anchored:
+            body = '(?:.*/)?' + body
+
+        try:
+            rules.append(IgnoreRule(re.compile(body, re.DOTALL), negate, dir_only))
+        except re.error as e:
+            logging.warning(f"Geçersiz ignore deseni atlandı ({line}): {e}")
+    return rules
+
+
+class IgnoreFileCache:
+    """Ignore dosyalarını çalışmalar arasında değişiklik zamanına göre önbellekler"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[int, List[IgnoreRule]]] = {}
+
+    def get(self, path: str) -> List[IgnoreRule]:
+        """Dosya değişmediyse önbellekteki kuralları döndür"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self._entries.pop(path, None)
+            return []
+
+        cached = self._entries.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                rules = parse_ignore_lines(f.readlines())
+        except OSError as e:
+            logging.warning(f"Ignore dosyası okunamadı ({path}): {e}")
+            rules = []
+        self._entries[path] = (mtime_ns, rules)
+        logging.debug(f"Ignore dosyası yüklendi: {path} ({len(rules)} kural)")
+        return rules
+
+
+class IgnoreMatcher:
+    """Bir klasör için geçerli (üst klasörlerden devralınan) kuralların düz listesi"""
+
+    def __init__(self, rules: List[Tuple[str, IgnoreRule]]):
+        self.rules = rules
+
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """Kaynak köke göre göreli yolun hariç tutulup tutulmadığını kontrol et"""
+        ignored = False
+        # Son eşleşen kural kazanır; alt klasör kuralları üst klasörlerinkinden sonra gelir
+        for prefix, rule in self.rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if ignored != rule.negate:
+                continue
+            if prefix:
+                if not rel_path.startswith(prefix):
+                    continue
+                candidate = rel_path[len(prefix):]
+            else:
+                candidate = rel_path
+            if rule.regex.fullmatch(candidate):
+                ignored = not rule.negate
+        return ignored
+
+
+class IgnoreTree:
+    """Bir tarama boyunca klasör başına ignore eşleştiricilerini oluşturur"""
+
+    def __init__(self, source: str, file_name: str, cache: IgnoreFileCache):
+        self.source = source
+        self.file_name = file_name
+        self.cache = cache
+        self.hits = 0
+        self._matchers: Dict[str, IgnoreMatcher] = {}
+
+    def matcher_for(self, rel_dir: str, files: List[str]) -> IgnoreMatcher:
+        """Klasörün eşleştiricisini üst klasörünkünden türet"""
+        parent = self._matchers.get(rel_dir.rpartition('/')[0]) if rel_dir else None
+        rules = list(parent.rules) if parent else []
+
+        if self.file_name in files:
+            path = os.path.join(self.source, rel_dir, self.file_name)
+            prefix = f"{rel_dir}/" if rel_dir else ''
+            rules.extend((prefix, rule) for rule in self.cache.get(path))
+
+        matcher = parent if parent and len(rules) == len(parent.rules) else IgnoreMatcher(rules)
+        self._matchers[rel_dir] = matcher
+        return matcher
+
+    def is_ignored(self, matcher: IgnoreMatcher, rel_path: str, is_dir: bool) -> bool:
+        """Eşleştiriciyi uygula ve hariç tutulanları say"""
+        if matcher.rules and matcher.is_ignored(rel_path, is_dir):
+            self.hits += 1
+            return True
+        return False
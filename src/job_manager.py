@@ -0,0 +1,183 @@
+"""
+Birden çok adlandırılmış senkronizasyon işini ortak kaynak sınırlarıyla çalıştırma
+
+config.ini içindeki her [job:AD] bölümü bir iştir. Bölümde bulunmayan ayarlar
+DEFAULT'tan gelir; global_max_threads, global_max_bytes_per_second ve
+device_max_concurrency yalnızca DEFAULT'tan okunur ve tüm işler arasında
+paylaşılır:
+
+    [DEFAULT]
+    global_max_threads = 8
+    global_max_bytes_per_second = 52428800
+
+    [job:raporlar]
+    source = /data/raporlar
+    target = /yedek/raporlar
+    check_interval = 30
+
+Loglama ve metrik sunucusu (metrics_enabled/metrics_host/metrics_port)
+DEFAULT'tan bir kez kurulur; metriklerde her seri job="AD" etiketini taşır.
+"""
+
+import logging
+import functools
+import threading
+import configparser
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from .file_sync import FileSync, configure_logging
+from .sync_config import SyncConfig
+from .run_history import RunHistory
+from .throttle import SharedLimits
+from .exceptions import ConfigError, InterruptError, SyncError
+
+JOB_SECTION_PREFIX = 'job:'
+
+
+@dataclass
+class SyncJob:
+    """Yapılandırmadaki tek bir senkronizasyon işi"""
+    name: str
+    source: str
+    target: str
+    config: SyncConfig
+
+
+def load_jobs(config_path: str = 'config.ini') -> List[SyncJob]:
+    """[job:AD] bölümlerinden etkin işleri yükle"""
+    parser = configparser.ConfigParser()
+    try:
+        parser.read(config_path, encoding='utf-8')
+    except configparser.Error as e:
+        raise ConfigError(f"Yapılandırma yükleme hatası: {str(e)}")
+
+    jobs = []
+    for section in parser.sections():
+        if not section.startswith(JOB_SECTION_PREFIX):
+            continue
+        name = section[len(JOB_SECTION_PREFIX):].strip()
+        try:
+            if not parser.getboolean(section, 'enabled', fallback=True):
+                continue
+            source = parser.get(section, 'source', fallback='')
+            target = parser.get(section, 'target', fallback='')
+            config = SyncConfig.from_section(parser, section)
+        except (ValueError, configparser.Error) as e:
+            raise ConfigError(f"'{name}' işi yapılandırma hatası: {str(e)}")
+        if not name or not source or not target:
+            raise ConfigError(f"'{section}' bölümünde iş adı, source ve target zorunludur")
+        jobs.append(SyncJob(name, source, target, config))
+    return jobs
+
+
+class JobManager:
+    """Her iş için bir FileSync çalıştırır; işler ortak sınırları paylaşır"""
+
+    def __init__(self, config_path: str = 'config.ini'):
+        self.config_path = config_path
+        self.config = SyncConfig.from_file(config_path)
+        self.jobs = load_jobs(config_path)
+        if not self.jobs:
+            raise ConfigError(f"Yapılandırmada etkin [{JOB_SECTION_PREFIX}...] bölümü yok")
+
+        configure_logging(self.config)
+        self.limits = SharedLimits.from_config(self.config)
+        self.run_history = RunHistory()
+        self.metrics_server = None
+        self.syncs: Dict[str, FileSync] = {}
+        for job in self.jobs:
+            file_sync = FileSync(config_path, job.config, job.name, self.limits, managed=True)
+            # Aynı geçmiş dosyasına tek kilit üzerinden yazılır
+            file_sync.run_history = self.run_history
+            self.syncs[job.name] = file_sync
+
+        logging.info(f"{len(self.jobs)} iş yüklendi: {', '.join(job.name for job in self.jobs)} "
+                     f"(genel sınırlar: thread={self.config.global_max_threads or '-'}, "
+                     f"bayt/s={self.config.global_max_bytes_per_second or '-'}, "
+                     f"aygıt başına={self.config.device_max_concurrency or '-'})")
+
+    def start(self) -> None:
+        """Tüm işleri kendi check_interval aralıklarıyla başlat"""
+        self.start_metrics_server()
+        for job in self.jobs:
+            self.syncs[job.name].start(job.source, job.target)
+
+    def run_once(self) -> Dict[str, Optional[str]]:
+        """Her iş için tek döngüyü eşzamanlı çalıştır; iş adı -> hata (başarılıysa None)"""
+        results: Dict[str, Optional[str]] = {}
+
+        def run(job: SyncJob) -> None:
+            file_sync = self.syncs[job.name]
+            try:
+                file_sync.sync_files(job.source, job.target)
+                results[job.name] = (f"{file_sync.stats.files_failed} dosya başarısız"
+                                     if file_sync.stats.files_failed else None)
+            except InterruptError:
+                results[job.name] = "Durduruldu"
+            except SyncError as e:
+                results[job.name] = str(e)
+
+        threads = [threading.Thread(target=run, args=(job,), name=f"Job-{job.name}")
+                   for job in self.jobs]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def start_metrics_server(self) -> None:
+        """Yapılandırılmışsa tüm işleri sunan tek metrik sunucusunu başlat"""
+        if not self.config.metrics_enabled or self.metrics_server is not None:
+            return
+        try:
+            from .metrics_server import MetricsServer, render_job_metrics
+            self.metrics_server = MetricsServer(
+                functools.partial(render_job_metrics, self.syncs),
+                self.config.metrics_host, self.config.metrics_port
+            )
+            self.metrics_server.start()
+        except OSError as e:
+            self.metrics_server = None
+            logging.error(f"Metrik sunucusu başlatılamadı: {str(e)}")
+
+    def stop_metrics_server(self) -> None:
+        """Metrik sunucusunu kapat"""
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+            self.metrics_server = None
+
+    def is_alive(self) -> bool:
+        """Çalışan en az bir iş thread'i var mı"""
+        return any(file_sync.sync_thread is not None and file_sync.sync_thread.is_alive()
+                   for file_sync in self.syncs.values())
+
+    def reload_config(self) -> None:
+        """İş ayarlarını yeniden yükle (sınırlar ve iş listesi yeniden başlatınca değişir)"""
+        jobs = {job.name: job for job in load_jobs(self.config_path)}
+        for job in jobs.values():
+            job.config.validate()
+        for name, file_sync in self.syncs.items():
+            if name in jobs:
+                file_sync.apply_config(jobs[name].config)
+            else:
+                logging.warning(f"'{name}' işi yapılandırmadan kaldırılmış; yeniden başlatınca durur")
+        for name in jobs.keys() - self.syncs.keys():
+            logging.warning(f"Yeni '{name}' işi yeniden başlatınca çalışır")
+
+    def request_stop(self) -> None:
+        """Tüm işlere durdurma isteği gönder (sinyal güvenli)"""
+        for file_sync in self.syncs.values():
+            file_sync.request_stop()
+
+    def stop(self) -> None:
+        """Tüm işleri durdur"""
+        self.request_stop()
+        for file_sync in self.syncs.values():
+            file_sync.stop()
+
+    def close(self) -> None:
+        """İşleri durdur ve arka plan servislerini kapat"""
+        for file_sync in self.syncs.values():
+            file_sync.close()
+        self.stop_metrics_server()
@@ -0,0 +1,72 @@
+"""
+Kuyruk tabanlı loglama: kayıtlar çağıran thread'de yalnızca kuyruğa atılır,
+biçimlendirme ve yazma ayrı bir dinleyici thread'inde yapılır
+"""
+
+import atexit
+import queue
+import logging
+import threading
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+_listener: Optional[QueueListener] = None
+_handler: Optional[QueueHandler] = None
+_listener_lock = threading.Lock()
+
+
+class LazyQueueHandler(QueueHandler):
+    """Kaydı biçimlendirmeden kuyruğa atan QueueHandler
+
+    Standart QueueHandler.prepare() mesajı çağıran thread'de biçimlendirir;
+    aynı süreç içinde kalan kayıtlar için buna gerek yoktur. Yalnızca
+    istisna/stack bilgisi taşıyan kayıtlar, traceback nesneleri thread'ler
+    arasında taşınmasın diye hemen biçimlendirilir.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.exc_info or record.stack_info:
+            return super().prepare(record)
+        return record
+
+
+def queue_logging_active(logger: logging.Logger) -> bool:
+    """Dinleyici çalışıyor ve logger kuyruk handler'ına bağlı mı"""
+    return _listener is not None and _handler in logger.handlers
+
+
+def start_queue_logging(logger: logging.Logger, *handlers: logging.Handler) -> QueueHandler:
+    """Handler'ları dinleyici thread'ine taşı ve logger'a kuyruk handler'ını ekle
+
+    Süreçte tek dinleyici çalışır; zaten etkinse verilen handler'lar kapatılır
+    ve mevcut kuyruk handler'ı döndürülür (ör. iş başına bir FileSync).
+    """
+    global _listener, _handler
+    with _listener_lock:
+        if queue_logging_active(logger):
+            for handler in handlers:
+                handler.close()
+            return _handler
+        stop_queue_logging()
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        _handler = LazyQueueHandler(log_queue)
+        logger.addHandler(_handler)
+        return _handler
+
+
+def stop_queue_logging() -> None:
+    """Dinleyiciyi durdur; kuyrukta kalan kayıtlar yazılır"""
+    global _listener, _handler
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        if _handler is not None:
+            logging.getLogger().removeHandler(_handler)
+            _handler = None
+
+
+atexit.register(stop_queue_logging)
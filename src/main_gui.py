@@ -13,13 +13,13 @@ import os
 import json
 
 from .file_sync import FileSync
-from .sync_config import SyncConfig
-from .exceptions import SyncError, ValidationError
-from .notification_service import EmailConfig, EmailNotificationService
+from .exceptions import ValidationError
+from .notification_service import EmailConfig
+from .progress import ProgressAggregator
 from .gui_components import (
     PathSelector, ConfigEntry, DateFilterFrame,
     StatusBar, AboutDialog, ControlButtons,
-    EmailSettingsDialog
+    EmailSettingsDialog, TransfersPanel
 )
 
 
@@ -28,6 +28,9 @@ class SyncGUI:
     """Ana GUI sınıfı"""
     def __init__(self):
         self.file_sync = FileSync()
+        self.progress = ProgressAggregator()
+        self._pending_stats = None
+        self._stats_unsubscribe = None
         self.load_email_config()
         self.setup_main_window()
         self.create_widgets()
@@ -79,8 +82,8 @@ class SyncGUI:
         """Ana pencere ayarları"""
         self.root = tk.Tk()
         self.root.title("Dosya Senkronizasyon Uygulaması v2.1")
-        self.root.geometry("800x600")
-        self.root.minsize(600, 400)
+        self.root.geometry("800x800")
+        self.root.minsize(600, 500)
         
         # İkon ayarla (varsa)
         icon_path = Path(__file__).parent.parent / 'assets' / 'icon.ico'
@@ -124,6 +127,7 @@ class SyncGUI:
         def on_save(new_config):
             self.email_config = new_config
             self.save_email_config()
+            self.file_sync.email_config = new_config
             
         EmailSettingsDialog(self.root, self.email_config, callback=on_save)
 
@@ -146,67 +150,12 @@ class SyncGUI:
             if details:
                 error_details.update(details)
             
-            # E-posta servisini oluştur ve gönder
-            notification_service = EmailNotificationService(self.email_config)
-            notification_service.send_error_notification(
-                error_message=error_message,
-                details=error_details
-            )
+            # Senkronizasyonun bildirim kuyruğu üzerinden gönder (GUI'yi bekletmez)
+            self.file_sync.send_error_notification(error_message, error_details)
             
         except Exception as e:
             logging.error(f"E-posta bildirimi gönderilirken hata: {str(e)}")
 
-    def handle_sync_error(self, error):
-        """Senkronizasyon hatalarını işle ve bildir"""
-        error_msg = str(error)
-        logging.error(f"Senkronizasyon hatası: {error_msg}")
-        
-        # GUI'yi güncelle
-        self.control_buttons.set_running_state(False)
-        self.status_bar.update_status(f"Hata: {error_msg}")
-        
-        # Hata detaylarını hazırla
-        error_details = {
-            'Dosya Sayısı': self.file_sync.stats.files_copied,
-            'Toplam Boyut': self.file_sync.stats.format_size(self.file_sync.stats.bytes_copied),
-            'Son İşlem': self.file_sync.stats.current_file
-        }
-        
-        # E-posta bildirimi gönder
-        self.send_error_notification(error_msg, error_details)
-        
-        # Kullanıcıya göster
-        messagebox.showerror("Hata", error_msg)
-
-    def start_sync(self):
-        """Senkronizasyonu başlat"""
-        try:
-            # Yolları doğrula
-            source = self.source_selector.path
-            target = self.target_selector.path
-            
-            if not source or not target:
-                raise ValidationError("Kaynak ve hedef klasörler seçilmelidir!")
-
-            if not Path(source).exists():
-                raise ValidationError(f"Kaynak klasör bulunamadı: {source}")
-
-            # Ayarları kaydet ve senkronizasyonu başlat
-            self.save_settings()
-            self.file_sync.status_callback = self.update_status
-            self.file_sync.start(source, target)
-            
-            # GUI durumunu güncelle
-            self.control_buttons.set_running_state(True)
-            self.status_bar.update_status("Senkronizasyon başlatıldı...")
-            
-            # İstatistik güncelleme thread'i
-            self.stats_thread = threading.Thread(target=self.stats_updater, daemon=True)
-            self.stats_thread.start()
-
-        except Exception as e:
-            self.handle_sync_error(e)
-            
     def create_widgets(self):
         """GUI bileşenlerini oluştur"""
         # Kaynak ve hedef klasör seçicileri
@@ -300,9 +249,14 @@ class SyncGUI:
         self.status_bar = StatusBar(self.main_frame)
         self.status_bar.grid(row=5, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=5)
 
+        # Aktif aktarımlar ve son hatalar
+        self.transfers_panel = TransfersPanel(self.main_frame)
+        self.transfers_panel.grid(row=6, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
+
         # Grid yapılandırması
         self.config_frame.columnconfigure(0, weight=1)
         self.main_frame.columnconfigure(1, weight=1)
+        self.main_frame.rowconfigure(6, weight=1)
 
     def load_config(self):
         """Yapılandırmayı yükle"""
@@ -349,21 +303,6 @@ class SyncGUI:
             logging.error(f"Ayarları kaydetme hatası: {str(e)}")
             messagebox.showerror("Hata", f"Ayarlar kaydedilirken hata oluştu: {str(e)}")
 
-    def update_status(self, message: str, progress: Optional[float] = None):
-        """Durum çubuğunu güncelle"""
-        self.status_bar.update_status(message, progress)
-
-    def update_stats(self):
-        """İstatistik çubuğunu güncelle"""
-        stats = self.file_sync.stats
-        if stats.last_sync:
-            stats_text = (
-                f"Son Senkronizasyon: {stats.last_sync.strftime('%H:%M:%S')} | "
-                f"Kopyalanan: {stats.files_copied} dosya | "
-                f"Toplam: {stats.format_size(stats.bytes_copied)}"
-            )
-            self.status_bar.update_stats(stats_text)
-
     def show_about(self):
         """Hakkında penceresini göster"""
         AboutDialog(self.root)
@@ -387,25 +326,25 @@ class SyncGUI:
             self.control_buttons.set_running_state(True)
             self.status_bar.update_status("Senkronizasyon başlatıldı...", 0)
 
-            # Callback'i ayarla
-            def status_callback(message, progress=None):
-                self.root.after(0, lambda: self.update_status(message, progress))
-
-            self.file_sync.status_callback = status_callback
+            # İşçiler yalnızca toplayıcıya yazar; GUI sabit hızda güncellenir
+            self.file_sync.status_callback = self.progress.post
+            self.progress.start(self.root, self.update_status, self.on_progress_tick,
+                                transfers=self.file_sync.transfers)
             
             # Senkronizasyon thread'ini başlat
             def sync_thread_func():
                 try:
                     self.file_sync.start(source, target)
                 except Exception as e:
-                    self.root.after(0, lambda: self.handle_sync_error(e))
+                    self.root.after(0, lambda error=e: self.handle_sync_error(error))
 
             self.sync_thread = threading.Thread(target=sync_thread_func)
             self.sync_thread.daemon = True
             self.sync_thread.start()
             
-            # İstatistik güncelleyiciyi başlat
-            self.start_stats_updater()
+            # İstatistikler değiştikçe FileSync tarafından itilir
+            if self._stats_unsubscribe is None:
+                self._stats_unsubscribe = self.file_sync.subscribe(self._on_stats_snapshot)
 
         except Exception as e:
             self.handle_sync_error(e)
@@ -417,37 +356,38 @@ class SyncGUI:
         self.status_bar.update_status(f"Hata: {str(error)}")
         messagebox.showerror("Hata", str(error))
 
-    def start_stats_updater(self):
-        """İstatistik güncelleyiciyi başlat"""
-        def update():
-            if self.file_sync.is_running:
-                self.update_stats()
-                self.root.after(1000, update)  # Her 1 saniyede bir güncelle
-        
-        self.root.after(0, update)
+    def on_progress_tick(self):
+        """Ana thread'de periyodik güncelleme: istatistikler ve aktarım paneli"""
+        self.update_stats()
+        self.refresh_transfers()
+
+    def refresh_transfers(self):
+        """Aktarım panelini toplayıcının bu periyotta aldığı görüntüden güncelle"""
+        try:
+            self.transfers_panel.update_view(self.progress.transfer_view(),
+                                             self.file_sync.stats.format_size)
+        except Exception as e:
+            logging.error(f"Aktarım paneli güncelleme hatası: {str(e)}")
 
     def update_status(self, message: str, progress: Optional[float] = None):
         """Durum çubuğunu güncelle"""
         try:
             self.status_bar.update_status(message, progress)
-            self.root.update_idletasks()
         except Exception as e:
             logging.error(f"Durum güncelleme hatası: {str(e)}")
 
+    def _on_stats_snapshot(self, snapshot):
+        """Yayıncı thread'inden gelen anlık görüntüyü sakla (Tk'ye dokunmaz)"""
+        self._pending_stats = snapshot
+
     def update_stats(self):
-        """İstatistik çubuğunu güncelle"""
+        """Bekleyen istatistik anlık görüntüsünü uygula (ana thread)"""
+        snapshot, self._pending_stats = self._pending_stats, None
+        if snapshot is None:
+            return
         try:
-            stats = self.file_sync.stats
-            if stats.last_sync:
-                duration = stats.get_duration()
-                if duration > 0:
-                    speed = stats.format_speed(duration)
-                    stats_text = (
-                        f"Kopyalanan: {stats.files_copied} dosya | "
-                        f"Toplam: {stats.format_size(stats.bytes_copied)} | "
-                        f"Hız: {speed}"
-                    )
-                    self.status_bar.update_stats(stats_text)
+            if snapshot.duration > 0:
+                self.status_bar.update_stats(snapshot.format_status())
         except Exception as e:
             logging.error(f"İstatistik güncelleme hatası: {str(e)}")
 
@@ -455,29 +395,13 @@ class SyncGUI:
         """Senkronizasyonu durdur"""
         try:
             self.file_sync.stop()
+            self.progress.stop()
+            self.on_progress_tick()
             self.control_buttons.set_running_state(False)
             self.status_bar.update_status("Senkronizasyon durduruldu")
         except Exception as e:
             logging.error(f"Senkronizasyon durdurma hatası: {str(e)}")
             messagebox.showerror("Hata", str(e))
-    def stop_sync(self):
-        """Senkronizasyonu durdur"""
-        try:
-            self.file_sync.stop()
-            self.control_buttons.set_running_state(False)
-            self.status_bar.update_status("Senkronizasyon durduruldu")
-        except Exception as e:
-            logging.error(f"Senkronizasyon durdurma hatası: {str(e)}")
-            messagebox.showerror("Hata", str(e))
-
-    def stats_updater(self):
-        """İstatistik güncelleme döngüsü"""
-        while self.file_sync.is_running:
-            try:
-                self.update_stats()
-                self.root.after(1000)  # 1 saniye bekle
-            except Exception as e:
-                logging.error(f"İstatistik güncelleme hatası: {str(e)}")
 
     def on_source_changed(self, path: str):
         """Kaynak klasör değiştiğinde"""
@@ -535,6 +459,8 @@ class SyncGUI:
                 self.stop_sync()
             else:
                 return
+        if self._stats_unsubscribe is not None:
+            self._stats_unsubscribe()
         self.root.destroy()
 
     def run(self):
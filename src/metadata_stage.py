@@ -0,0 +1,79 @@
+"""
+Ertelenmiş meta veri uygulama aşaması
+"""
+
+import os
+import stat
+import logging
+import threading
+from typing import Dict, List, Tuple
+
+
+class MetadataStage:
+    """Kopyalanan dosya ve klasörlerin tarih/izin bilgilerini toplu uygular
+
+    Dosyalar için kaynağın kopyalama anındaki stat değeri saklanır; kaynak
+    kopyadan sonra değişirse hedef eski tarihi alır ve sonraki döngüde
+    yeniden kopyalanır. Klasörlere yalnızca tarihler uygulanır; salt okunur
+    bir kaynak klasör hedefi sonraki döngüler için yazılamaz yapmamalı.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._files: List[Tuple[str, os.stat_result]] = []
+        self._dirs: Dict[str, str] = {}
+
+    def reset(self) -> None:
+        """Bekleyen tüm kayıtları temizle"""
+        with self._lock:
+            self._files = []
+            self._dirs = {}
+
+    def add_file(self, dst: str, src_stat: os.stat_result) -> None:
+        """Kopyalanan dosyayı, kaynağın kopyalama anındaki stat değeriyle ekle"""
+        with self._lock:
+            self._files.append((dst, src_stat))
+
+    def add_tree_path(self, source_root: str, target_root: str, rel_dir: str) -> None:
+        """Klasörü ve üst klasörlerini (hedef kök dahil) meta veri aşamasına ekle"""
+        with self._lock:
+            while True:
+                dst = os.path.normpath(os.path.join(target_root, rel_dir))
+                if dst in self._dirs:
+                    break
+                self._dirs[dst] = os.path.normpath(os.path.join(source_root, rel_dir))
+                if rel_dir in ('', os.curdir):
+                    break
+                rel_dir = os.path.dirname(rel_dir)
+
+    def apply(self) -> Tuple[int, int]:
+        """Bekleyen meta verileri uygula: önce dosyalar, sonra en derinden başlayarak klasörler"""
+        with self._lock:
+            files, self._files = self._files, []
+            dirs, self._dirs = self._dirs, {}
+
+        applied_files = 0
+        for dst, src_stat in files:
+            try:
+                os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                os.chmod(dst, stat.S_IMODE(src_stat.st_mode))
+                applied_files += 1
+            except OSError as e:
+                logging.warning(f"Dosya meta verisi uygulanamadı ({dst}): {e}")
+
+        # Klasör tarihleri, içerikleri yazıldıktan sonra ve en derinden başlanarak
+        # uygulanmalı; aksi halde alt klasör yazımı üst klasörün tarihini bozar
+        applied_dirs = 0
+        for dst in sorted(dirs, key=lambda p: p.count(os.sep), reverse=True):
+            src = dirs[dst]
+            if not os.path.isdir(dst) or not os.path.isdir(src):
+                continue
+            try:
+                src_stat = os.stat(src)
+                os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+                applied_dirs += 1
+            except OSError as e:
+                logging.warning(f"Klasör meta verisi uygulanamadı ({dst}): {e}")
+
+        logging.debug(f"Meta veri uygulandı: {applied_files} dosya, {applied_dirs} klasör")
+        return applied_files, applied_dirs
@@ -0,0 +1,191 @@
+"""
+Prometheus metin formatında metrik sunucusu
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .sync_stats import histogram_bounds
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+# Döngüler boyunca toplanan sayaçlar ve açıklamaları
+_TOTAL_COUNTERS = (
+    ('files_scanned', 'Taranan dosya sayısı'),
+    ('files_skipped', 'Atlanan dosya sayısı'),
+    ('files_copied', 'Kopyalanan dosya sayısı'),
+    ('files_failed', 'Kopyalanamayan dosya sayısı'),
+    ('files_backed_up', 'Yedeklenen dosya sayısı'),
+    ('backup_failures', 'Başarısız yedekleme sayısı'),
+    ('bytes_copied', 'Kopyalanan bayt'),
+    ('bytes_read', 'Okunan bayt'),
+    ('bytes_written', 'Yazılan bayt'),
+    ('pressure_pauses', 'Sistem baskısı nedeniyle duraklatma sayısı'),
+    ('pressure_shrinks', 'Sistem baskısı nedeniyle işçi azaltma sayısı'),
+    ('subtrees_skipped', 'Soğuk olduğu için taranmayan alt ağaç sayısı'),
+    ('files_cancelled', 'Durdurma isteğiyle iptal edilen kopya sayısı'),
+)
+
+# Baskı denetleyicisi durumu -> gösterge değeri
+_PRESSURE_LEVELS = {'normal': 0, 'shrink': 1, 'pause': 2}
+
+
+# (ad, tür, açıklama, [(örnek adı, etiketler, değer), ...])
+Family = Tuple[str, str, str, List[Tuple[str, Dict[str, str], Optional[float]]]]
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(str(value))}"' for key, value in labels.items()) + '}'
+
+
+def _families(file_sync) -> List[Family]:
+    """Tek bir FileSync'in metrik aileleri"""
+    snapshot = file_sync.stats.snapshot()
+    current = snapshot.counters
+    totals = file_sync.get_cumulative_counters()
+    families: List[Family] = []
+
+    def metric(name: str, metric_type: str, help_text: str, value: Optional[float]) -> None:
+        families.append((name, metric_type, help_text, [(name, {}, value)]))
+
+    metric('filesync_running', 'gauge', 'Senkronizasyon çalışıyor mu',
+           int(file_sync.is_running))
+    metric('filesync_queue_depth', 'gauge', 'Kuyrukta bekleyen dosya sayısı',
+           max(0, current['files_queued'] - current['files_started']))
+    metric('filesync_active_workers', 'gauge', 'Aktif kopyalama işçisi sayısı',
+           current['active_workers'])
+    metric('filesync_bytes_per_second', 'gauge', 'Son pencere içindeki aktarım hızı',
+           round(snapshot.bytes_per_second, 3))
+    metric('filesync_files_per_second', 'gauge', 'Son pencere içindeki dosya hızı',
+           round(snapshot.files_per_second, 3))
+    metric('filesync_eta_seconds', 'gauge', 'Tahmini kalan süre',
+           round(snapshot.eta_seconds, 3) if snapshot.eta_seconds is not None else None)
+
+    metric('filesync_last_quiesce_seconds', 'gauge',
+           'Son durdurma isteğinden işçilerin durmasına kadar geçen süre', file_sync.last_quiesce_time)
+    metric('filesync_check_interval_seconds', 'gauge', 'Sonraki döngüye kadar bekleme süresi',
+           file_sync.current_interval)
+    metric('filesync_pressure_state', 'gauge',
+           'Baskı denetleyicisi durumu (0 normal, 1 azaltıldı, 2 duraklatıldı)',
+           _PRESSURE_LEVELS.get(snapshot.pressure_state, 0))
+
+    for name, help_text in _TOTAL_COUNTERS:
+        metric(f'filesync_{name}_total', 'counter', help_text, totals.get(name, 0))
+
+    metric('filesync_cycles_total', 'counter', 'Tamamlanan döngü sayısı',
+           file_sync.cycles_total)
+    metric('filesync_cycle_failures_total', 'counter', 'Hatayla biten döngü sayısı',
+           file_sync.cycle_failures_total)
+    metric('filesync_last_success_timestamp_seconds', 'gauge',
+           'Son başarılı döngünün bitiş zamanı (unix)', file_sync.last_cycle_success)
+    metric('filesync_last_cycle_duration_seconds', 'gauge', 'Son döngünün süresi',
+           file_sync.last_cycle_duration)
+
+    # Döngüler boyunca birikir; _count ve _sum süreç boyunca azalmaz
+    buckets, sums = file_sync.get_cumulative_latencies()
+    samples = []
+    for op, values in buckets.items():
+        for bound, count in histogram_bounds(values):
+            samples.append(('filesync_operation_latency_seconds_bucket',
+                            {'op': op, 'le': f'{bound:.6g}'}, count))
+        total = sum(values)
+        samples.append(('filesync_operation_latency_seconds_bucket', {'op': op, 'le': '+Inf'}, total))
+        samples.append(('filesync_operation_latency_seconds_sum', {'op': op}, round(sums[op], 6)))
+        samples.append(('filesync_operation_latency_seconds_count', {'op': op}, total))
+    families.append(('filesync_operation_latency_seconds', 'histogram',
+                     'İşlem gecikmesi dağılımı', samples))
+    return families
+
+
+def _render(sources: List[Tuple[Dict[str, str], object]]) -> str:
+    """Kaynakların ailelerini birleştir; her aile başlığı bir kez yazılır"""
+    merged: Dict[str, Family] = {}
+    for labels, file_sync in sources:
+        for name, metric_type, help_text, samples in _families(file_sync):
+            family = merged.setdefault(name, (name, metric_type, help_text, []))
+            family[3].extend((sample, {**labels, **sample_labels}, value)
+                             for sample, sample_labels, value in samples)
+
+    lines: List[str] = []
+    for name, metric_type, help_text, samples in merged.values():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for sample, labels, value in samples:
+            if value is not None:
+                lines.append(f"{sample}{_format_labels(labels)} {value}")
+    return '\n'.join(lines) + '\n'
+
+
+def render_metrics(file_sync) -> str:
+    """FileSync durumunu Prometheus metin formatına çevir"""
+    return _render([({}, file_sync)])
+
+
+def render_job_metrics(syncs: Dict[str, object]) -> str:
+    """Tüm işlerin metriklerini job="AD" etiketiyle tek çıktıda birleştir"""
+    return _render([({'job': name}, file_sync) for name, file_sync in syncs.items()])
+
+
+class MetricsServer:
+    """Yerel HTTP üzerinden /metrics sunan arka plan sunucusu"""
+
+    def __init__(self, render: Callable[[], str], host: str = '127.0.0.1', port: int = 9108):
+        self.render = render
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def _handler_class(self):
+        render = self.render
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                try:
+                    body = render().encode('utf-8')
+                except Exception as e:
+                    logging.error(f"Metrik oluşturma hatası: {str(e)}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', CONTENT_TYPE)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                logging.debug("Metrik isteği: " + format, *args)
+
+        return Handler
+
+    def start(self) -> None:
+        """Sunucuyu arka planda başlat"""
+        self._server = ThreadingHTTPServer((self.host, self.port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="MetricsThread",
+            daemon=True
+        )
+        self._thread.start()
+        logging.info(f"Metrik sunucusu başlatıldı: http://{self.host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """Sunucuyu kapat"""
+        if self._server is None:
+            return
+        self._server.shutdown()
+        self._server.server_close()
+        self._server = None
+        logging.info("Metrik sunucusu durduruldu")
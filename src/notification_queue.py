@@ -0,0 +1,118 @@
+"""
+Hata bildirimlerini arka planda toplayıp özet e-posta olarak gönderen kuyruk
+"""
+
+import re
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# Aynı hatanın farklı dosyalardaki tekrarlarını birleştirmek için yol benzeri
+# parçalar anahtardan çıkarılır
+_PATH_PARTS = re.compile(r"'[^']*'|\"[^\"]*\"|\([^)]*\)")
+
+MAX_SAMPLE_FILES = 5
+
+
+def digest_key(message: str) -> str:
+    """Hata mesajından dosya yollarını ayıklayarak gruplama anahtarı üret"""
+    return _PATH_PARTS.sub('(…)', message)
+
+
+@dataclass
+class DigestEntry:
+    """Özet içindeki tek bir hata grubu"""
+    message: str
+    details: Optional[dict]
+    count: int = 0
+    first_seen: datetime = field(default_factory=datetime.now)
+    last_seen: datetime = field(default_factory=datetime.now)
+    files: List[str] = field(default_factory=list)
+
+
+class ErrorDigestQueue:
+    """Hataları pencere süresince biriktirip tek özet olarak gönderir
+
+    submit() yalnızca bir sözlüğü günceller; e-posta gönderimi arka plandaki
+    thread'de yapılır, böylece kopyalama işçileri SMTP'yi hiç beklemez.
+    """
+
+    def __init__(self, send: Callable[[str, dict], bool], window: float = 60.0):
+        self.send = send
+        self.window = window
+        self._entries: Dict[str, DigestEntry] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, message: str, details: Optional[dict] = None, file_path: str = '') -> None:
+        """Hatayı özete ekle (engellemez)"""
+        key = digest_key(message)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = DigestEntry(message, details)
+            entry.count += 1
+            entry.last_seen = datetime.now()
+            if file_path and len(entry.files) < MAX_SAMPLE_FILES and file_path not in entry.files:
+                entry.files.append(file_path)
+            if self._thread is None:
+                self._start()
+
+    def _start(self) -> None:
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="NotificationThread", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.window)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> bool:
+        """Biriken hataları hemen tek e-posta olarak gönder"""
+        with self._lock:
+            entries, self._entries = self._entries, {}
+        if not entries:
+            return True
+
+        total = sum(entry.count for entry in entries.values())
+        if len(entries) == 1 and total == 1:
+            entry = next(iter(entries.values()))
+            return self._send(entry.message, entry.details or {})
+
+        subject = f"{total} hata ({len(entries)} farklı)"
+        details = {}
+        for index, entry in enumerate(sorted(entries.values(), key=lambda e: -e.count), 1):
+            group = {
+                'Hata': entry.message,
+                'Adet': entry.count,
+                'İlk': entry.first_seen.strftime('%Y-%m-%d %H:%M:%S'),
+                'Son': entry.last_seen.strftime('%Y-%m-%d %H:%M:%S'),
+            }
+            if entry.files:
+                group['Örnek Dosyalar'] = ', '.join(entry.files)
+            details[f"{index}. grup"] = group
+        return self._send(f"Hata özeti: {subject}", details)
+
+    def _send(self, message: str, details: dict) -> bool:
+        try:
+            return bool(self.send(message, details))
+        except Exception as e:
+            logging.error(f"Hata özeti gönderilemedi: {str(e)}")
+            return False
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Arka plan thread'ini durdur; kalan hataları gönder"""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stopping = True
+        self._wake.set()
+        thread.join(timeout=timeout)
+        with self._lock:
+            self._thread = None
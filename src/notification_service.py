@@ -7,7 +7,11 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from dataclasses import dataclass
 import logging
-from typing import List, Optional
+import threading
+import time
+from html import escape
+from string import Template
+from typing import Callable, List, Optional
 from datetime import datetime
 import ssl
 
@@ -26,111 +30,228 @@ class EmailConfig:
         if self.to_emails is None:
             self.to_emails = []
 
-class EmailNotificationService:
-    """E-posta bildirim servisi"""
-    
-    def __init__(self, config: EmailConfig):
-        self.config = config
-        self._setup_logging()
-
-    def _setup_logging(self):
-        """Loglama ayarlarını yapılandır"""
-        self.logger = logging.getLogger(__name__)
-        
-        # Dosyaya loglama
-        try:
-            fh = logging.FileHandler('logs/email_service.log', encoding='utf-8')
-            fh.setLevel(logging.DEBUG)
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            fh.setFormatter(formatter)
-            self.logger.addHandler(fh)
-            
-            # Konsola loglama
-            ch = logging.StreamHandler()
-            ch.setLevel(logging.DEBUG)
-            ch.setFormatter(formatter)
-            self.logger.addHandler(ch)
-        except Exception as e:
-            print(f"Loglama yapılandırma hatası: {e}")
-
-    def send_notification(self, subject: str, message: str, details: Optional[dict] = None) -> bool:
-        """Genel bildirim gönderme metodu"""
-        try:
-            if not self.config.username or not self.config.to_emails:
-                self.logger.warning("E-posta ayarları eksik")
-                return False
-
-            # HTML içeriği oluştur
-            html_content = f"""
+# Gövde şablonu modül yüklenirken bir kez hazırlanır; gönderimde yalnızca
+# değişken alanlar doldurulur
+_HTML_TEMPLATE = Template("""
             <html>
                 <head>
                     <style>
-                        body {{ font-family: Arial, sans-serif; padding: 20px; }}
-                        .message {{ 
+                        body { font-family: Arial, sans-serif; padding: 20px; }
+                        .message { 
                             padding: 15px;
                             border-radius: 4px;
                             margin: 10px 0;
-                        }}
-                        .error {{ 
+                        }
+                        .error { 
                             color: #721c24;
                             background-color: #f8d7da;
                             border: 1px solid #f5c6cb;
-                        }}
-                        .info {{
+                        }
+                        .info {
                             color: #0c5460;
                             background-color: #d1ecf1;
                             border: 1px solid #bee5eb;
-                        }}
-                        .details {{ 
+                        }
+                        .details { 
                             background-color: #f8f9fa;
                             border: 1px solid #dee2e6;
                             padding: 15px;
                             border-radius: 4px;
                             margin: 10px 0;
-                        }}
-                        .footer {{ 
+                        }
+                        .footer { 
                             margin-top: 30px;
                             color: #6c757d;
                             font-size: 0.9em;
                             border-top: 1px solid #dee2e6;
                             padding-top: 10px;
-                        }}
-                        table {{ width: 100%; border-collapse: collapse; }}
-                        th, td {{ 
+                        }
+                        table { width: 100%; border-collapse: collapse; }
+                        th, td { 
                             text-align: left;
                             padding: 8px;
                             border: 1px solid #dee2e6;
-                        }}
-                        th {{ background-color: #f8f9fa; }}
+                        }
+                        th { background-color: #f8f9fa; }
                     </style>
                 </head>
                 <body>
-                    <h2>{subject}</h2>
-                    <div class="message {'error' if 'hata' in subject.lower() else 'info'}">
-                        {message}
+                    <h2>$subject</h2>
+                    <div class="message $css_class">
+                        $message
                     </div>
-            """
-
-            if details:
-                html_content += '<div class="details"><h3>Detaylar:</h3><table>'
-                for key, value in details.items():
-                    if isinstance(value, dict):
-                        # Alt detaylar için nested tablo
-                        html_content += f'<tr><th colspan="2">{key}</th></tr>'
-                        for k, v in value.items():
-                            html_content += f'<tr><td>{k}</td><td>{v}</td></tr>'
-                    else:
-                        html_content += f'<tr><td>{key}</td><td>{value}</td></tr>'
-                html_content += '</table></div>'
-
-            html_content += f"""
+                    $details
                     <div class="footer">
                         <p>Bu e-posta otomatik olarak gönderilmiştir.</p>
-                        <p>Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
+                        <p>Tarih: $timestamp</p>
                     </div>
                 </body>
             </html>
-            """
+            """)
+
+_logging_lock = threading.Lock()
+_logging_configured = False
+
+
+def _setup_logging() -> logging.Logger:
+    """Servis logger'ını süreç başına bir kez yapılandır"""
+    global _logging_configured
+    logger = logging.getLogger(__name__)
+    with _logging_lock:
+        if _logging_configured:
+            return logger
+        _logging_configured = True
+
+        # Dosyaya loglama
+        try:
+            fh = logging.FileHandler('logs/email_service.log', encoding='utf-8')
+            fh.setLevel(logging.DEBUG)
+            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            fh.setFormatter(formatter)
+            logger.addHandler(fh)
+        except Exception as e:
+            print(f"Loglama yapılandırma hatası: {e}")
+    return logger
+
+
+def render_details(details: Optional[dict]) -> str:
+    """Detay sözlüğünü HTML tablosuna çevir"""
+    if not details:
+        return ''
+    rows = ['<div class="details"><h3>Detaylar:</h3><table>']
+    for key, value in details.items():
+        if isinstance(value, dict):
+            # Alt detaylar için nested tablo
+            rows.append(f'<tr><th colspan="2">{escape(str(key))}</th></tr>')
+            for k, v in value.items():
+                rows.append(f'<tr><td>{escape(str(k))}</td><td>{escape(str(v))}</td></tr>')
+        else:
+            rows.append(f'<tr><td>{escape(str(key))}</td><td>{escape(str(value))}</td></tr>')
+    rows.append('</table></div>')
+    return ''.join(rows)
+
+
+class EmailNotificationService:
+    """E-posta bildirim servisi
+
+    SMTP oturumu ilk gönderimde açılır ve sonraki mesajlar için yeniden
+    kullanılır. Bir süre boşta kalan oturum kullanılmadan önce NOOP ile
+    yoklanır; kopmuşsa sessizce yeniden bağlanılır.
+    """
+
+    # Bu süreden uzun boşta kalan oturum yeniden kullanılmadan önce yoklanır
+    HEALTH_CHECK_AFTER = 30.0
+
+    def __init__(self, config: EmailConfig, smtp_factory: Callable[..., smtplib.SMTP] = smtplib.SMTP,
+                 timeout: float = 30.0):
+        self.config = config
+        self.smtp_factory = smtp_factory
+        self.timeout = timeout
+        self.logger = _setup_logging()
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'EmailNotificationService':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _connect(self) -> smtplib.SMTP:
+        """Yeni SMTP oturumu aç (STARTTLS ve oturum açma dahil)"""
+        self.logger.debug(f"SMTP bağlantısı kuruluyor: {self.config.smtp_server}:{self.config.smtp_port}")
+        server = self.smtp_factory(self.config.smtp_server, self.config.smtp_port, timeout=self.timeout)
+        try:
+            if self.config.use_ssl:
+                self.logger.debug("STARTTLS başlatılıyor")
+                server.starttls(context=ssl.create_default_context())
+
+            if self.config.username and self.config.password:
+                self.logger.debug(f"Oturum açılıyor: {self.config.username}")
+                server.login(self.config.username, self.config.password)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _session(self) -> smtplib.SMTP:
+        """Mevcut oturumu döndür; yoksa veya kopmuşsa yeniden bağlan"""
+        if self._smtp is not None and time.monotonic() - self._last_used > self.HEALTH_CHECK_AFTER:
+            try:
+                if self._smtp.noop()[0] != 250:
+                    raise smtplib.SMTPServerDisconnected("NOOP başarısız")
+            except (smtplib.SMTPException, OSError):
+                self.logger.debug("SMTP oturumu kopmuş, yeniden bağlanılacak")
+                self._drop_session()
+        if self._smtp is None:
+            self._smtp = self._connect()
+        return self._smtp
+
+    def _drop_session(self) -> None:
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+            self._smtp = None
+
+    def close(self) -> None:
+        """Açık SMTP oturumunu kapat"""
+        with self._lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except (smtplib.SMTPException, OSError):
+                    pass
+                self._drop_session()
+
+    @staticmethod
+    def _is_transient(error: OSError) -> bool:
+        """Yeniden bağlanıp tekrar denemeye değer mi (kopma, ağ hatası veya 4xx yanıt)
+
+        5xx yanıtlar ve reddedilen alıcılar kalıcıdır; smtplib bu durumda RSET
+        gönderdiğinden oturum kullanılabilir kalır.
+        """
+        if isinstance(error, smtplib.SMTPResponseException):
+            return error.smtp_code < 500
+        if isinstance(error, smtplib.SMTPException):
+            return isinstance(error, smtplib.SMTPServerDisconnected)
+        return True
+
+    def _send_message(self, msg: MIMEMultipart) -> None:
+        """Mesajı oturum üzerinden gönder; oturum düşmüşse bir kez yeniden dene"""
+        with self._lock:
+            for attempt in (1, 2):
+                server = self._session()
+                try:
+                    server.send_message(msg)
+                    self._last_used = time.monotonic()
+                    return
+                except OSError as e:
+                    # smtplib hataları OSError alt sınıfıdır
+                    if not self._is_transient(e):
+                        raise
+                    self._drop_session()
+                    if attempt == 2:
+                        raise
+                    self.logger.debug("SMTP oturumu gönderim sırasında düştü, yeniden deneniyor")
+
+    def send_notification(self, subject: str, message: str, details: Optional[dict] = None) -> bool:
+        """Genel bildirim gönderme metodu"""
+        try:
+            if not self.config.username or not self.config.to_emails:
+                self.logger.warning("E-posta ayarları eksik")
+                return False
+
+            # HTML içeriği oluştur
+            html_content = _HTML_TEMPLATE.substitute(
+                subject=escape(subject),
+                css_class='error' if 'hata' in subject.lower() else 'info',
+                message=escape(message),
+                details=render_details(details),
+                timestamp=datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            )
 
             # E-posta oluştur
             msg = MIMEMultipart('alternative')
@@ -139,21 +260,9 @@ class EmailNotificationService:
             msg['To'] = ', '.join(self.config.to_emails)
             msg.attach(MIMEText(html_content, 'html'))
 
-            # SMTP bağlantısı ve gönderim
-            context = ssl.create_default_context() if self.config.use_ssl else None
-            
-            self.logger.debug(f"SMTP bağlantısı kuruluyor: {self.config.smtp_server}:{self.config.smtp_port}")
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port) as server:
-                if self.config.use_ssl:
-                    self.logger.debug("STARTTLS başlatılıyor")
-                    server.starttls(context=context)
-                
-                self.logger.debug(f"Oturum açılıyor: {self.config.username}")
-                server.login(self.config.username, self.config.password)
-                
-                self.logger.debug(f"E-posta gönderiliyor: {msg['To']}")
-                server.send_message(msg)
-                
+            self.logger.debug(f"E-posta gönderiliyor: {msg['To']}")
+            self._send_message(msg)
+
             self.logger.info(f"E-posta başarıyla gönderildi: {subject}")
             return True
 
@@ -188,7 +297,7 @@ class EmailNotificationService:
             
             context = ssl.create_default_context() if self.config.use_ssl else None
             
-            with smtplib.SMTP(self.config.smtp_server, self.config.smtp_port, timeout=10) as server:
+            with self.smtp_factory(self.config.smtp_server, self.config.smtp_port, timeout=10) as server:
                 server.set_debuglevel(1)
                 
                 if self.config.use_ssl:
@@ -0,0 +1,157 @@
+"""
+Sistem baskısına göre kopyalama işçilerini duraklatma / azaltma
+
+Linux PSI (/proc/pressure/io ve /proc/pressure/memory, "some avg10") okunur;
+PSI yoksa 1 dakikalık yük ortalaması kullanılır. Yük ortalaması CPU başına
+1'i aştığı ölçüde baskı sayılır (CPU başına 1.2 -> %20, 1.6 -> %60).
+"""
+
+import os
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional
+
+from .exceptions import InterruptError
+
+PSI_ROOT = '/proc/pressure'
+
+# Durum -> GUI ve log etiketi
+STATE_LABELS = {
+    'normal': 'normale döndü',
+    'shrink': 'azaltıldı',
+    'pause': 'duraklatıldı',
+}
+
+
+def read_psi(resource: str, root: str = PSI_ROOT) -> Optional[float]:
+    """Kaynağın 'some avg10' değerini (yüzde) döndür; PSI yoksa None"""
+    try:
+        with open(os.path.join(root, resource), 'r', encoding='ascii') as f:
+            for line in f:
+                if line.startswith('some '):
+                    for field in line.split()[1:]:
+                        key, _, value = field.partition('=')
+                        if key == 'avg10':
+                            return float(value)
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def read_load_pressure() -> Optional[float]:
+    """Yük ortalamasını PSI ölçeğine yaklaştır; desteklenmiyorsa None"""
+    try:
+        load = os.getloadavg()[0]
+    except (AttributeError, OSError):
+        return None
+    return max(0.0, load / (os.cpu_count() or 1) - 1.0) * 100
+
+
+@dataclass
+class PressureSample:
+    """Tek bir baskı ölçümü (yüzde)"""
+    io: Optional[float] = None
+    memory: Optional[float] = None
+    load: Optional[float] = None
+
+    @property
+    def level(self) -> float:
+        values = [v for v in (self.io, self.memory, self.load) if v is not None]
+        return max(values) if values else 0.0
+
+    def describe(self) -> str:
+        parts = [f"{name}=%{value:.1f}" for name, value in
+                 (('io', self.io), ('bellek', self.memory), ('yük', self.load)) if value is not None]
+        return ', '.join(parts) if parts else 'ölçüm yok'
+
+
+def read_pressure() -> PressureSample:
+    """PSI varsa io ve bellek baskısını, yoksa yük ortalamasını oku"""
+    io = read_psi('io')
+    memory = read_psi('memory')
+    if io is None and memory is None:
+        return PressureSample(load=read_load_pressure())
+    return PressureSample(io=io, memory=memory)
+
+
+class PressureController:
+    """Baskı eşiklerine göre aynı anda çalışabilecek kopyalama sayısını belirler
+
+    shrink eşiği aşılınca işçilerin yarısı, pause eşiği aşılınca hiçbiri
+    çalışmaz. Geri dönüş için baskının eşiğin HYSTERESIS katının altına
+    inmesi gerekir; böylece eşik çevresinde durum sürekli değişmez.
+    """
+
+    SAMPLE_INTERVAL = 1.0
+    HYSTERESIS = 0.75
+
+    def __init__(self, shrink_threshold: float, pause_threshold: float,
+                 reader: Callable[[], PressureSample] = read_pressure,
+                 on_change: Optional[Callable[[str, str], None]] = None):
+        self.shrink_threshold = shrink_threshold
+        self.pause_threshold = pause_threshold
+        self.state = 'normal'
+        self.last_sample = PressureSample()
+        self._reader = reader
+        self._on_change = on_change
+        self._checked = float('-inf')
+        self._active = 0
+        self._cond = threading.Condition()
+
+    def _next_state(self, level: float) -> str:
+        if level >= self.pause_threshold:
+            return 'pause'
+        if self.state == 'pause' and level >= self.pause_threshold * self.HYSTERESIS:
+            return 'pause'
+        if level >= self.shrink_threshold:
+            return 'shrink'
+        if self.state != 'normal' and level >= self.shrink_threshold * self.HYSTERESIS:
+            return 'shrink'
+        return 'normal'
+
+    def _refresh(self) -> None:
+        """Gerekiyorsa baskıyı yeniden ölç (kilit altında çağrılır)"""
+        now = time.monotonic()
+        if now - self._checked < self.SAMPLE_INTERVAL:
+            return
+        self._checked = now
+        self.last_sample = self._reader()
+        state = self._next_state(self.last_sample.level)
+        if state != self.state:
+            previous, self.state = self.state, state
+            log = logging.info if state == 'normal' else logging.warning
+            log(f"Sistem baskısı ({self.last_sample.describe()}): kopyalama işçileri "
+                f"{STATE_LABELS[state]}")
+            if self._on_change:
+                self._on_change(previous, state)
+            self._cond.notify_all()
+
+    def allowed(self, max_workers: int) -> int:
+        """Şu anki duruma göre izin verilen eşzamanlı kopya sayısı"""
+        if self.state == 'pause':
+            return 0
+        if self.state == 'shrink':
+            return max(1, max_workers // 2)
+        return max_workers
+
+    @contextmanager
+    def slot(self, max_workers: int, stop_event: threading.Event) -> Iterator[None]:
+        """Baskı izin verene kadar bekle ve bir kopyalama yuvası al"""
+        with self._cond:
+            while True:
+                if stop_event.is_set():
+                    raise InterruptError("Kopyalama işlemi kullanıcı tarafından durduruldu")
+                self._refresh()
+                if self._active < self.allowed(max_workers):
+                    break
+                self._cond.wait(self.SAMPLE_INTERVAL)
+            self._active += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                self._cond.notify()
@@ -0,0 +1,124 @@
+"""
+Tek döngülük isteğe bağlı profil yakalama (cProfile / tracemalloc)
+
+Her döngü başında config.ini ile aynı klasördeki `profile.request` dosyasına
+bakılır. Dosya varsa içeriği (`cpu`, `memory` veya `both`; boşsa `cpu`) okunur,
+dosya silinir ve o döngü profillenir; sonuç logs/ altına zaman damgalı
+dosyalar olarak yazılır. Uygulamayı yeniden başlatmak gerekmez:
+
+    echo cpu > profile.request
+
+İstek dosyası yeniden adlandırılarak alınır; birden çok iş çalışırken isteği
+döngüsü ilk başlayan iş alır. Komut satırındaki `--profile` seçeneği istek
+dosyası yerine request() çağırır; GUI'de ayrı bir profil düğmesi yoktur,
+GUI çalışırken de istek dosyası kullanılır.
+
+Not: cProfile yalnızca senkronizasyon (tarama) thread'ini profiller;
+işçi thread'lerindeki süreler aşama zamanlayıcılarında görülür.
+"""
+
+import io
+import os
+import cProfile
+import pstats
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, List
+
+PROFILE_MODES = ('cpu', 'memory', 'both')
+REQUEST_FILE_NAME = 'profile.request'
+
+
+class CycleProfiler:
+    """İstek dosyası veya request() ile açılan tek döngülük profilleyici"""
+
+    def __init__(self, config_path: str = 'config.ini', log_dir: str = 'logs', top: int = 40):
+        self.request_path = Path(config_path).resolve().parent / REQUEST_FILE_NAME
+        self.log_dir = Path(log_dir)
+        self.top = top
+        self._requested = None
+
+    def request(self, mode: str) -> None:
+        """Bir sonraki döngünün profillenmesini iste (komut satırı `--profile`)"""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Geçersiz profil modu: {mode}")
+        self._requested = mode
+
+    def requested_mode(self) -> str:
+        """Bekleyen isteği al ve tüket; istek yoksa 'none'"""
+        mode, self._requested = self._requested, None
+        if mode:
+            return mode
+        try:
+            # Yeniden adlandırma isteği tek bir profilleyicinin almasını sağlar
+            claimed = self.request_path.with_name(
+                f"{REQUEST_FILE_NAME}.{os.getpid()}.{threading.get_ident()}")
+            os.rename(self.request_path, claimed)
+        except OSError:
+            return 'none'
+        try:
+            mode = claimed.read_text(encoding='utf-8').strip().lower() or 'cpu'
+            claimed.unlink()
+        except OSError as e:
+            logging.error(f"Profil isteği okunamadı: {str(e)}")
+            return 'none'
+        if mode not in PROFILE_MODES:
+            logging.warning(f"Geçersiz profil modu yok sayıldı: {mode}")
+            return 'none'
+        return mode
+
+    @contextmanager
+    def capture(self) -> Iterator[None]:
+        """İstenmişse bloğu profille ve sonuçları logs/ altına yaz"""
+        mode = self.requested_mode()
+        if mode == 'none':
+            yield
+            return
+
+        profiler = cProfile.Profile() if mode in ('cpu', 'both') else None
+        trace_memory = mode in ('memory', 'both') and not tracemalloc.is_tracing()
+        if trace_memory:
+            tracemalloc.start(25)
+        if profiler:
+            profiler.enable()
+        logging.info(f"Döngü profilleniyor (mod: {mode})")
+
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            snapshot = tracemalloc.take_snapshot() if trace_memory else None
+            if trace_memory:
+                tracemalloc.stop()
+            self._write_results(profiler, snapshot)
+
+    def _write_results(self, profiler, snapshot) -> None:
+        self.log_dir.mkdir(exist_ok=True)
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        written: List[Path] = []
+        try:
+            if profiler:
+                prof_path = self.log_dir / f'profile_{stamp}.prof'
+                profiler.dump_stats(str(prof_path))
+                text = io.StringIO()
+                pstats.Stats(profiler, stream=text).sort_stats('cumulative').print_stats(self.top)
+                txt_path = self.log_dir / f'profile_{stamp}.txt'
+                txt_path.write_text(text.getvalue(), encoding='utf-8')
+                written += [prof_path, txt_path]
+
+            if snapshot:
+                mem_path = self.log_dir / f'tracemalloc_{stamp}.txt'
+                stats = snapshot.statistics('lineno')
+                lines = [f"Toplam: {sum(stat.size for stat in stats) / 1024:.1f} KiB"]
+                lines += [str(stat) for stat in stats[:self.top]]
+                mem_path.write_text('\n'.join(lines) + '\n', encoding='utf-8')
+                written.append(mem_path)
+
+            logging.info(f"Profil sonuçları yazıldı: {', '.join(str(p) for p in written)}")
+        except OSError as e:
+            logging.error(f"Profil sonuçları yazılamadı: {str(e)}")
@@ -0,0 +1,294 @@
+"""
+İşçi thread'lerinden gelen ilerleme bildirimlerini birleştirip GUI'ye sabit
+hızda aktaran toplayıcı
+"""
+
+import time
+import logging
+import itertools
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+# Varsayılan GUI güncelleme aralığı (10 Hz)
+DEFAULT_INTERVAL_MS = 100
+
+
+@dataclass(frozen=True)
+class Transfer:
+    """Devam eden tek bir kopyalamanın anlık görüntüsü"""
+    path: str
+    size: int
+    copied: int
+    elapsed: float
+
+    @property
+    def percent(self) -> float:
+        return self.copied * 100.0 / self.size if self.size else 0.0
+
+    @property
+    def speed(self) -> float:
+        return self.copied / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class TransferTable:
+    """İşçilerin güncellediği, GUI'nin okuduğu aktarım ve hata tablosu
+
+    Tarayıcı kuyruğa aldığı her dosyayı queue() ile ekler; işçi başladığında
+    girdi sıradakilerden aktiflere taşınır. Tüm yazmalar tek bir sözlük/deque
+    işlemidir (GIL altında atomik), bu yüzden kopyalama işçileri kilit beklemez.
+    """
+
+    def __init__(self, max_errors: int = 1000):
+        self._queued: Dict[str, int] = {}
+        self._active: Dict[str, list] = {}
+        self._errors: Deque[Tuple[datetime, str, str]] = deque(maxlen=max_errors)
+
+    def queue(self, path: str, size: int) -> None:
+        self._queued[path] = size
+
+    def begin(self, path: str, size: int) -> None:
+        self._queued.pop(path, None)
+        self._active[path] = [size, 0, time.monotonic()]
+
+    def advance(self, path: str, copied: int) -> None:
+        entry = self._active.get(path)
+        if entry is not None:
+            entry[1] = copied
+
+    def end(self, path: str) -> None:
+        self._queued.pop(path, None)
+        self._active.pop(path, None)
+
+    def fail(self, path: str, message: str) -> None:
+        self._errors.append((datetime.now(), path, message))
+
+    def reset(self) -> None:
+        """Sıradaki ve aktif aktarımları temizle (hata geçmişi korunur)"""
+        self._queued.clear()
+        self._active.clear()
+
+    def snapshot(self) -> List[Transfer]:
+        """Aktif aktarımları başlangıç sırasına göre döndür"""
+        now = time.monotonic()
+        return [
+            Transfer(path, size, copied, now - started)
+            for path, (size, copied, started) in list(self._active.items())
+        ]
+
+    def queued(self) -> List[Tuple[str, int]]:
+        """Henüz başlamamış (yol, boyut) girdilerini kuyruğa alınma sırasına göre döndür"""
+        return list(self._queued.items())
+
+    def recent_errors(self) -> List[Tuple[datetime, str, str]]:
+        """Son hataları yeniden eskiye döndür"""
+        return list(reversed(self._errors))
+
+    @property
+    def error_count(self) -> int:
+        return len(self._errors)
+
+
+@dataclass(frozen=True)
+class TransferView:
+    """Bir GUI periyodunda bir kez alınan aktarım tablosu görüntüsü"""
+    active: List[Transfer]
+    queued: List[Tuple[str, int]]
+    errors: List[Tuple[datetime, str, str]]
+
+
+_EMPTY_VIEW = TransferView([], [], [])
+
+
+class ProgressAggregator:
+    """İlerleme mesajlarını kilitsiz biçimde toplar, Tk ana thread'inde uygular
+
+    post() işçi thread'lerinden çağrılır ve yalnızca bir sözlük girdisi ile
+    bir sayaç günceller (GIL altında atomik); Tk'ye hiç dokunmaz. start() ile
+    kurulan zamanlayıcı ana thread'de en fazla `interval_ms` aralıkla son
+    durumu tek seferde ekrana yansıtır, aradaki güncellemeler birleşir.
+    """
+
+    def __init__(self, interval_ms: int = DEFAULT_INTERVAL_MS):
+        self.interval_ms = interval_ms
+        self.applied = 0
+        self._seq = itertools.count(1)
+        self._latest: Tuple[int, str, Optional[float]] = (0, '', None)
+        self._slots: Dict[int, Tuple[str, Optional[float]]] = {}
+        self._applied_seq = 0
+        self._root = None
+        self._apply: Optional[Callable[[str, Optional[float]], None]] = None
+        self._on_tick: Optional[Callable[[], None]] = None
+        self._transfers: Optional[TransferTable] = None
+        self._view = _EMPTY_VIEW
+        self._after_id = None
+
+    def post(self, message: str, progress: Optional[float] = None) -> None:
+        """İlerleme bildir (herhangi bir thread'den, engellemez)"""
+        self._latest = (next(self._seq), message, progress)
+        self._slots[threading.get_ident()] = (message, progress)
+
+    __call__ = post
+
+    @property
+    def posted(self) -> int:
+        """Şimdiye kadar yapılan bildirim sayısı"""
+        return self._latest[0]
+
+    def latest(self) -> Tuple[int, str, Optional[float]]:
+        """Son bildirimi (sıra no, mesaj, ilerleme) döndür"""
+        return self._latest
+
+    def worker_states(self) -> Dict[int, Tuple[str, Optional[float]]]:
+        """İşçi thread'i başına son bildirim"""
+        return dict(self._slots)
+
+    def reset(self) -> None:
+        """İşçi durumlarını temizle"""
+        self._slots.clear()
+
+    def transfer_view(self) -> TransferView:
+        """Bu periyotta alınmış aktarım görüntüsü (ana thread'den)"""
+        return self._view
+
+    def start(self, root, apply: Callable[[str, Optional[float]], None],
+              on_tick: Optional[Callable[[], None]] = None,
+              transfers: Optional[TransferTable] = None) -> None:
+        """Tk ana döngüsünde periyodik uygulamayı başlat (ana thread'den çağrılmalı)
+
+        on_tick verilirse her periyotta bir kez çağrılır (ör. aktarım paneli).
+        transfers verilirse tablo periyot başına bir kez okunur ve on_tick
+        içinde transfer_view() ile kullanılır.
+        """
+        self.stop()
+        self._root = root
+        self._apply = apply
+        self._on_tick = on_tick
+        self._transfers = transfers
+        self._after_id = root.after(self.interval_ms, self._tick)
+
+    def stop(self) -> None:
+        """Zamanlayıcıyı durdur; bekleyen son durumu uygula"""
+        if self._root is not None and self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+            self.flush()
+            self._take_view()
+
+    def _take_view(self) -> None:
+        table = self._transfers
+        if table is not None:
+            self._view = TransferView(table.snapshot(), table.queued(), table.recent_errors())
+
+    def flush(self) -> bool:
+        """Yeni bir bildirim varsa hemen uygula (ana thread'den)"""
+        seq, message, progress = self._latest
+        if seq == self._applied_seq or self._apply is None:
+            return False
+        self._applied_seq = seq
+        self._apply(message, progress)
+        self.applied += 1
+        return True
+
+    def _tick(self) -> None:
+        try:
+            self.flush()
+            self._take_view()
+            if self._on_tick is not None:
+                self._on_tick()
+        finally:
+            self._after_id = self._root.after(self.interval_ms, self._tick)
+
+
+class StatsPublisher:
+    """İstatistik anlık görüntülerini abonelere sınırlı hızda iten yayıncı
+
+    Arka plandaki tek bir thread SyncStats.changed olayını bekler; sayaç
+    güncellemeleri olayı kurar. Uyanınca değişen durum her aboneye en fazla
+    `interval` aralıkla iletilir, aradaki değişiklikler birleşir. Döngü
+    sürerken sayaç değişmese de her aralıkta örnek alınıp gönderilir;
+    böylece uzun kopyalarda ve yeniden denemelerde hız ve kalan süre
+    donmaz, zamanla düşer. Döngüler arasında tüm aboneler güncelken
+    thread süresiz bekler, boşta hiç çalışmaz. Geri
+    çağrılar yayıncı thread'inde çalışır; GUI aboneleri değeri saklayıp
+    kendi ana thread'inde uygulamalıdır.
+    """
+
+    MIN_INTERVAL = 0.1
+
+    def __init__(self, stats):
+        self.stats = stats
+        self._subscribers: Dict[int, list] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def subscribe(self, callback: Callable, interval: float = 1.0) -> Callable[[], None]:
+        """Aboneliği kaydet; aboneliği iptal eden fonksiyonu döndür"""
+        token = next(self._ids)
+        with self._lock:
+            # [geri çağrı, aralık, son gönderim zamanı, son görülen durum]
+            self._subscribers[token] = [callback, max(self.MIN_INTERVAL, interval), 0.0, None]
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="StatsPublisher", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        self.stats.changed.set()
+        return lambda: self.unsubscribe(token)
+
+    def unsubscribe(self, token: int) -> None:
+        with self._lock:
+            self._subscribers.pop(token, None)
+        self._wake.set()
+        self.stats.changed.set()
+
+    def _state(self) -> tuple:
+        counters = self.stats.counters()
+        return (tuple(counters.values()), self.stats.current_file,
+                self.stats.start_time, self.stats.end_time, self.stats.scan_complete)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    self._thread = None
+                    return
+                subscribers = list(self._subscribers.values())
+            # Okumadan önce temizlenir; okuma sırasındaki değişiklik olayı yeniden kurar
+            self.stats.changed.clear()
+            running = self.stats.running
+            if running:
+                self.stats.sample()
+            now = time.monotonic()
+            state = self._state()
+            snapshot = None
+            wait = None
+            for entry in subscribers:
+                callback, interval, last_sent, last_state = entry
+                due = interval - (now - last_sent)
+                if state == last_state and not running:
+                    continue
+                if due > 0:
+                    wait = due if wait is None else min(wait, due)
+                    continue
+                if snapshot is None:
+                    snapshot = self.stats.snapshot()
+                entry[2], entry[3] = now, state
+                if running:
+                    # Döngü sürerken bir sonraki gönderim de zamanlanır
+                    wait = interval if wait is None else min(wait, interval)
+                try:
+                    callback(snapshot)
+                except Exception as e:
+                    logging.error(f"İstatistik abonesi hatası: {str(e)}")
+            if wait is None:
+                # Herkes güncel: bir sonraki sayaç değişikliğine kadar bekle
+                self.stats.changed.wait()
+            else:
+                # Gönderim zamanı gelmemiş değişiklik ya da süren döngü var; sayaç olayları
+                # thread'i erkenden döndürmesin diye ayrı olay beklenir
+                self._wake.wait(wait)
+                self._wake.clear()
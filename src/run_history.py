@@ -0,0 +1,153 @@
+"""
+Çalışma raporları için JSON Lines geçmiş deposu ve eğilim sorguları
+"""
+
+import os
+import json
+import logging
+import argparse
+import threading
+from statistics import median
+from typing import Any, Dict, List, Optional
+
+from .sync_stats import format_size
+
+DEFAULT_HISTORY_PATH = os.path.join('logs', 'run_history.jsonl')
+
+
+class RunHistory:
+    """Her satırı bir çalışma raporu olan, boyutu sınırlı geçmiş dosyası"""
+
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, max_runs: int = 1000):
+        self.path = path
+        self.max_runs = max_runs
+        self._count: Optional[int] = None
+        self._lock = threading.Lock()
+
+    def append(self, report: Dict[str, Any]) -> None:
+        """Raporu tek satır olarak ekle; kayıt sayısı sınırın iki katına ulaşınca eskileri at"""
+        line = json.dumps(report, ensure_ascii=False, separators=(',', ':'), default=str)
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            if self._count is None:
+                self._count = len(self._read_lines())
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+            self._count += 1
+            if 0 < self.max_runs and 2 * self.max_runs <= self._count:
+                self._compact()
+
+    def _read_lines(self) -> List[str]:
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return f.readlines()
+        except FileNotFoundError:
+            return []
+
+    def _compact(self) -> None:
+        lines = self._read_lines()[-self.max_runs:]
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.writelines(lines)
+        os.replace(tmp_path, self.path)
+        logging.debug(f"Çalışma geçmişi sıkıştırıldı: {self._count} -> {len(lines)}")
+        self._count = len(lines)
+
+    def load(self, limit: int = 0) -> List[Dict[str, Any]]:
+        """Raporları eskiden yeniye döndür (limit verilirse son N kayıt)"""
+        lines = self._read_lines()
+        reports = []
+        for line in lines[-limit:] if limit > 0 else lines:
+            try:
+                reports.append(json.loads(line))
+            except ValueError:
+                logging.warning(f"Bozuk geçmiş satırı atlandı: {line[:80]}")
+        return reports
+
+
+def throughput_trend(reports: List[Dict[str, Any]], baseline: int = 10,
+                     threshold: float = 0.25) -> List[Dict[str, Any]]:
+    """Her çalışmanın hızını önceki çalışmaların medyanıyla karşılaştır"""
+    rows = []
+    previous: List[float] = []
+    for report in reports:
+        rate = report.get('bytes_per_second', 0.0)
+        copied = report.get('counters', {}).get('bytes_copied', 0)
+        reference = median(previous[-baseline:]) if previous else None
+        change = (rate - reference) / reference if reference and copied > 0 else None
+        rows.append({
+            'start': report.get('start'),
+            'status': report.get('status', ''),
+            'files_copied': report.get('counters', {}).get('files_copied', 0),
+            'bytes_copied': copied,
+            'bytes_per_second': rate,
+            'change': change,
+            'regression': change is not None and change <= -threshold,
+        })
+        # Hiç veri taşımayan çalışmalar referansı bozmasın
+        if copied > 0:
+            previous.append(rate)
+    return rows
+
+
+def slowest_files(reports: List[Dict[str, Any]], count: int = 10) -> List[Dict[str, Any]]:
+    """Çalışmalar boyunca en yavaş görülen dosyalar"""
+    worst: Dict[str, Dict[str, Any]] = {}
+    for report in reports:
+        for entry in report.get('slowest_files', []):
+            current = worst.get(entry['path'])
+            if current is None or entry['seconds'] > current['seconds']:
+                worst[entry['path']] = dict(entry, start=report.get('start'))
+    return sorted(worst.values(), key=lambda entry: entry['seconds'], reverse=True)[:count]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Çalışma geçmişi komut satırı arayüzü"""
+    parser = argparse.ArgumentParser(description="Senkronizasyon çalışma geçmişi")
+    parser.add_argument('--history', default=DEFAULT_HISTORY_PATH, help="Geçmiş dosyası")
+    parser.add_argument('--last', type=int, default=30, help="İncelenecek son çalışma sayısı")
+    parser.add_argument('--job', help="Yalnızca bu işin çalışmaları ([job:AD] bölümü)")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    trend_cmd = commands.add_parser('trend', help="Aktarım hızı eğilimini göster")
+    trend_cmd.add_argument('--baseline', type=int, default=10,
+                           help="Karşılaştırmada kullanılan önceki çalışma sayısı")
+    trend_cmd.add_argument('--threshold', type=float, default=0.25,
+                           help="Gerileme sayılacak hız düşüşü oranı")
+    commands.add_parser('slowest', help="En yavaş dosyaları listele")
+    show_cmd = commands.add_parser('show', help="Son çalışma raporunu yazdır")
+    show_cmd.add_argument('--config', action='store_true', help="Kullanılan yapılandırmayı da yazdır")
+
+    args = parser.parse_args(argv)
+    if args.job:
+        reports = [r for r in RunHistory(args.history).load() if r.get('job') == args.job]
+        reports = reports[-args.last:] if args.last > 0 else reports
+    else:
+        reports = RunHistory(args.history).load(args.last)
+    if not reports:
+        print("Çalışma geçmişi boş")
+        return 1
+
+    if args.command == 'trend':
+        regressions = 0
+        for row in throughput_trend(reports, args.baseline, args.threshold):
+            change = f"{row['change']:+.0%}" if row['change'] is not None else '-'
+            flag = ' GERİLEME' if row['regression'] else ''
+            regressions += row['regression']
+            print(f"{row['start']}\t{row['status']}\t{row['files_copied']}\t"
+                  f"{format_size(row['bytes_copied'])}\t{format_size(row['bytes_per_second'])}/s\t"
+                  f"{change}{flag}")
+        return 2 if regressions else 0
+    if args.command == 'slowest':
+        for entry in slowest_files(reports):
+            print(f"{entry['seconds']:.3f}s\t{format_size(entry['size'])}\t{entry['path']}\t{entry['start']}")
+    elif args.command == 'show':
+        report = dict(reports[-1])
+        if not args.config:
+            report.pop('config', None)
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,135 @@
+"""
+Sıcak/soğuk alt ağaç taraması
+
+Döngüler boyunca her klasörün son değişiklik döngüsü tutulur. Son
+`hot_cycles` döngüde değişen alt ağaçlar (sıcak) her döngüde taranır;
+diğerleri (soğuk) yalnızca `cold_interval` döngüde bir taranır. Soğuk bir
+alt ağaç atlanmadan önce bilinen klasörlerinin mtime değerlerine bakılır;
+biri değiştiyse alt ağaç hemen sıcağa yükseltilir.
+
+Klasör mtime'ı yalnızca girdi eklenip silindiğinde değişir; yerinde
+değiştirilen dosyalar soğuk alt ağaçlarda bir sonraki soğuk taramada bulunur.
+"""
+
+import os
+import zlib
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Set
+
+# İlk taramada görülen klasörler sıcak sayılmaz
+_NEVER = -(1 << 30)
+
+
+@dataclass
+class DirState:
+    """Bir klasörün son taramadaki durumu"""
+    mtime_ns: int
+    last_change: int = _NEVER
+    children: List[str] = field(default_factory=list)
+
+
+class ScanTiers:
+    """Klasör bazında sıcak/soğuk tarama kararları (tek tarayıcı thread'i kullanır)"""
+
+    def __init__(self, hot_cycles: int = 3, cold_interval: int = 10):
+        self.hot_cycles = hot_cycles
+        self.cold_interval = cold_interval
+        self.cycle = 0
+        self.skipped = 0
+        self.promoted = 0
+        self._dirs: Dict[str, DirState] = {}
+        self._sweeping: Set[str] = set()
+        self._key: Any = None
+
+    def begin_cycle(self, key: Any) -> None:
+        """Yeni döngüye başla; kaynak/hedef veya filtreler değiştiyse geçmişi sil"""
+        if key != self._key:
+            self._key = key
+            self._dirs = {}
+            self.cycle = 0
+        self.cycle += 1
+        self.skipped = 0
+        self.promoted = 0
+        self._sweeping = set()
+
+    def visit(self, rel_dir: str, path: str, children: List[str]) -> None:
+        """Taranan klasörü ve (filtre sonrası) alt klasörlerini kaydet"""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            self.forget(rel_dir)
+            return
+        state = self._dirs.get(rel_dir)
+        if state is None:
+            # İlk döngüden sonra beliren klasör yeni bir değişikliktir
+            state = self._dirs[rel_dir] = DirState(mtime_ns)
+            if self.cycle > 1:
+                self.mark_changed(rel_dir)
+        elif state.mtime_ns != mtime_ns:
+            state.mtime_ns = mtime_ns
+            self.mark_changed(rel_dir)
+        if state.children != children:
+            # Artık listelenmeyen (silinen veya filtrelenen) alt klasörler unutulur
+            for child in set(state.children).difference(children):
+                self.forget(f"{rel_dir}/{child}" if rel_dir else child)
+            state.children = list(children)
+
+    def forget(self, rel_dir: str) -> None:
+        """Klasörü ve bilinen alt klasörlerini geçmişten sil"""
+        stack = [rel_dir]
+        while stack:
+            rel = stack.pop()
+            state = self._dirs.pop(rel, None)
+            if state is not None:
+                stack.extend(f"{rel}/{child}" if rel else child for child in state.children)
+
+    def mark_changed(self, rel_dir: str) -> None:
+        """Klasörü ve üst klasörlerini bu döngüde değişmiş olarak işaretle"""
+        while True:
+            state = self._dirs.get(rel_dir)
+            if state is not None:
+                state.last_change = self.cycle
+            if not rel_dir:
+                return
+            rel_dir = rel_dir.rpartition('/')[0]
+
+    def should_descend(self, rel_dir: str, path: str) -> bool:
+        """Bu döngüde alt ağaca inilmeli mi"""
+        state = self._dirs.get(rel_dir)
+        if state is None or self.cycle - state.last_change <= self.hot_cycles:
+            return True
+        # Soğuk alt ağaçların tam taraması döngülere yayılır; taranan alt ağacın
+        # tüm klasörlerine inilir (tarama yukarıdan aşağı ilerler)
+        if (rel_dir.rpartition('/')[0] in self._sweeping or
+                (self.cycle + zlib.crc32(rel_dir.encode('utf-8'))) % self.cold_interval == 0):
+            self._sweeping.add(rel_dir)
+            return True
+        if self._subtree_changed(rel_dir, path):
+            self.promoted += 1
+            self.mark_changed(rel_dir)
+            return True
+        self.skipped += 1
+        return False
+
+    def _subtree_changed(self, rel_dir: str, path: str) -> bool:
+        """Alt ağaçtaki bilinen klasörlerden birinin mtime'ı değişti mi"""
+        stack = [(rel_dir, path)]
+        while stack:
+            rel, full = stack.pop()
+            state = self._dirs.get(rel)
+            if state is None:
+                return True
+            try:
+                if os.stat(full).st_mtime_ns != state.mtime_ns:
+                    return True
+            except OSError:
+                # Silinen klasör bir değişikliktir; kaydı tutulmaz
+                self.forget(rel)
+                return True
+            stack.extend((f"{rel}/{child}", os.path.join(full, child)) for child in state.children)
+        return False
+
+    def hot_count(self) -> int:
+        """Şu anda sıcak sayılan klasör sayısı"""
+        return sum(1 for state in self._dirs.values()
+                   if self.cycle - state.last_change <= self.hot_cycles)
@@ -5,8 +5,15 @@ Senkronizasyon yapılandırma sınıfı
 from dataclasses import dataclass
 import configparser
 import os
-from typing import Optional
 from .exceptions import ConfigError
+from .throttle import IO_PRIORITIES, parse_limit_windows
+
+# Taramada hangi klasör ve dosyaların görüleceğini belirleyen ayarlar
+SCAN_FIELDS = (
+    'file_patterns', 'folder_patterns', 'exclude_patterns', 'ignore_file_name', 'max_depth',
+    'date_filter_enabled', 'start_date', 'end_date', 'min_file_size', 'max_file_size',
+    'min_age_minutes', 'max_age_minutes',
+)
 
 @dataclass
 class SyncConfig:
@@ -14,14 +21,48 @@ class SyncConfig:
     
     # Varsayılan değerler
     check_interval: int = 10
+    adaptive_interval: bool = False
+    min_check_interval: int = 5
+    max_check_interval: int = 600
+    tiered_scan: bool = False
+    hot_subtree_cycles: int = 3
+    cold_scan_interval: int = 10
     file_patterns: str = '*.*'
     folder_patterns: str = '.*'
     exclude_patterns: str = '.git/*,*.tmp'
+    ignore_file_name: str = '.syncignore'
     backup_enabled: bool = False
+    backup_strategy: str = 'move'
+    backup_mode: str = 'folder'
+    backup_store_path: str = ''
+    backup_threads: int = 2
+    backup_max_count: int = 5
+    backup_max_age_days: int = 0
+    backup_max_total_mb: int = 0
     max_threads: int = 4
     date_filter_enabled: bool = False
     start_date: str = ''
     end_date: str = ''
+    min_file_size: int = 0
+    max_file_size: int = 0
+    min_age_minutes: int = 0
+    max_age_minutes: int = 0
+    max_depth: int = 0
+    metrics_enabled: bool = False
+    metrics_host: str = '127.0.0.1'
+    metrics_port: int = 9108
+    notification_window: int = 60
+    log_mode: str = 'direct'
+    log_sample_rate: int = 1
+    global_max_threads: int = 0
+    global_max_bytes_per_second: int = 0
+    device_max_concurrency: int = 0
+    limit_windows: str = ''
+    worker_nice: int = 0
+    worker_io_priority: str = 'none'
+    pressure_enabled: bool = False
+    pressure_shrink_threshold: int = 20
+    pressure_pause_threshold: int = 60
 
     @classmethod
     def from_file(cls, config_path: str = 'config.ini') -> 'SyncConfig':
@@ -31,36 +72,116 @@ class SyncConfig:
             
             if os.path.exists(config_path):
                 config.read(config_path, encoding='utf-8')
-                return cls(
-                    check_interval=config.getint('DEFAULT', 'check_interval', fallback=10),
-                    file_patterns=config.get('DEFAULT', 'file_patterns', fallback='*.*'),
-                    folder_patterns=config.get('DEFAULT', 'folder_patterns', fallback='.*'),
-                    exclude_patterns=config.get('DEFAULT', 'exclude_patterns', fallback='.git/*,*.tmp'),
-                    backup_enabled=config.getboolean('DEFAULT', 'backup_enabled', fallback=False),
-                    max_threads=config.getint('DEFAULT', 'max_threads', fallback=4),
-                    date_filter_enabled=config.getboolean('DEFAULT', 'date_filter_enabled', fallback=False),
-                    start_date=config.get('DEFAULT', 'start_date', fallback=''),
-                    end_date=config.get('DEFAULT', 'end_date', fallback='')
-                )
+                return cls.from_section(config, 'DEFAULT')
             return cls()
             
         except Exception as e:
             raise ConfigError(f"Yapılandırma yükleme hatası: {str(e)}")
 
+    @classmethod
+    def from_section(cls, parser: configparser.ConfigParser, section: str) -> 'SyncConfig':
+        """Ayrıştırılmış dosyanın bir bölümünden yükle
+
+        configparser bölümlerde bulunmayan anahtarları DEFAULT'tan alır; böylece
+        [job:ad] bölümleri yalnızca farklı olan ayarları yazabilir.
+        """
+        return cls(
+            check_interval=parser.getint(section, 'check_interval', fallback=10),
+            adaptive_interval=parser.getboolean(section, 'adaptive_interval', fallback=False),
+            min_check_interval=parser.getint(section, 'min_check_interval', fallback=5),
+            max_check_interval=parser.getint(section, 'max_check_interval', fallback=600),
+            tiered_scan=parser.getboolean(section, 'tiered_scan', fallback=False),
+            hot_subtree_cycles=parser.getint(section, 'hot_subtree_cycles', fallback=3),
+            cold_scan_interval=parser.getint(section, 'cold_scan_interval', fallback=10),
+            file_patterns=parser.get(section, 'file_patterns', fallback='*.*'),
+            folder_patterns=parser.get(section, 'folder_patterns', fallback='.*'),
+            exclude_patterns=parser.get(section, 'exclude_patterns', fallback='.git/*,*.tmp'),
+            ignore_file_name=parser.get(section, 'ignore_file_name', fallback='.syncignore'),
+            backup_enabled=parser.getboolean(section, 'backup_enabled', fallback=False),
+            backup_strategy=parser.get(section, 'backup_strategy', fallback='move'),
+            backup_mode=parser.get(section, 'backup_mode', fallback='folder'),
+            backup_store_path=parser.get(section, 'backup_store_path', fallback=''),
+            backup_threads=parser.getint(section, 'backup_threads', fallback=2),
+            backup_max_count=parser.getint(section, 'backup_max_count', fallback=5),
+            backup_max_age_days=parser.getint(section, 'backup_max_age_days', fallback=0),
+            backup_max_total_mb=parser.getint(section, 'backup_max_total_mb', fallback=0),
+            max_threads=parser.getint(section, 'max_threads', fallback=4),
+            date_filter_enabled=parser.getboolean(section, 'date_filter_enabled', fallback=False),
+            start_date=parser.get(section, 'start_date', fallback=''),
+            end_date=parser.get(section, 'end_date', fallback=''),
+            min_file_size=parser.getint(section, 'min_file_size', fallback=0),
+            max_file_size=parser.getint(section, 'max_file_size', fallback=0),
+            min_age_minutes=parser.getint(section, 'min_age_minutes', fallback=0),
+            max_age_minutes=parser.getint(section, 'max_age_minutes', fallback=0),
+            max_depth=parser.getint(section, 'max_depth', fallback=0),
+            metrics_enabled=parser.getboolean(section, 'metrics_enabled', fallback=False),
+            metrics_host=parser.get(section, 'metrics_host', fallback='127.0.0.1'),
+            metrics_port=parser.getint(section, 'metrics_port', fallback=9108),
+            notification_window=parser.getint(section, 'notification_window', fallback=60),
+            log_mode=parser.get(section, 'log_mode', fallback='direct'),
+            log_sample_rate=parser.getint(section, 'log_sample_rate', fallback=1),
+            global_max_threads=parser.getint(section, 'global_max_threads', fallback=0),
+            global_max_bytes_per_second=parser.getint(section, 'global_max_bytes_per_second', fallback=0),
+            device_max_concurrency=parser.getint(section, 'device_max_concurrency', fallback=0),
+            limit_windows=parser.get(section, 'limit_windows', fallback=''),
+            worker_nice=parser.getint(section, 'worker_nice', fallback=0),
+            worker_io_priority=parser.get(section, 'worker_io_priority', fallback='none'),
+            pressure_enabled=parser.getboolean(section, 'pressure_enabled', fallback=False),
+            pressure_shrink_threshold=parser.getint(section, 'pressure_shrink_threshold', fallback=20),
+            pressure_pause_threshold=parser.getint(section, 'pressure_pause_threshold', fallback=60)
+        )
+
     def save(self, config_path: str = 'config.ini') -> None:
         """Yapılandırmayı dosyaya kaydet"""
         try:
             config = configparser.ConfigParser()
+            # [job:...] gibi diğer bölümler kaybolmasın
+            if os.path.exists(config_path):
+                config.read(config_path, encoding='utf-8')
             config['DEFAULT'] = {
                 'check_interval': str(self.check_interval),
+                'adaptive_interval': str(self.adaptive_interval).lower(),
+                'min_check_interval': str(self.min_check_interval),
+                'max_check_interval': str(self.max_check_interval),
+                'tiered_scan': str(self.tiered_scan).lower(),
+                'hot_subtree_cycles': str(self.hot_subtree_cycles),
+                'cold_scan_interval': str(self.cold_scan_interval),
                 'file_patterns': self.file_patterns,
                 'folder_patterns': self.folder_patterns,
                 'exclude_patterns': self.exclude_patterns,
+                'ignore_file_name': self.ignore_file_name,
                 'backup_enabled': str(self.backup_enabled).lower(),
+                'backup_strategy': self.backup_strategy,
+                'backup_mode': self.backup_mode,
+                'backup_store_path': self.backup_store_path,
+                'backup_threads': str(self.backup_threads),
+                'backup_max_count': str(self.backup_max_count),
+                'backup_max_age_days': str(self.backup_max_age_days),
+                'backup_max_total_mb': str(self.backup_max_total_mb),
                 'max_threads': str(self.max_threads),
                 'date_filter_enabled': str(self.date_filter_enabled).lower(),
                 'start_date': self.start_date,
-                'end_date': self.end_date
+                'end_date': self.end_date,
+                'min_file_size': str(self.min_file_size),
+                'max_file_size': str(self.max_file_size),
+                'min_age_minutes': str(self.min_age_minutes),
+                'max_age_minutes': str(self.max_age_minutes),
+                'max_depth': str(self.max_depth),
+                'metrics_enabled': str(self.metrics_enabled).lower(),
+                'metrics_host': self.metrics_host,
+                'metrics_port': str(self.metrics_port),
+                'notification_window': str(self.notification_window),
+                'log_mode': self.log_mode,
+                'log_sample_rate': str(self.log_sample_rate),
+                'global_max_threads': str(self.global_max_threads),
+                'global_max_bytes_per_second': str(self.global_max_bytes_per_second),
+                'device_max_concurrency': str(self.device_max_concurrency),
+                'limit_windows': self.limit_windows,
+                'worker_nice': str(self.worker_nice),
+                'worker_io_priority': self.worker_io_priority,
+                'pressure_enabled': str(self.pressure_enabled).lower(),
+                'pressure_shrink_threshold': str(self.pressure_shrink_threshold),
+                'pressure_pause_threshold': str(self.pressure_pause_threshold)
             }
             
             with open(config_path, 'w', encoding='utf-8') as f:
@@ -74,15 +195,71 @@ class SyncConfig:
         if self.check_interval < 1:
             raise ConfigError("Kontrol aralığı 1'den küçük olamaz")
             
+        if not 1 <= self.min_check_interval <= self.max_check_interval:
+            raise ConfigError("Uyarlanır aralık sınırları 1 <= en az <= en çok olmalıdır")
+            
+        if self.hot_subtree_cycles < 1 or self.cold_scan_interval < 1:
+            raise ConfigError("Sıcak/soğuk tarama döngü sayıları 1'den küçük olamaz")
+            
         if self.max_threads < 1:
             raise ConfigError("Thread sayısı 1'den küçük olamaz")
             
+        if min(self.min_file_size, self.max_file_size, self.min_age_minutes,
+               self.max_age_minutes, self.max_depth) < 0:
+            raise ConfigError("Filtre sınırları negatif olamaz")
+            
+        if not 0 < self.metrics_port < 65536:
+            raise ConfigError(f"Geçersiz metrik portu: {self.metrics_port}")
+            
+        if self.notification_window < 1:
+            raise ConfigError("Bildirim özeti aralığı 1 saniyeden küçük olamaz")
+            
+        if self.log_mode not in ('queue', 'direct'):
+            raise ConfigError(f"Geçersiz log modu: {self.log_mode}")
+            
+        if self.log_sample_rate < 0:
+            raise ConfigError("Log örnekleme oranı negatif olamaz")
+            
+        if min(self.global_max_threads, self.global_max_bytes_per_second,
+               self.device_max_concurrency) < 0:
+            raise ConfigError("Genel kaynak sınırları negatif olamaz")
+            
+        try:
+            parse_limit_windows(self.limit_windows)
+        except ValueError as e:
+            raise ConfigError(str(e))
+            
+        if not 0 <= self.worker_nice <= 19:
+            raise ConfigError("İşçi nice değeri 0-19 arasında olmalıdır")
+            
+        if self.worker_io_priority not in IO_PRIORITIES:
+            raise ConfigError(f"Geçersiz G/Ç önceliği: {self.worker_io_priority}")
+            
+        if not 0 < self.pressure_shrink_threshold <= self.pressure_pause_threshold <= 100:
+            raise ConfigError("Baskı eşikleri 0 < azaltma <= duraklatma <= 100 olmalıdır")
+            
+        if self.backup_threads < 1:
+            raise ConfigError("Yedekleme thread sayısı 1'den küçük olamaz")
+            
         if not self.file_patterns:
             raise ConfigError("Dosya desenleri boş olamaz")
             
         if not self.folder_patterns:
             raise ConfigError("Klasör desenleri boş olamaz")
 
+        if self.backup_strategy not in ('move', 'hardlink'):
+            raise ConfigError(f"Geçersiz yedekleme yöntemi: {self.backup_strategy}")
+
+        if self.backup_mode not in ('folder', 'store'):
+            raise ConfigError(f"Geçersiz yedekleme modu: {self.backup_mode}")
+
+        if min(self.backup_max_count, self.backup_max_age_days, self.backup_max_total_mb) < 0:
+            raise ConfigError("Yedek saklama sınırları negatif olamaz")
+
+    def scan_key(self) -> tuple:
+        """Tarama sonucunu etkileyen ayarların değerleri (diğer ayarlar hariç)"""
+        return tuple(getattr(self, name) for name in SCAN_FIELDS)
+
     def __post_init__(self):
         """Dataclass sonrası başlatıcı"""
         self.validate()
\ No newline at end of file
@@ -2,64 +2,542 @@
 Senkronizasyon istatistikleri sınıfı
 """
 
-from dataclasses import dataclass
+import heapq
+import math
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from .pressure import STATE_LABELS
+
+# Thread başına shard'larda tutulan sayaçlar
+COUNTERS = (
+    'files_scanned',
+    'files_skipped',
+    'files_copied',
+    'files_failed',
+    'files_backed_up',
+    'backup_failures',
+    'bytes_copied',
+    'bytes_transferred',
+    'bytes_read',
+    'bytes_written',
+    'backup_time',
+    'files_queued',
+    'bytes_queued',
+    'bytes_failed',
+    'files_started',
+    'active_workers',
+    'pressure_pauses',
+    'pressure_shrinks',
+    'subtrees_skipped',
+    'files_cancelled',
+)
+
+# Gecikme ölçülen işlemler
+LATENCY_OPS = ('stat', 'open', 'copy', 'backup')
+
+# Senkronizasyon aşamaları (gösterim sırası)
+PHASES = ('walk', 'match', 'compare', 'throttle', 'pressure', 'backup', 'copy', 'drain', 'metadata', 'notify')
+
+# Çalışma raporuna yazılan sayaçlar ve liste sınırları
+REPORT_COUNTERS = (
+    'files_scanned', 'files_skipped', 'files_copied', 'files_failed', 'files_backed_up',
+    'backup_failures', 'bytes_copied', 'bytes_read', 'bytes_written',
+    'pressure_pauses', 'pressure_shrinks', 'subtrees_skipped', 'files_cancelled',
+)
+SLOWEST_FILES = 10
+MAX_REPORT_ERRORS = 50
+
+# Hız penceresine sayaç güncellemelerinde ve yayıncının zamanlayıcısında
+# en fazla bu sıklıkla örnek eklenir (saniye)
+SAMPLE_INTERVAL = 0.5
+
+# Histogram: mikro saniye cinsinden, her ikinin kuvveti aralığı 4 alt kovaya bölünür
+_SUB_BUCKETS = 4
+_HIST_SIZE = 40 * _SUB_BUCKETS
+
+
+def _bucket_index(seconds: float) -> int:
+    micros = seconds * 1e6
+    if micros < 1:
+        return 0
+    mantissa, exponent = math.frexp(micros)
+    index = exponent * _SUB_BUCKETS + int((mantissa - 0.5) * 2 * _SUB_BUCKETS)
+    return min(index, _HIST_SIZE - 1)
+
+
+def _bucket_upper_bound(index: int) -> float:
+    """Kovanın üst sınırını saniye cinsinden döndür"""
+    exponent, sub = divmod(index, _SUB_BUCKETS)
+    return math.ldexp(0.5 + (sub + 1) / (2 * _SUB_BUCKETS), exponent) / 1e6
+
+
+def histogram_bounds(buckets: List[int]) -> List[Tuple[float, int]]:
+    """Prometheus histogramı için ikinin kuvveti sınırlarında kümülatif sayımlar
+
+    İnce kovalar her ikinin kuvveti aralığının sonunda toplanır; 2 µs ile
+    ~134 sn arası sınırlar döner (daha büyük değerler yalnızca +Inf'te sayılır).
+    """
+    bounds = []
+    seen = 0
+    for index, count in enumerate(buckets[:28 * _SUB_BUCKETS]):
+        seen += count
+        if index % _SUB_BUCKETS == _SUB_BUCKETS - 1 and index >= _SUB_BUCKETS:
+            bounds.append((_bucket_upper_bound(index), seen))
+    return bounds
+
+
+def percentile(buckets: List[int], fraction: float) -> float:
+    """Histogram kovalarından yüzdelik değeri (saniye) hesapla"""
+    total = sum(buckets)
+    if not total:
+        return 0.0
+    rank = fraction * total
+    seen = 0
+    for index, count in enumerate(buckets):
+        seen += count
+        if seen >= rank:
+            return _bucket_upper_bound(index)
+    return _bucket_upper_bound(len(buckets) - 1)
+
+
+@dataclass
+class StatsSnapshot:
+    """GUI ve loglar için istatistiklerin tutarlı anlık görüntüsü"""
+    timestamp: float
+    duration: float
+    counters: Dict[str, float]
+    files_per_second: float
+    bytes_per_second: float
+    average_bytes_per_second: float
+    latencies: Dict[str, Dict[str, float]]
+    remaining_bytes: int
+    eta_seconds: Optional[float]
+    scan_complete: bool
+    current_file: str
+    pressure_state: str = 'normal'
+
+    def format_status(self) -> str:
+        """Durum çubuğu için tek satırlık özet"""
+        c = self.counters
+        text = (
+            f"Kopyalanan: {c['files_copied']}/{c['files_queued']} dosya | "
+            f"Toplam: {format_size(c['bytes_copied'])} | "
+            f"Hız: {format_size(self.bytes_per_second)}/s "
+            f"({self.files_per_second:.1f} dosya/s)"
+        )
+        if self.eta_seconds is not None:
+            text += f" | Kalan: {format_eta(self.eta_seconds)}"
+        elif not self.scan_complete:
+            text += " | Taranıyor..."
+        if self.pressure_state != 'normal':
+            text += f" | Sistem baskısı: {STATE_LABELS.get(self.pressure_state, self.pressure_state)}"
+        return text
+
+    def format_latencies(self) -> str:
+        """Gecikme yüzdeliklerini log satırı olarak formatla"""
+        parts = []
+        for op, values in self.latencies.items():
+            if values['count']:
+                parts.append(
+                    f"{op}: p50={values['p50'] * 1000:.2f}ms "
+                    f"p95={values['p95'] * 1000:.2f}ms p99={values['p99'] * 1000:.2f}ms "
+                    f"(n={values['count']})"
+                )
+        return ' | '.join(parts) if parts else '-'
+
+
+def format_size(size: float) -> str:
+    """Boyutu insan okunabilir formata çevir"""
+    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} PB"
+
+
+def format_eta(seconds: float) -> str:
+    """Kalan süreyi ss:dd:sn biçiminde formatla"""
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    minutes, secs = divmod(rest, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
 
 @dataclass
 class SyncStats:
-    """Senkronizasyon istatistikleri sınıfı"""
-    
-    files_copied: int = 0
-    bytes_copied: int = 0
+    """Senkronizasyon istatistikleri sınıfı
+
+    Sayaçlar her işçi thread'inin kendi shard'ında kilitsiz artırılır ve
+    okunurken toplanır; böylece sıcak yolda kilit çekişmesi olmaz.
+    """
+
     last_sync: Optional[datetime] = None
     current_file: str = ''
     start_time: Optional[datetime] = None
-    
+    end_time: Optional[datetime] = None
+    scan_complete: bool = False
+    pressure_state: str = 'normal'
+    throughput_window: float = 10.0
+    filter_hits: Dict[str, int] = field(default_factory=dict)
+    _local: threading.local = field(default_factory=threading.local, repr=False, compare=False)
+    _shards: List[Dict[str, float]] = field(default_factory=list, repr=False, compare=False)
+    _shard_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+    _generation: int = field(default=0, repr=False, compare=False)
+    _samples: Deque[Tuple[float, float, float]] = field(default_factory=deque, repr=False, compare=False)
+    _last_sample: float = field(default=0.0, repr=False, compare=False)
+    # Sayaçlar değişince kurulur; StatsPublisher boştayken bunu bekler
+    changed: threading.Event = field(default_factory=threading.Event, repr=False, compare=False)
+
+    def _shard(self) -> Dict[str, float]:
+        """Çağıran thread'in sayaç shard'ını döndür (gerekirse oluştur)"""
+        shard = getattr(self._local, 'shard', None)
+        if shard is None or shard[0] != self._generation:
+            counters = dict.fromkeys(COUNTERS, 0)
+            # Gecikme histogramları da aynı shard içinde tutulur
+            counters['latency'] = {op: [0] * _HIST_SIZE for op in LATENCY_OPS}
+            counters['latency_sum'] = dict.fromkeys(LATENCY_OPS, 0.0)
+            counters['phases'] = {}
+            counters['slowest'] = []
+            counters['errors'] = []
+            with self._shard_lock:
+                shard = (self._generation, counters)
+                self._shards.append(counters)
+            self._local.shard = shard
+        return shard[1]
+
+    def notify(self) -> None:
+        """Bekleyen yayıncıyı uyandır (olay zaten kuruluysa kilit alınmaz)"""
+        if not self.changed.is_set():
+            self.changed.set()
+
+    def incr(self, **counters: float) -> None:
+        """Çağıran thread'in shard'ındaki sayaçları artır"""
+        shard = self._shard()
+        for name, value in counters.items():
+            shard[name] += value
+        self.notify()
+
+    def counters(self) -> Dict[str, float]:
+        """Tüm shard'ları toplayarak sayaçların anlık değerini döndür"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        totals = dict.fromkeys(COUNTERS, 0)
+        for shard in shards:
+            for name in COUNTERS:
+                totals[name] += shard[name]
+        return totals
+
+    def record_latency(self, op: str, seconds: float) -> None:
+        """Bir işlemin süresini histogram'a ekle"""
+        shard = self._shard()
+        shard['latency'][op][_bucket_index(seconds)] += 1
+        shard['latency_sum'][op] += seconds
+
+    @contextmanager
+    def timed(self, op: str) -> Iterator[None]:
+        """Bloğun süresini verilen işlem için ölç"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_latency(op, time.perf_counter() - start)
+
+    def add_phase(self, phase: str, seconds: float) -> None:
+        """Aşama süresine ekle (işçi aşamalarında thread süreleri toplanır)"""
+        phases = self._shard()['phases']
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Bloğun süresini verilen aşamaya ekle"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(phase, time.perf_counter() - start)
+
+    def phase_times(self) -> Dict[str, float]:
+        """Tüm shard'lardaki aşama sürelerini birleştir"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        merged: Dict[str, float] = {}
+        for shard in shards:
+            for phase, seconds in list(shard['phases'].items()):
+                merged[phase] = merged.get(phase, 0.0) + seconds
+        return merged
+
+    def format_phases(self) -> str:
+        """Aşama sürelerini formatla"""
+        phases = self.phase_times()
+        order = [p for p in PHASES if p in phases] + sorted(set(phases) - set(PHASES))
+        return ', '.join(f"{p}={phases[p]:.2f}s" for p in order) if order else '-'
+
+    def record_file_time(self, path: str, seconds: float, size: int) -> None:
+        """Dosya kopya süresini en yavaş dosyalar listesine aday olarak ekle"""
+        slowest = self._shard()['slowest']
+        if len(slowest) < SLOWEST_FILES:
+            heapq.heappush(slowest, (seconds, path, size))
+        elif seconds > slowest[0][0]:
+            heapq.heapreplace(slowest, (seconds, path, size))
+
+    def slowest_files(self, count: int = SLOWEST_FILES) -> List[Tuple[float, str, int]]:
+        """Tüm shard'lardaki en yavaş dosyaları (süre, yol, boyut) döndür"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        candidates = [entry for shard in shards for entry in list(shard['slowest'])]
+        return heapq.nlargest(count, candidates)
+
+    def record_error(self, path: str, message: str) -> None:
+        """Hatayı rapor için sakla (ilk MAX_REPORT_ERRORS kayıt)"""
+        errors = self._shard()['errors']
+        if len(errors) < MAX_REPORT_ERRORS:
+            errors.append((path, message))
+
+    def errors(self) -> List[Tuple[str, str]]:
+        """Kaydedilen hataları döndür"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        return [error for shard in shards for error in list(shard['errors'])][:MAX_REPORT_ERRORS]
+
+    def to_report(self) -> Dict[str, Any]:
+        """Çalışmanın makine tarafından okunabilir özetini oluştur"""
+        snapshot = self.snapshot()
+        return {
+            'start': self.start_time.isoformat(timespec='seconds') if self.start_time else None,
+            'end': self.end_time.isoformat(timespec='seconds') if self.end_time else None,
+            'duration': round(snapshot.duration, 3),
+            'counters': {name: snapshot.counters[name] for name in REPORT_COUNTERS},
+            'bytes_per_second': round(snapshot.average_bytes_per_second, 1),
+            'phases': {phase: round(seconds, 4) for phase, seconds in self.phase_times().items()},
+            'latencies': {op: values for op, values in snapshot.latencies.items() if values['count']},
+            'filter_hits': dict(self.filter_hits),
+            'slowest_files': [
+                {'path': path, 'seconds': round(seconds, 4), 'size': size}
+                for seconds, path, size in self.slowest_files()
+            ],
+            'errors': [{'path': path, 'message': message} for path, message in self.errors()],
+        }
+
+    def latency_buckets(self) -> Dict[str, List[int]]:
+        """Tüm shard'ların histogramlarını birleştir"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        merged = {op: [0] * _HIST_SIZE for op in LATENCY_OPS}
+        for shard in shards:
+            for op, buckets in shard['latency'].items():
+                target = merged[op]
+                for index, count in enumerate(buckets):
+                    if count:
+                        target[index] += count
+        return merged
+
+    def latency_sums(self) -> Dict[str, float]:
+        """İşlem başına toplam gecikme (saniye)"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        sums = dict.fromkeys(LATENCY_OPS, 0.0)
+        for shard in shards:
+            for op, seconds in shard['latency_sum'].items():
+                sums[op] += seconds
+        return sums
+
+    def _sample(self, now: float) -> None:
+        """Hız penceresine örnek ekle; pencereden eski örneklerden yalnızca sonuncusu kalır
+
+        Bayt hızı, yarım kalan kopyaların parçalarını da içeren
+        bytes_transferred sayacından ölçülür.
+        """
+        with self._shard_lock:
+            if now - self._last_sample < SAMPLE_INTERVAL:
+                return
+            self._last_sample = now
+            samples = self._samples
+            samples.append((now, sum(shard['files_copied'] for shard in self._shards),
+                            sum(shard['bytes_transferred'] for shard in self._shards)))
+            while len(samples) > 1 and now - samples[1][0] >= self.throughput_window:
+                samples.popleft()
+
+    def snapshot(self) -> StatsSnapshot:
+        """Anlık görüntü al; son pencere içindeki hız ve kalan süreyi hesapla
+
+        Pencere örnekleri sayaç güncellemelerinde ve sample() çağrılarında
+        eklenir; snapshot() durumu değiştirmez, böylece GUI, /metrics ve
+        yayıncı aynı hızları görür.
+        """
+        now = time.monotonic()
+        c = self.counters()
+
+        with self._shard_lock:
+            samples = list(self._samples)
+        # Pencere uzunluğu kadar eski en yeni örnek (yoksa en eskisi) taban alınır;
+        # kopyalama durunca hız bu sayede sıfıra iner
+        oldest = samples[0] if samples else (now, 0, 0)
+        for sample in samples[1:]:
+            if now - sample[0] < self.throughput_window:
+                break
+            oldest = sample
+
+        elapsed = now - oldest[0]
+        files_per_second = (c['files_copied'] - oldest[1]) / elapsed if elapsed > 0 else 0.0
+        bytes_per_second = (c['bytes_transferred'] - oldest[2]) / elapsed if elapsed > 0 else 0.0
+
+        duration = self.get_duration()
+        average = c['bytes_copied'] / duration if duration > 0 else 0.0
+
+        remaining = max(0, int(c['bytes_queued'] - c['bytes_copied'] - c['bytes_failed']))
+        eta = None
+        if self.scan_complete and self.end_time is None:
+            rate = bytes_per_second or average
+            eta = remaining / rate if rate > 0 else None
+
+        latencies = {}
+        for op, buckets in self.latency_buckets().items():
+            latencies[op] = {
+                'count': sum(buckets),
+                'p50': percentile(buckets, 0.50),
+                'p95': percentile(buckets, 0.95),
+                'p99': percentile(buckets, 0.99),
+            }
+
+        return StatsSnapshot(
+            timestamp=time.time(),
+            duration=duration,
+            counters=c,
+            files_per_second=files_per_second,
+            bytes_per_second=bytes_per_second,
+            average_bytes_per_second=average,
+            latencies=latencies,
+            remaining_bytes=remaining,
+            eta_seconds=eta,
+            scan_complete=self.scan_complete,
+            current_file=self.current_file,
+            pressure_state=self.pressure_state
+        )
+
+    def get(self, name: str) -> float:
+        """Tek bir sayacın toplam değerini döndür"""
+        with self._shard_lock:
+            shards = list(self._shards)
+        return sum(shard[name] for shard in shards)
+
     def reset(self) -> None:
         """İstatistikleri sıfırla"""
-        self.files_copied = 0
-        self.bytes_copied = 0
+        with self._shard_lock:
+            self._generation += 1
+            self._shards = []
+            self._last_sample = time.monotonic()
+            self._samples = deque([(self._last_sample, 0, 0)])
         self.current_file = ''
         self.start_time = datetime.now()
-        
+        self.end_time = None
+        self.scan_complete = False
+        self.filter_hits = {}
+        self.notify()
+
     def update(self, bytes_copied: int = 0, files_copied: int = 0, current_file: str = '') -> None:
         """İstatistikleri güncelle"""
-        self.bytes_copied += bytes_copied
-        self.files_copied += files_copied
+        shard = self._shard()
+        shard['bytes_copied'] += bytes_copied
+        shard['files_copied'] += files_copied
         self.current_file = current_file
-        
+        self.notify()
+        now = time.monotonic()
+        if now - self._last_sample >= SAMPLE_INTERVAL:
+            self._sample(now)
+
+    def advance(self, nbytes: int) -> None:
+        """Kopyalanan parçayı say; uzun tek dosya kopyasında da hız güncel kalır"""
+        self._shard()['bytes_transferred'] += nbytes
+        self.notify()
+        now = time.monotonic()
+        if now - self._last_sample >= SAMPLE_INTERVAL:
+            self._sample(now)
+
+    def sample(self) -> None:
+        """Zamanlayıcıdan örnek ekle; sayaç değişmese de hız zamanla düşer"""
+        now = time.monotonic()
+        if now - self._last_sample >= SAMPLE_INTERVAL:
+            self._sample(now)
+
+    @property
+    def running(self) -> bool:
+        """Döngü başladı ve henüz bitmedi mi"""
+        return self.start_time is not None and self.end_time is None
+
+    def record_backup(self, duration: float, success: bool = True) -> None:
+        """Yedekleme aşamasının sonucunu kaydet"""
+        shard = self._shard()
+        if success:
+            shard['files_backed_up'] += 1
+        else:
+            shard['backup_failures'] += 1
+        shard['backup_time'] += duration
+        self.notify()
+
     def complete(self) -> None:
         """Senkronizasyon tamamlandığında"""
-        self.last_sync = datetime.now()
-        
+        self.last_sync = self.end_time = datetime.now()
+        self.notify()
+
+    def finish(self) -> None:
+        """Başarısız ya da durdurulan döngünün bitişini işaretle"""
+        if self.end_time is None:
+            self.end_time = datetime.now()
+            self.notify()
+
     def format_size(self, size: int) -> str:
         """Boyutu insan okunabilir formata çevir"""
-        for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} PB"
-        
-    def format_speed(self, duration: float) -> str:
+        return format_size(size)
+
+    def format_speed(self, duration: float, bytes_copied: Optional[int] = None) -> str:
         """Transfer hızını formatla"""
         if duration <= 0:
             return "0 B/s"
-        bytes_per_second = self.bytes_copied / duration
+        if bytes_copied is None:
+            bytes_copied = self.bytes_copied
+        bytes_per_second = bytes_copied / duration
         return f"{self.format_size(bytes_per_second)}/s"
-        
+
     def get_duration(self) -> float:
         """Geçen süreyi hesapla"""
         if not self.start_time:
             return 0.0
-        end_time = self.last_sync or datetime.now()
+        end_time = self.end_time or datetime.now()
         return (end_time - self.start_time).total_seconds()
-        
+
+    def format_filter_hits(self) -> str:
+        """Filtre kurallarının eleme sayılarını formatla"""
+        hits = [f"{name}={count}" for name, count in self.filter_hits.items() if count]
+        return ', '.join(hits) if hits else '-'
+
     def get_summary(self) -> str:
         """Özet istatistik raporu oluştur"""
         duration = self.get_duration()
+        c = self.counters()
         return f"""Senkronizasyon İstatistikleri:
-- Kopyalanan Dosya: {self.files_copied}
-- Toplam Boyut: {self.format_size(self.bytes_copied)}
+- Taranan Dosya: {c['files_scanned']} (atlanan: {c['files_skipped']}, hatalı: {c['files_failed']})
+- Atlanan Soğuk Alt Ağaç: {c['subtrees_skipped']}
+- Kopyalanan Dosya: {c['files_copied']} (iptal edilen: {c['files_cancelled']})
+- Toplam Boyut: {self.format_size(c['bytes_copied'])}
+- Okunan/Yazılan: {self.format_size(c['bytes_read'])} / {self.format_size(c['bytes_written'])}
 - Süre: {duration:.1f} saniye
-- Ortalama Hız: {self.format_speed(duration)}"""
\ No newline at end of file
+- Ortalama Hız: {self.format_speed(duration, c['bytes_copied'])}
+- Yedeklenen Dosya: {c['files_backed_up']} (hata: {c['backup_failures']}, süre: {c['backup_time']:.1f} sn)
+- Filtrelenen: {self.format_filter_hits()}
+- Sistem Baskısı: duraklatma {c['pressure_pauses']}, azaltma {c['pressure_shrinks']}
+- Aşamalar: {self.format_phases()}"""
+
+
+def _counter_property(name: str) -> property:
+    return property(lambda self: self.get(name), doc=f"Toplam '{name}' sayacı")
+
+
+for _name in COUNTERS:
+    setattr(SyncStats, _name, _counter_property(_name))
+del _name
@@ -0,0 +1,282 @@
+"""
+Kaynak sınırları: işler arasında paylaşılan işçi sayısı, bant genişliği ve
+aygıt başına eşzamanlılık; saat aralığına göre bayt/s ve işlem/s sınırları;
+işçi thread'lerinin CPU ve G/Ç önceliğinin düşürülmesi
+"""
+
+import os
+import sys
+import time
+import logging
+import threading
+from dataclasses import dataclass
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .exceptions import InterruptError
+
+# Linux ioprio_set sistem çağrısı numaraları (mimariye göre)
+_IOPRIO_SET_SYSCALLS = {'x86_64': 251, 'i386': 289, 'i686': 289, 'aarch64': 30,
+                        'armv7l': 314, 'ppc64le': 273, 's390x': 282}
+_IOPRIO_WHO_PROCESS = 1
+_IOPRIO_CLASS_SHIFT = 13
+_IOPRIO_CLASS_BE = 2
+_IOPRIO_CLASS_IDLE = 3
+
+# worker_io_priority değeri -> (sınıf, seviye)
+IO_PRIORITIES = {
+    'none': None,
+    'low': (_IOPRIO_CLASS_BE, 7),
+    'idle': (_IOPRIO_CLASS_IDLE, 0),
+}
+
+
+class TokenBucket:
+    """Borçlanmalı token kovası
+
+    consume() miktarı hemen düşer; kova eksiye düşerse çağıran, borç
+    kapanana kadar bekler. Böylece kova kapasitesinden büyük istekler
+    (ör. 1 MB parça) de ortalama hızı aşmadan geçer.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = rate
+        self.capacity = burst if burst is not None else rate
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def consume(self, amount: float, stop_event: Optional[threading.Event] = None) -> float:
+        """Token harca; gerekiyorsa bekle. Beklenen süreyi döndür"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= amount
+            deficit = -self._tokens
+        if deficit <= 0:
+            return 0.0
+        delay = deficit / self.rate
+        if stop_event is not None:
+            stop_event.wait(delay)
+        else:
+            time.sleep(delay)
+        return delay
+
+
+@dataclass
+class LimitWindow:
+    """Gün içi bir saat aralığında geçerli hız sınırları (0 = sınırsız)"""
+    start: int  # gece yarısından itibaren dakika
+    end: int
+    bytes_per_second: int
+    ops_per_second: int
+
+    def contains(self, minute: int) -> bool:
+        if self.start <= self.end:
+            return self.start <= minute < self.end
+        # Gece yarısını aşan aralık (ör. 22:00-06:00)
+        return minute >= self.start or minute < self.end
+
+
+def _parse_clock(text: str) -> int:
+    hours, minutes = text.strip().split(':')
+    hours, minutes = int(hours), int(minutes)
+    if not (0 <= hours <= 24 and 0 <= minutes < 60) or hours * 60 + minutes > 24 * 60:
+        raise ValueError(f"Geçersiz saat: {text.strip()}")
+    return hours * 60 + minutes
+
+
+def parse_limit_windows(text: str) -> List[LimitWindow]:
+    """'08:00-18:00=10485760/200,18:00-22:00=52428800/0' biçimini ayrıştır
+
+    Her öğe SAAT-SAAT=BAYT_S/İŞLEM_S; aralık dışındaki saatlerde sınır yoktur.
+    """
+    windows = []
+    for item in filter(None, (part.strip() for part in text.split(','))):
+        try:
+            span, rates = item.split('=')
+            start, end = span.split('-')
+            byte_rate, op_rate = rates.split('/')
+            window = LimitWindow(_parse_clock(start), _parse_clock(end),
+                                 int(byte_rate), int(op_rate))
+        except ValueError as e:
+            raise ValueError(f"Geçersiz sınır aralığı '{item}': {str(e)}")
+        if window.bytes_per_second < 0 or window.ops_per_second < 0:
+            raise ValueError(f"Sınır aralığında negatif değer: {item}")
+        windows.append(window)
+    return windows
+
+
+class SharedLimits:
+    """Tüm işlerin kopyalama işçilerinin uyduğu ortak sınırlar"""
+
+    # Etkin saat aralığı en fazla bu sıklıkla yeniden hesaplanır (saniye)
+    WINDOW_CHECK_INTERVAL = 1.0
+    # Yuva beklerken durdurma isteğine bu sıklıkla bakılır (saniye)
+    STOP_CHECK_INTERVAL = 0.2
+
+    def __init__(self, max_workers: int = 0, bytes_per_second: int = 0, device_concurrency: int = 0,
+                 windows: Optional[List[LimitWindow]] = None):
+        self.max_workers = max_workers
+        self.device_concurrency = device_concurrency
+        self._workers = threading.BoundedSemaphore(max_workers) if max_workers > 0 else None
+        self.bandwidth = TokenBucket(bytes_per_second) if bytes_per_second > 0 else None
+        self._devices: Dict[int, threading.BoundedSemaphore] = {}
+        self._device_cache: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.windows = windows or []
+        # Aralık indeksi -> (bayt kovası, işlem kovası)
+        self._window_buckets: Dict[int, Tuple[Optional[TokenBucket], Optional[TokenBucket]]] = {
+            index: (TokenBucket(window.bytes_per_second) if window.bytes_per_second else None,
+                    TokenBucket(window.ops_per_second) if window.ops_per_second else None)
+            for index, window in enumerate(self.windows)
+        }
+        self._active_window: Optional[int] = None
+        self._window_checked = float('-inf')
+
+    @classmethod
+    def from_config(cls, config) -> Optional['SharedLimits']:
+        """Yapılandırmada sınır yoksa None döndür"""
+        windows = parse_limit_windows(config.limit_windows)
+        if not (config.global_max_threads or config.global_max_bytes_per_second or
+                config.device_max_concurrency or windows):
+            return None
+        return cls(config.global_max_threads, config.global_max_bytes_per_second,
+                   config.device_max_concurrency, windows)
+
+    def _device(self, path: str) -> int:
+        """Yolun bulunduğu aygıt numarası (klasör başına önbelleklenir)"""
+        directory = os.path.dirname(path)
+        device = self._device_cache.get(directory)
+        if device is None:
+            probe = directory
+            # Hedef klasör henüz oluşturulmamış olabilir; var olan ilk üst klasöre bak
+            while True:
+                try:
+                    device = os.stat(probe).st_dev
+                    break
+                except OSError:
+                    parent = os.path.dirname(probe)
+                    if parent == probe:
+                        device = -1
+                        break
+                    probe = parent
+            self._device_cache[directory] = device
+        return device
+
+    def _device_slot(self, device: int) -> threading.BoundedSemaphore:
+        with self._lock:
+            slot = self._devices.get(device)
+            if slot is None:
+                slot = self._devices[device] = threading.BoundedSemaphore(self.device_concurrency)
+            return slot
+
+    def _acquire(self, semaphore: threading.BoundedSemaphore,
+                 stop_event: Optional[threading.Event]) -> None:
+        """Yuvayı al; durdurma istenirse beklemeyi bırakıp InterruptError fırlat"""
+        if stop_event is None:
+            semaphore.acquire()
+            return
+        while not semaphore.acquire(timeout=self.STOP_CHECK_INTERVAL):
+            if stop_event.is_set():
+                raise InterruptError("Kopyalama işlemi kullanıcı tarafından durduruldu")
+
+    @contextmanager
+    def slot(self, *paths: str, stop_event: Optional[threading.Event] = None) -> Iterator[None]:
+        """Bir kopyalama için genel işçi ve aygıt yuvalarını al"""
+        acquired = []
+        try:
+            if self._workers is not None:
+                self._acquire(self._workers, stop_event)
+                acquired.append(self._workers)
+            if self.device_concurrency > 0:
+                # Kilitlenmeyi önlemek için aygıtlar her zaman aynı sırayla alınır
+                for device in sorted({self._device(path) for path in paths}):
+                    slot = self._device_slot(device)
+                    self._acquire(slot, stop_event)
+                    acquired.append(slot)
+            yield
+        finally:
+            for semaphore in reversed(acquired):
+                semaphore.release()
+
+    def _current_buckets(self) -> Tuple[Optional[TokenBucket], Optional[TokenBucket]]:
+        """Şu anki saat aralığının kovaları (aralık yoksa sınırsız)"""
+        if not self.windows:
+            return None, None
+        now = time.monotonic()
+        if now - self._window_checked >= self.WINDOW_CHECK_INTERVAL:
+            local = time.localtime()
+            minute = local.tm_hour * 60 + local.tm_min
+            active = next((index for index, window in enumerate(self.windows)
+                           if window.contains(minute)), None)
+            if active != self._active_window:
+                if active is None:
+                    logging.info("Saat aralığı sınırı kalktı")
+                else:
+                    window = self.windows[active]
+                    logging.info(f"Saat aralığı sınırı etkin: {window.bytes_per_second or '-'} bayt/s, "
+                                 f"{window.ops_per_second or '-'} işlem/s")
+                self._active_window = active
+            self._window_checked = now
+        if self._active_window is None:
+            return None, None
+        return self._window_buckets[self._active_window]
+
+    def throttle(self, nbytes: int, stop_event: Optional[threading.Event] = None) -> float:
+        """Genel ve saat aralığı bant genişliği sınırlarına uy; beklenen süreyi döndür"""
+        if nbytes <= 0:
+            return 0.0
+        waited = 0.0
+        if self.bandwidth is not None:
+            waited += self.bandwidth.consume(nbytes, stop_event)
+        window_bytes, _ = self._current_buckets()
+        if window_bytes is not None:
+            waited += window_bytes.consume(nbytes, stop_event)
+        return waited
+
+    def throttle_op(self, stop_event: Optional[threading.Event] = None) -> float:
+        """Dosya işlemi (kopya, yedek) başına saat aralığı işlem/s sınırına uy"""
+        _, window_ops = self._current_buckets()
+        if window_ops is None:
+            return 0.0
+        return window_ops.consume(1, stop_event)
+
+
+_priority_warned = False
+
+
+def lower_thread_priority(nice: int, io_priority: str) -> None:
+    """Çağıran thread'in CPU (nice) ve G/Ç zamanlama önceliğini düşür
+
+    Linux'ta nice ve ioprio thread başına uygulanır; böylece yalnızca kopyalama
+    işçileri etkilenir. Desteklenmeyen sistemlerde bir kez uyarı loglanır.
+    """
+    global _priority_warned
+    ioprio = IO_PRIORITIES.get(io_priority)
+    if nice <= 0 and ioprio is None:
+        return
+    try:
+        if not sys.platform.startswith('linux'):
+            # Diğer sistemlerde PRIO_PROCESS tüm süreci etkiler
+            raise OSError(f"Thread önceliği bu sistemde desteklenmiyor ({sys.platform})")
+        tid = threading.get_native_id()
+        if nice > 0:
+            os.setpriority(os.PRIO_PROCESS, tid, nice)
+        if ioprio is not None:
+            # ctypes yalnızca gerektiğinde yüklenir (başlangıç süresi)
+            import ctypes
+            import platform
+            syscall_nr = _IOPRIO_SET_SYSCALLS.get(platform.machine())
+            if syscall_nr is None:
+                raise OSError(f"ioprio_set bu mimaride desteklenmiyor ({platform.machine()})")
+            libc = ctypes.CDLL(None, use_errno=True)
+            io_class, level = ioprio
+            if libc.syscall(syscall_nr, _IOPRIO_WHO_PROCESS, tid,
+                            (io_class << _IOPRIO_CLASS_SHIFT) | level) != 0:
+                raise OSError(ctypes.get_errno(), os.strerror(ctypes.get_errno()))
+    except (AttributeError, OSError) as e:
+        if not _priority_warned:
+            _priority_warned = True
+            logging.warning(f"İşçi önceliği düşürülemedi: {str(e)}")
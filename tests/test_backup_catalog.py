@@ -0,0 +1,54 @@
+"""
+BackupCatalog: kaydedilmemiş yedeklerin yüklemede klasörle uzlaştırılması
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.backup_catalog import BackupCatalog, RetentionPolicy
+
+
+class BackupCatalogReconcileTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _backup(self, name: str, stamp: int) -> str:
+        backup_name = f"{name}{BackupCatalog.BACKUP_MARKER}{stamp}"
+        (self.dir / backup_name).write_bytes(b'x' * 10)
+        return backup_name
+
+    def test_unsaved_backups_are_pruned_after_reload(self):
+        catalog = BackupCatalog(self.dir)
+        catalog.add('a.txt', self._backup('a.txt', 1), 10, 1)
+        catalog.save()
+        # Çökme: bu yedekler diske yazıldı ama katalog kaydedilmedi
+        for stamp in (2, 3, 4):
+            catalog.add('a.txt', self._backup('a.txt', stamp), 10, stamp)
+
+        reloaded = BackupCatalog(self.dir)
+        self.assertEqual([entry['time'] for entry in reloaded.versions('a.txt')], [1, 2, 3, 4])
+
+        removed = reloaded.apply_retention('a.txt', RetentionPolicy(max_count=2), now=5)
+        self.assertEqual(len(removed), 2)
+        self.assertEqual(sorted(os.listdir(self.dir)),
+                         sorted(['.catalog.json', 'a.txt.bak.3', 'a.txt.bak.4']))
+
+    def test_entries_without_files_are_dropped(self):
+        catalog = BackupCatalog(self.dir)
+        name = self._backup('b.txt', 1)
+        catalog.add('b.txt', name, 10, 1)
+        catalog.save()
+        os.remove(self.dir / name)
+
+        self.assertEqual(BackupCatalog(self.dir).versions('b.txt'), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+"""
+BackupStore: depola -> geri yükle gidiş-dönüşü, tekilleştirme ve çöp toplama
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.backup_catalog import RetentionPolicy
+from src.backup_store import BackupStore
+
+
+class BackupStoreRoundTripTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+        # Küçük parça boyutları testin hızlı kalmasını sağlar
+        self.store = BackupStore(os.path.join(self.tmp, 'store'), min_chunk=4096,
+                                 avg_chunk=16384, max_chunk=65536)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write(self, name: str, data: bytes) -> str:
+        path = os.path.join(self.tmp, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def _read(self, path: str) -> bytes:
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def test_round_trip_content_defined_chunks(self):
+        data = os.urandom(200 * 1024)
+        path = self._write('small.bin', data)
+        manifest = self.store.add_version(path, 'small.bin')
+        self.assertGreater(len(manifest['chunks']), 1)
+
+        restored = self.store.restore('small.bin', os.path.join(self.tmp, 'out', 'small.bin'))
+        self.assertEqual(self._read(restored), data)
+        self.assertEqual(int(os.stat(restored).st_mtime), int(manifest['mtime']))
+
+    def test_inserted_bytes_reuse_chunks_in_large_file(self):
+        # Eski sabit parça sınırının (256 KB) çok üstünde; ekleme sonraki tüm
+        # baytları kaydırır
+        data = os.urandom(4 * 1024 * 1024)
+        path = self._write('large.bin', data)
+        first = self.store.add_version(path, 'large.bin')
+        changed = data[:1024 * 1024] + b'inserted' + data[1024 * 1024:]
+        self._write('large.bin', changed)
+        second = self.store.add_version(path, 'large.bin')
+
+        old_chunks = {digest for digest, _ in first['chunks']}
+        reused = sum(1 for digest, _ in second['chunks'] if digest in old_chunks)
+        self.assertGreaterEqual(reused, len(second['chunks']) - 2)
+        self.assertLess(second['stored_bytes'], first['stored_bytes'] // 20)
+
+        restored = self.store.restore('large.bin', os.path.join(self.tmp, 'large.out'))
+        self.assertEqual(self._read(restored), changed)
+
+    def test_changed_version_stores_only_new_chunks(self):
+        data = bytearray(os.urandom(200 * 1024))
+        path = self._write('doc.bin', bytes(data))
+        first = self.store.add_version(path, 'doc.bin')
+        data[100 * 1024:100 * 1024 + 16] = os.urandom(16)
+        self._write('doc.bin', bytes(data))
+        second = self.store.add_version(path, 'doc.bin')
+
+        self.assertLess(second['stored_bytes'], first['stored_bytes'])
+        old = self.store.restore('doc.bin', os.path.join(self.tmp, 'old.bin'), first['version'])
+        new = self.store.restore('doc.bin', os.path.join(self.tmp, 'new.bin'))
+        self.assertNotEqual(self._read(old), self._read(new))
+        self.assertEqual(self._read(new), bytes(data))
+
+    def test_retention_marks_and_collects_unreferenced_chunks(self):
+        self.store.GC_GRACE_SECONDS = 0
+        path = self._write('rot.bin', os.urandom(64 * 1024))
+        self.store.add_version(path, 'rot.bin')
+        self._write('rot.bin', os.urandom(64 * 1024))
+        latest = self.store.add_version(path, 'rot.bin')
+
+        self.assertEqual(self.store.apply_retention('rot.bin', RetentionPolicy(max_count=1)), 1)
+        self.assertTrue(self.store.gc_pending)
+        result = self.store.collect_garbage()
+        self.assertGreater(result['removed_chunks'], 0)
+        self.assertFalse(self.store.gc_pending)
+
+        restored = self.store.restore('rot.bin', os.path.join(self.tmp, 'rot.out'))
+        self.assertEqual(self._read(restored), self._read(path))
+        self.assertEqual(len(self.store.list_versions('rot.bin')), 1)
+        self.assertEqual(self.store.list_versions('rot.bin')[0]['version'], latest['version'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+FileSync: yapılandırma yeniden yüklenince paylaşılmayan sınırların yenilenmesi
+"""
+
+import os
+import tempfile
+import unittest
+
+from src.cli import _reload_file_sync
+from src.file_sync import FileSync
+from src.throttle import SharedLimits
+
+
+class ConfigReloadLimitsTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._cwd = os.getcwd()
+        os.chdir(self._tmp.name)
+        self.config_path = os.path.join(self._tmp.name, 'config.ini')
+
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+
+    def _write_config(self, bytes_per_second: int) -> None:
+        with open(self.config_path, 'w', encoding='utf-8') as f:
+            f.write(f"[DEFAULT]\nglobal_max_bytes_per_second = {bytes_per_second}\n")
+
+    def _file_sync(self, limits=None) -> FileSync:
+        file_sync = FileSync(self.config_path, limits=limits, managed=True)
+        self.addCleanup(file_sync.close)
+        return file_sync
+
+    def test_reload_rebuilds_limits_with_new_rate(self):
+        self._write_config(1000)
+        file_sync = self._file_sync()
+        self.assertEqual(file_sync.limits.bandwidth.rate, 1000)
+
+        self._write_config(5000)
+        _reload_file_sync(file_sync)
+        self.assertEqual(file_sync.limits.bandwidth.rate, 5000)
+
+        self._write_config(0)
+        _reload_file_sync(file_sync)
+        self.assertIsNone(file_sync.limits)
+
+    def test_reload_keeps_shared_limits(self):
+        self._write_config(1000)
+        shared = SharedLimits(bytes_per_second=200)
+        file_sync = self._file_sync(shared)
+
+        self._write_config(5000)
+        _reload_file_sync(file_sync)
+        self.assertIs(file_sync.limits, shared)
+        self.assertEqual(file_sync.limits.bandwidth.rate, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+EmailNotificationService: smtp_factory ile yerel sahte SMTP sunucusuna karşı
+oturum yeniden kullanımı ve yeniden bağlanma
+"""
+
+import smtplib
+import unittest
+
+from src.notification_service import EmailConfig, EmailNotificationService
+
+
+class FakeSMTP:
+    """smtplib.SMTP yerine geçen, gönderilenleri kaydeden sahte oturum"""
+
+    def __init__(self, server, host, port, timeout=None):
+        self.server = server
+        self.closed = False
+        server.sessions.append(self)
+
+    def login(self, username, password):
+        self.server.logins += 1
+
+    def noop(self):
+        if self.closed or self.server.drop_idle:
+            raise smtplib.SMTPServerDisconnected("bağlantı kapalı")
+        return 250, b'OK'
+
+    def send_message(self, msg):
+        if self.server.failures:
+            raise self.server.failures.pop(0)
+        self.server.sent.append((self, msg['Subject']))
+
+    def quit(self):
+        self.closed = True
+
+    def close(self):
+        self.closed = True
+
+
+class FakeServer:
+    """Oturumlar arasında paylaşılan sahte sunucu durumu"""
+
+    def __init__(self):
+        self.sessions = []
+        self.sent = []
+        self.logins = 0
+        self.failures = []
+        self.drop_idle = False
+
+    def factory(self, host, port, timeout=None):
+        return FakeSMTP(self, host, port, timeout)
+
+
+class EmailNotificationServiceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        config = EmailConfig(smtp_server='localhost', smtp_port=2525, username='u', password='p',
+                             from_email='sync@example.com', to_emails=['ops@example.com'],
+                             use_ssl=False)
+        self.service = EmailNotificationService(config, smtp_factory=self.server.factory)
+
+    def tearDown(self):
+        self.service.close()
+
+    def test_session_is_reused_between_messages(self):
+        self.assertTrue(self.service.send_notification('Bilgi 1', 'ilk'))
+        self.assertTrue(self.service.send_notification('Bilgi 2', 'ikinci'))
+        self.assertEqual(len(self.server.sessions), 1)
+        self.assertEqual(self.server.logins, 1)
+        self.assertEqual([subject for _, subject in self.server.sent], ['Bilgi 1', 'Bilgi 2'])
+
+    def test_reconnects_after_disconnect_during_send(self):
+        self.service.send_notification('Bilgi 1', 'ilk')
+        self.server.failures = [smtplib.SMTPServerDisconnected("kapandı")]
+        self.assertTrue(self.service.send_notification('Bilgi 2', 'ikinci'))
+        self.assertEqual(len(self.server.sessions), 2)
+        self.assertTrue(self.server.sessions[0].closed)
+        self.assertIs(self.server.sent[-1][0], self.server.sessions[1])
+
+    def test_idle_session_failing_noop_is_replaced(self):
+        self.service.HEALTH_CHECK_AFTER = 0
+        self.service.send_notification('Bilgi 1', 'ilk')
+        self.server.drop_idle = True
+        self.server.sessions[0].closed = True
+        self.assertTrue(self.service.send_notification('Bilgi 2', 'ikinci'))
+        self.assertEqual(len(self.server.sessions), 2)
+        self.assertEqual(len(self.server.sent), 2)
+
+    def test_transient_4xx_is_retried_once(self):
+        self.server.failures = [smtplib.SMTPDataError(451, b'gecici hata')]
+        self.assertTrue(self.service.send_notification('Bilgi', 'mesaj'))
+        self.assertEqual(len(self.server.sessions), 2)
+        self.assertEqual(len(self.server.sent), 1)
+
+    def test_permanent_rejections_are_not_retried(self):
+        for error in (smtplib.SMTPSenderRefused(550, b'reddedildi', 'sync@example.com'),
+                      smtplib.SMTPDataError(554, b'reddedildi'),
+                      smtplib.SMTPRecipientsRefused({'ops@example.com': (550, b'yok')})):
+            self.server.failures = [error]
+            self.assertFalse(self.service.send_notification('Hata', 'mesaj'))
+            self.assertEqual(self.server.failures, [])
+        # Kalıcı hata oturumu düşürmez
+        self.assertEqual(len(self.server.sessions), 1)
+        self.assertEqual(self.server.sent, [])
+
+
+if __name__ == '__main__':
+    unittest.main()